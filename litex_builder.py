@@ -7,7 +7,8 @@
 #
 # SPDX-License-Identifier: CERN-OHL-W-2.0
 
-import os, sys, argparse, importlib
+import os, sys, argparse, importlib, hashlib, json
+import amaranth
 from amaranth.back import verilog
 from migen import *
 from migen.fhdl import conv_output
@@ -30,19 +31,72 @@ def utf8_write(self, main_filename):
 
 build_dir = "litex_build"
 
-def export_verilog(export, path: str):
+# Sources the exported core is generated from, and the ones the SoC adds
+core_sources = [os.path.join("src", "main.py"), os.path.join("src", "include"), os.path.join("src", "instructions")]
+soc_sources = [os.path.join("litex_include", "driver.py"), "litex_builder.py"]
+
+# Integrated SRAM, the program runs from it
+sram_origin = 0x0000
+sram_size = 0x10000
+
+def hash_sources(config: dict, sources: list) -> str:
+    """
+    sha256 of config and of the .py files in sources, directories included.
+    """
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode())
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            files += [os.path.join(source, file) for file in os.listdir(source) if file.endswith(".py")]
+        else:
+            files.append(source)
+    for file in sorted(files):
+        digest.update(file.encode())
+        with open(file, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def is_cached(path: str, digest: str) -> bool:
+    """
+    True when path exists and was last written for digest.
+    """
+    if not os.path.exists(path) or not os.path.isfile(path + ".sha256"):
+        return False
+    with open(path + ".sha256", encoding="utf-8") as f:
+        return f.read() == digest
+
+def store_hash(path: str, digest: str):
+    with open(path + ".sha256", "w", encoding="utf-8") as f:
+        f.write(digest)
+
+def export_verilog(export, path: str, digest: str):
+    if is_cached(path, digest):
+        print(f"{path} is up to date, not exported again")
+        return
     with open(path, "w", encoding="utf-8") as f:
         f.write(verilog.convert(export, "siscf_core_top"))
+    store_hash(path, digest)
 
 
 def main():
-    wrapper = SISCFWishboneWrapper(Core(useResetVector=False, startAddr=0))
     verilog_path = os.path.join(build_dir, "verilog", "siscf_core_top.v")
     parser = argparse.ArgumentParser(description="SISC-F LiteX builder")
     
     parser.add_argument("--board", help="Set the board to build LiteX for")
+    parser.add_argument("--cpu-variant", choices=sorted(driver.SISCF_core.variants), default="standard", help="standard: one Wishbone master, harvard: separate ibus/dbus")
+    parser.add_argument("--registered-bus", action="store_true", help="Register the Wishbone outputs and inputs of the core, two more cycles per bus access for a higher fmax")
+    parser.add_argument("--icache", type=int, default=0, help="Words of instruction cache in front of the SRAM, 0 for none. The cache is LUTRAM, keep it to a few hundred words")
+    parser.add_argument("--dcache", type=int, default=0, help="Words of data cache in front of the SRAM, 0 for none, writes are still posted. LUTRAM like --icache")
+    parser.add_argument("--skip-unchanged", action="store_true", help="Do not compile the gateware again when the core and the SoC configuration did not change since the last build")
 
     args = parser.parse_args()
+
+    # Wishbone addresses are in words, LiteX regions in bytes
+    core_config = dict(useResetVector=False, startAddr=0)
+    wrapper_config = dict(burst=True, icacheSize=args.icache, dcacheSize=args.dcache, writeBuffer=4, cachedRegions=[(sram_origin >> 2, sram_size >> 2)],
+                          harvard=args.cpu_variant == "harvard", registered=args.registered_bus)
+    core_hash = hash_sources({"core": core_config, "wrapper": wrapper_config, "amaranth": amaranth.__version__}, core_sources)
+    wrapper = SISCFWishboneWrapper(Core(**core_config), **wrapper_config)
     board_lib = None
     module = None
     try:
@@ -53,39 +107,31 @@ def main():
         print(module)
         sys.exit(1)
 
-    export_verilog(wrapper, verilog_path)
+    export_verilog(wrapper, verilog_path, core_hash)
 
     conv_output.ConvOutput.write = utf8_write
 
     cpu.CPUS["siscf"] = driver.SISCF_core
 
+    soc_config = dict(
+        cpu_type             = "siscf",
+        cpu_variant          = args.cpu_variant,
+        csr_data_width       = 32,
+        csr_origin           = 0xFFFF0000,
+        csr_address_width    = 18,
+        csr_ordering         = "little",
+        integrated_sram_size = sram_size,
+        with_sdram           = False
+    )
     if args.board == "sipeed_tang_nano_20k":
-        soc = board_lib.BaseSoC(
-            with_rgb_led         = True,
-            cpu_type             = "siscf",
-            csr_data_width       = 32,
-            csr_origin           = 0xFFFF0000,
-            csr_address_width    = 18,
-            csr_ordering         = "little",
-            integrated_sram_size = 0x10000,
-            with_sdram           = False
-        )
-    else:
-        soc = board_lib.BaseSoC(
-            cpu_type             = "siscf",
-            csr_data_width       = 32,
-            csr_origin           = 0xFFFF0000,
-            csr_address_width    = 18,
-            csr_ordering         = "little",
-            integrated_sram_size = 0x10000,
-            with_sdram           = False
-        )
+        soc_config["with_rgb_led"] = True
+    soc = board_lib.BaseSoC(**soc_config)
 
     from litex.soc.integration.soc import SoCRegion
 
     soc.bus.regions["sram"] = SoCRegion(
-        origin = 0x0000,
-        size   = 0x10000,
+        origin = sram_origin,
+        size   = sram_size,
         cached = True,
         linker = True
     )
@@ -99,8 +145,17 @@ def main():
     if "main_ram" in soc.bus.regions:
         del soc.bus.regions["main_ram"]
 
-    build = Builder(soc, output_dir=build_dir, compile_gateware=True, compile_software=False)
+    # The gateware is only up to date for the same core, SoC configuration and board
+    gateware_dir = os.path.join(build_dir, "gateware")
+    soc_hash = hash_sources({"core": core_hash, "board": args.board, "soc": soc_config}, soc_sources)
+    compile_gateware = not (args.skip_unchanged and is_cached(gateware_dir, soc_hash))
+    if not compile_gateware:
+        print(f"{gateware_dir} is up to date, gateware not compiled again")
+
+    build = Builder(soc, output_dir=build_dir, compile_gateware=compile_gateware, compile_software=False)
     build.build()
+    if compile_gateware:
+        store_hash(gateware_dir, soc_hash)
 
 if __name__ == "__main__":
     if not os.path.exists(build_dir):
@@ -12,7 +12,7 @@ from litex.soc.cores.cpu import CPU
 from litex.soc.interconnect import wishbone
 
 class SISCF_core(CPU):
-    variants             = {"standard"}
+    variants             = {"standard", "harvard"}
     name                 = "siscf"
     family               = "siscf"
 
@@ -35,33 +35,52 @@ class SISCF_core(CPU):
 
     def __init__(self, platform, variant="standard"):
         self.platform = platform
+        self.variant  = variant
         self.reset    = Signal()
 
-        self.bus = wishbone.Interface(data_width=32, adr_width=32)
+        # The exported core is built with burst=True and drives cti/bte
+        if variant == "harvard":
+            # Split wrapper, fetches on ibus and data on dbus
+            self.ibus = wishbone.Interface(data_width=32, adr_width=32, bursting=True)
+            self.dbus = wishbone.Interface(data_width=32, adr_width=32, bursting=True)
+            self.buses = {"ibus": self.ibus, "dbus": self.dbus}
 
-        self.periph_buses = [self.bus]
-        self.memory_buses = [self.bus]
-        self.interrupt = Signal(32)
+            self.periph_buses = [self.ibus, self.dbus]
+            self.memory_buses = []
+        else:
+            self.bus = wishbone.Interface(data_width=32, adr_width=32, bursting=True)
+            self.buses = {"bus": self.bus}
+
+            self.periph_buses = [self.bus]
+            self.memory_buses = [self.bus]
 
-        self.idbus = self.bus
+            self.idbus = self.bus
+        self.interrupt = Signal(32)
 
     def elaborate(self, platform):
         m = Module()
+        # Map the pins to the LiteX Wishbone buses,
+        # the names match 'bus__adr', 'ibus__ack' etc. in the .v file
+        pins = {}
+        for name, bus in self.buses.items():
+            pins.update({
+                f"o_{name}__adr":   bus.adr,
+                f"o_{name}__dat_w": bus.dat_w,
+                f"i_{name}__dat_r": bus.dat_r,
+                f"o_{name}__we":    bus.we,
+                f"o_{name}__sel":   bus.sel,
+                f"o_{name}__cyc":   bus.cyc,
+                f"o_{name}__stb":   bus.stb,
+                f"i_{name}__ack":   bus.ack,
+                f"o_{name}__cti":   bus.cti,
+                f"o_{name}__bte":   bus.bte,
+            })
+
         # Instantiate the Verilog module. 
-        # Match these names to the 'bus__adr', 'bus__ack' etc. in your .v file
         siscf_instance = Instance("siscf_core_top",
             i_clk        = ClockSignal(),
             i_rst        = ResetSignal() | self.reset,
-            
-            # Map the pins to the LiteX Wishbone bus
-            o_bus__adr   = self.bus.adr,
-            o_bus__dat_w = self.bus.dat_w,
-            i_bus__dat_r = self.bus.dat_r,
-            o_bus__we    = self.bus.we,
-            o_bus__sel   = self.bus.sel,
-            o_bus__cyc   = self.bus.cyc,
-            o_bus__stb   = self.bus.stb,
-            i_bus__ack   = self.bus.ack,
+            **pins
         )
         
         m.specials += siscf_instance
@@ -0,0 +1,259 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import argparse, os, re
+from typing import Dict, Iterable, List, Optional, Tuple
+from instructions import load_modules
+import pseudo_instructions
+from include.exceptions import AssemblerError
+from include.instruction import Instruction, PseudoInstruction, assembler_inst, instruction_names, encode_reg_fields
+from include.memory import MemoryImage, save_bin, save_ihex
+
+# Every instruction module, whatever ISA profile the core is built with
+load_modules()
+
+register_address = {
+    "RA": 0xFFFFFF00,
+    "RB": 0xFFFFFF01,
+    "RX": 0xFFFFFF02,
+}
+
+_terms = re.compile(r"([+-]?)\s*([^+-]+)")
+
+class Assembler:
+    """
+    Two-pass assembler for SISC-F sources.
+
+    Syntax, one statement per line, ';' starts a comment:
+        label:  MNEMONIC operand, operand
+                .org address
+                .word value, value, ...
+                .equ name, value
+    Operands are numbers (0x, 0b, decimal), labels, .equ names, register
+    aliases (ra, rb, rx) or sums of them (label+1, end-start).
+
+    Pass 1 parses every line once, assigns label addresses and sizes every
+    statement, pass 2 replays the parsed statements and emits words. Real
+    instructions are padded with NOP up to Instruction.length, instructions with
+    an asmOverride and pseudo-instructions emit through this object.
+    """
+    def __init__(self, *, memDepth: int = 2**16):
+        self.memDepth = memDepth
+        self.symbols: Dict[str, int] = {}
+        self.image = MemoryImage(depth=memDepth)
+        self.addr = 0
+        self.line = 0
+        self.final = False
+        self._run: List[int] = []
+        self._runAddr = 0
+        self._nop = instruction_names["NOP"].opcode
+
+    def error(self, message: str):
+        raise AssemblerError(self.line, message)
+
+    def emit(self, *words: int):
+        if self.final:
+            self._write([word & 0xFFFFFFFF for word in words])
+        else:
+            self.addr += len(words)
+
+    def _write(self, words: List[int]):
+        # Consecutive words are collected in a run and stored in one go
+        if self._runAddr + len(self._run) != self.addr:
+            self._flush()
+        self._run += words
+        self.addr += len(words)
+
+    def _flush(self):
+        if self._run:
+            self.image.store(self._runAddr, self._run)
+        self._run = []
+        self._runAddr = self.addr
+
+    def value(self, operand: str) -> int:
+        """
+        Evaluates an operand. Unknown symbols are 0 during pass 1 and an error in pass 2.
+        """
+        symbol = self.symbols.get(operand)
+        if symbol != None:
+            return symbol
+        operand = operand.strip()
+        try:
+            return int(operand, 0) & 0xFFFFFFFF
+        except ValueError:
+            pass
+        reg = register_address.get(operand.upper())
+        if reg != None:
+            return reg
+
+        total = 0
+        for sign, term in _terms.findall(operand):
+            if sign == "-":
+                total -= self._term(term.strip())
+            else:
+                total += self._term(term.strip())
+        return total & 0xFFFFFFFF
+
+    def _term(self, term: str) -> int:
+        symbol = self.symbols.get(term)
+        if symbol != None:
+            return symbol
+        try:
+            return int(term, 0)
+        except ValueError:
+            pass
+        if not term.replace("_", "").replace(".", "").isalnum():
+            self.error(f"Cannot evaluate '{term}'")
+        if self.final:
+            self.error(f"Undefined symbol '{term}'")
+        return 0
+
+    def register(self, operand: str) -> str:
+        """
+        Returns the register letter (A, B or X) used in instruction names, e.g. PUSHA.
+        """
+        reg = operand.strip().upper()
+        if reg not in register_address:
+            self.error(f"'{operand}' is not a register")
+        return reg[1]
+
+    def instruction(self, name: str, parameters: List[str]):
+        """
+        Assembles one instruction or pseudo-instruction, used by pseudo-instructions to expand.
+        """
+        inst = assembler_inst.get(name)
+        if inst == None:
+            inst = assembler_inst.get(name.upper())
+            if inst == None:
+                self.error(f"Unknown instruction '{name}'")
+
+        if isinstance(inst, PseudoInstruction):
+            inst.execute(self, parameters)
+            return
+        if inst.asmOverride(self, parameters):
+            return
+
+        if len(parameters) > inst.length - 1 + inst.regFields:
+            self.error(f"{inst.name} takes at most {inst.length - 1 + inst.regFields} operands, got {len(parameters)}")
+        if not self.final:
+            # Plain instructions are sized by their length, operands only matter in pass 2
+            self.addr += inst.length
+            return
+        self.encode(inst, parameters)
+
+    def encode(self, inst: Instruction, parameters: List[str]):
+        value = self.value
+        if inst.regFields:
+            if len(parameters) < inst.regFields:
+                self.error(f"{inst.name} takes {inst.regFields} register operands, got {len(parameters)}")
+            registers = ["ABX".index(self.register(parameter)) for parameter in parameters[:inst.regFields]]
+            words = [encode_reg_fields(inst.opcode, registers)] + [value(parameter) for parameter in parameters[inst.regFields:]]
+        else:
+            words = [inst.opcode] + [value(parameter) for parameter in parameters]
+        if len(words) < 1 + inst.operandWords:
+            self.error(f"{inst.name} takes {inst.regFields + inst.operandWords} operands, got {len(parameters)}")
+        words += [self._nop] * (inst.length - len(words))
+        self._write(words)
+
+    def directive(self, name: str, parameters: List[str]):
+        if name == ".ORG":
+            if len(parameters) != 1:
+                self.error(".org takes one address")
+            self.addr = self.value(parameters[0])
+        elif name == ".WORD":
+            if self.final:
+                self.emit(*[self.value(p) for p in parameters])
+            else:
+                self.addr += len(parameters)
+        elif name == ".EQU":
+            if len(parameters) != 2:
+                self.error(".equ takes a name and a value")
+            self.symbols[parameters[0].strip()] = self.value(parameters[1])
+        else:
+            self.error(f"Unknown directive '{name}'")
+
+    def _parse(self, lines: Iterable[str]) -> List[Tuple[int, int, str | Instruction, List[str]]]:
+        """
+        Pass 1: defines labels and returns the statements to replay in pass 2.
+        """
+        statements = []
+        symbols = self.symbols
+        for self.line, text in enumerate(lines, 1):
+            comment = text.find(";")
+            if comment >= 0:
+                text = text[:comment]
+            text = text.strip()
+            while ":" in text:
+                label, sep, rest = text.partition(":")
+                label = label.strip()
+                if not sep or not label.replace(".", "_").isidentifier():
+                    break
+                if label in symbols:
+                    self.error(f"Label '{label}' is already defined")
+                symbols[label] = self.addr
+                text = rest.strip()
+            if not text:
+                continue
+
+            parts = text.split(None, 1)
+            name = parts[0].upper()
+            parameters = [p.strip() for p in parts[1].split(",")] if len(parts) > 1 else []
+            if name[0] == ".":
+                statements.append((self.line, self.addr, name, parameters))
+                self.directive(name, parameters)
+                continue
+            # Plain instructions are stored resolved so pass 2 can encode them directly
+            inst = assembler_inst.get(name)
+            if isinstance(inst, Instruction) and inst._asmFunc == None:
+                if len(parameters) >= inst.length + inst.regFields:
+                    self.error(f"{inst.name} takes at most {inst.length - 1 + inst.regFields} operands, got {len(parameters)}")
+                statements.append((self.line, self.addr, inst, parameters))
+                self.addr += inst.length
+            else:
+                statements.append((self.line, self.addr, name, parameters))
+                self.instruction(name, parameters)
+        return statements
+
+    def assemble(self, lines: Iterable[str]) -> MemoryImage:
+        """
+        Assembles source lines (an open file streams them) and returns the program image.
+        """
+        self.final = False
+        self.addr = 0
+        statements = self._parse(lines)
+
+        self.final = True
+        self.addr = 0
+        for self.line, self.addr, name, parameters in statements:
+            if isinstance(name, Instruction):
+                self.encode(name, parameters)
+            elif name[0] == ".":
+                self.directive(name, parameters)
+            else:
+                self.instruction(name, parameters)
+        self._flush()
+        return self.image
+
+def assemble(source: str, *, memDepth: int = 2**16) -> MemoryImage:
+    return Assembler(memDepth=memDepth).assemble(source.splitlines())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SISC-F assembler")
+    parser.add_argument("source", help="Assembly source file")
+    parser.add_argument("-o", "--output", required=True, help="Output image, Intel HEX if it ends in .hex/.ihex, raw binary otherwise")
+    parser.add_argument("--depth", type=lambda x: int(x, 0), default=2**16, help="Memory depth in words")
+    args = parser.parse_args()
+
+    with open(args.source, "r") as f:
+        image = Assembler(memDepth=args.depth).assemble(f)
+
+    if os.path.splitext(args.output)[1].lower() in (".hex", ".ihex"):
+        save_ihex(image, args.output)
+    else:
+        save_bin(image, args.output)
@@ -0,0 +1,500 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import argparse, csv, json, os, re, shlex, shutil, subprocess, sys, tempfile, time, traceback, warnings
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from amaranth import Elaboratable, Module, Signal
+from amaranth.back import rtlil
+from amaranth.sim import Simulator
+from assembler import assemble
+from instructions import PROFILES
+from instructions.MAC import TILE
+from include.enums import MulMode
+from include.isasim import ISASimulator
+from include.cosim import LockstepCoSim, random_program
+from include.memory import MemoryImage
+from main import Core
+
+# Core keyword arguments of every configuration. Configurations with a
+# "wrapper" entry run behind SISCFWishboneWrapper and a WishboneMemory with
+# "latency" wait states, the rest use the memory of Core.
+CONFIGS = {
+    "base": {},
+    "pipeline": {"usePipeline": True},
+    "dual-port": {"useDualPort": True},
+    "pipeline-dual-port": {"usePipeline": True, "useDualPort": True},
+    "registered-read": {"useRegisteredRead": True},
+    "minimal-isa": {"isa": "minimal"},
+    "stack-isa": {"isa": "stack"},
+    "mul-iterative": {"multiplier": MulMode.ITERATIVE},
+    "perf-counters": {"usePerfCounters": True},
+    "wishbone": {"wrapper": {}, "latency": 1},
+    "wishbone-cached": {"wrapper": {"burst": True, "icacheSize": 64, "dcacheSize": 64}, "latency": 1},
+    "wishbone-registered": {"wrapper": {"registered": True}, "latency": 1},
+}
+
+MATMUL_N = 8
+
+def matmul_source(variant: str, n: int = MATMUL_N) -> str:
+    """
+    Assembly of C = A * B for n x n matrices, n a multiple of TILE. variant "sw"
+    unrolls LDB/MULB/ADD for every product, "dot" runs one DOT per C word on
+    rows of A and of B stored transposed, "tile" chains TMAC over 4 x 4 tiles.
+    """
+    a = [[(i + 2 * j) % 9 - 3 for j in range(n)] for i in range(n)]
+    b = [[(3 * i + j) % 7 - 2 for j in range(n)] for i in range(n)]
+    code = []
+    for i in range(n):
+        for j in range(n):
+            if variant == "sw":
+                code.append("LDX_ABS 0")
+                for k in range(n):
+                    code += [f"LDB a+{i * n + k}", f"MULB b+{k * n + j}", "ADD rx, rb"]
+                code.append(f"STX c+{i * n + j}")
+            elif variant == "dot":
+                code += ["MCLR", f"LDA_ABS a+{i * n}", f"LDB_ABS bt+{j * n}", f"LDX_ABS {n}", "DOT", "MGET ra", f"STA c+{i * n + j}"]
+    if variant == "tile":
+        for i in range(0, n, TILE):
+            for j in range(0, n, TILE):
+                code += [f"LDA_ABS a+{i * n}", f"LDB_ABS b+{j}", f"LDX_ABS c+{i * n + j}"] + [f"TMAC {n}"] * (n // TILE)
+    words = lambda rows: ", ".join(str(value) for row in rows for value in row)
+    return "\n".join([".org 0x9", ".word start", ".org 0x20", "start:"] + code + ["HALT",
+        f"a: .word {words(a)}", f"b: .word {words(b)}", f"bt: .word {words(zip(*b))}", f"c: .word {words([[0] * n] * n)}"]) + "\n"
+
+BRIGHTEN_WORDS = 16
+
+def brighten_source(packed: bool, words: int = BRIGHTEN_WORDS) -> str:
+    """
+    Assembly adding 40 to each byte of words packed words, saturating at 255.
+    Byte by byte each byte is moved to the top of rx, where the add carries out
+    when it overflows, with packed one PADDSB does a whole word.
+    """
+    code = ["LDB_ABS 0x28282828"] if packed else []
+    for word in range(words):
+        code.append(f"LDA pix+{word}")
+        if packed:
+            code += ["PADDSB ra, rb", f"STA out+{word}"]
+            continue
+        code.append("LDB_ABS 0")
+        for byte in range(4):
+            shift = 24 - 8 * byte
+            code += ["XOR rx, rx", "OR rx, ra"] + ([f"SHL_ABS rx, {shift}"] if shift else [])
+            code += ["AND_ABS rx, 0xFF000000", "ADDX_ABS 0x28000000", f"JNC b{word}_{byte}", "LDX_ABS 0xFF000000", f"b{word}_{byte}:"]
+            code += ([f"SHR_ABS rx, {shift}"] if shift else []) + ["OR rb, rx"]
+        code.append(f"STB out+{word}")
+    pixels = [sum(((4 * word + byte) * 37 % 256) << (8 * byte) for byte in range(4)) for word in range(words)]
+    return "\n".join([".org 0x9", ".word start", ".org 0x20", "start:"] + code + ["HALT",
+        f"pix: .word {', '.join(hex(word) for word in pixels)}", f"out: .word {', '.join(['0'] * words)}"]) + "\n"
+
+# Benchmark programs and the ISA profile they need
+PROGRAMS = {
+    "loop": ("minimal", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 0
+        LDB_ABS 100
+loop:   ADDA_ABS 3
+        DECB
+        JNZ loop
+        STA result
+        HALT
+result: .word 0
+"""),
+    "memory": ("minimal", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDX_ABS 50
+loop:   LDA a
+        ADDA b
+        STA b
+        SUBA a
+        STA a
+        DECX
+        JNZ loop
+        HALT
+a:      .word 1
+b:      .word 1
+"""),
+    # 50 steps of the memory Fibonacci loop, two per iteration in registers
+    "registers": ("minimal", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 1
+        LDB_ABS 1
+        LDX_ABS 25
+loop:   ADD ra, rb
+        ADD rb, ra
+        DECX
+        JNZ loop
+        HALT
+"""),
+    "calls": ("stack", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDB_ABS 40
+loop:   PUSHB
+        CALL square
+        POPB
+        DECB
+        JNZ loop
+        HALT
+square: PUSHA
+        ADDA_ABS 1
+        POPA
+        RET
+"""),
+    # Bitwise CRC32 of the words 16 down to 1, SHR moves the low bit into the carry
+    "crc32": ("full", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 0xFFFFFFFF
+        LDB_ABS 16
+word:   XOR ra, rb
+        LDX_ABS 32
+bit:    SHR_ABS ra, 1
+        JNC next
+        XOR_ABS ra, 0xEDB88320
+next:   DECX
+        JNZ bit
+        DECB
+        JNZ word
+        NOT ra
+        HALT
+"""),
+    # Same CRC32 on the hash unit, streaming the words from memory
+    "crc32_hw": ("full", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 0xFFFFFFFF
+        HSET ra
+        LDX_ABS buf
+        LDB_ABS 16
+        CRC32S rb
+        HGET ra
+        NOT ra
+        HALT
+buf:    .word 16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1
+"""),
+    "multiply": ("full", """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 1
+        LDB_ABS 30
+loop:   MULA_ABS 3
+        DECB
+        JNZ loop
+        HALT
+"""),
+    # Saturating add on 64 bytes, one byte at a time and four at a time
+    "brighten_sw": ("full", brighten_source(False)),
+    "brighten_packed": ("full", brighten_source(True)),
+    # 8 x 8 matrix product in software, with DOT and with TMAC
+    "matmul_sw": ("full", matmul_source("sw")),
+    "matmul_dot": ("full", matmul_source("dot")),
+    "matmul_tile": ("full", matmul_source("tile")),
+    "random": ("minimal", None),
+}
+
+SIM_DEPTH = 2**16
+
+# Cell types counted in each resource column, matched against yosys cell names of
+# --family generic ($_*_ gates) and of synth_gowin/synth_ice40/synth_ecp5
+RESOURCES = {
+    "luts": re.compile(r"^(LUT\d|SB_LUT4|TRELLIS_SLICE|\$_(AND|OR|XOR|XNOR|NAND|NOR|ANDNOT|ORNOT|MUX|NMUX|NOT|AOI3|OAI3|AOI4|OAI4)_)$"),
+    "ffs": re.compile(r"^(DFF\w*|SB_DFF\w*|TRELLIS_FF|\$_S?DFFE?_\w+|\$_DFFSRE?_\w+|\$_ALDFFE?_\w+)$"),
+    "brams": re.compile(r"^(SPX?9?|SDPX?9?B|DPX?9?B|pROM|SB_RAM40_4K|DP16KD|PDPW16KD|\$mem_v2)$"),
+    "lutrams": re.compile(r"^(RAM16S\w*|TRELLIS_DPR16X4)$"),
+    "dsps": re.compile(r"^(MULT\w*|SB_MAC16|MULT18X18D|\$mul)$"),
+}
+
+# Levels added by a combinational cell for the fmax estimate. Unlisted cells count one level,
+# carry chain cells and wide multiplexer stages only a fraction of one.
+LEVEL_WEIGHTS = [
+    (re.compile(r"^(ALU|SB_CARRY|CCU2C)$"), 0.1),
+    (re.compile(r"^(MUX2_LUT\d|\$_MUX_)$"), 0.3),
+    (re.compile(r"^(\$add|\$sub|\$neg|\$eq|\$ne|\$lt|\$le|\$gt|\$ge)$"), None),
+]
+
+# Cells whose outputs start a path and whose inputs end it
+SEQUENTIAL = re.compile(r"^(\$_?\w*DFF\w*|\$dlatch|\$mem\w*|DFF\w*|SB_DFF\w*|TRELLIS_FF|SPX?9?|SDPX?9?B|DPX?9?B|pROM|RAM16S\w*|SB_RAM40_4K|DP16KD|PDPW16KD|\w*BUF|MULT\w*|SB_MAC16|MULT18X18D)$")
+
+class BenchmarkTop(Elaboratable):
+    """
+    Synthesis top: the configuration and a register folding its architectural
+    state, kept so yosys cannot remove the core. clk and rst are the only ports.
+    """
+    def __init__(self, config: dict, memDepth: int):
+        config = dict(config)
+        wrapper = config.pop("wrapper", None)
+        latency = config.pop("latency", 0)
+        program = MemoryImage({0x9: 0x20}, depth=memDepth)
+        if wrapper == None:
+            self.core = Core(useMemory=True, mem_init=program, memDepth=memDepth, **config)
+            self.cpu = None
+        else:
+            from include.wishbone import SISCFWishboneWrapper, WishboneMemory
+            self.core = Core(**config)
+            self.cpu = SISCFWishboneWrapper(self.core, **wrapper)
+            self.ram = WishboneMemory(program, latency=latency, burst=wrapper.get("burst", False), pipelined=wrapper.get("pipelined", False), harvard=wrapper.get("harvard", False))
+        self.fold = Signal(8, attrs={"keep": 1})
+
+    def elaborate(self, platform) -> Module:
+        m = Module()
+        core = self.core
+        if self.cpu == None:
+            m.submodules.core = core
+        else:
+            from amaranth.lib import wiring
+            m.submodules.cpu = self.cpu
+            m.submodules.ram = self.ram
+            if self.cpu.harvard:
+                wiring.connect(m, self.cpu.ibus, self.ram.ibus)
+                wiring.connect(m, self.cpu.dbus, self.ram.dbus)
+            else:
+                wiring.connect(m, self.cpu.bus, self.ram.bus)
+
+        state = Signal(32)
+        m.d.comb += state.eq(core.ra ^ core.rb ^ core.rx ^ core.ip ^ core.sp ^ core.flags)
+        m.d.sync += self.fold.eq(state[0:8] ^ state[8:16] ^ state[16:24] ^ state[24:32])
+        return m
+
+def program_image(name: str, isa: str) -> Optional[MemoryImage]:
+    """
+    Image of a benchmark program, None if it needs instructions outside isa.
+    """
+    profile, source = PROGRAMS[name]
+    if not set(PROFILES[profile]) <= set(PROFILES[isa]):
+        return None
+    if source == None:
+        return MemoryImage(random_program(1, 300, isa=isa), depth=SIM_DEPTH)
+    return assemble(source, memDepth=SIM_DEPTH)
+
+def simulate(config: dict, image: MemoryImage) -> Dict[str, int]:
+    """
+    Runs image on the configuration against the ISA model, returns its cycle counts.
+    """
+    config = dict(config)
+    wrapper = config.pop("wrapper", None)
+    latency = config.pop("latency", 0)
+    m = Module()
+    model = ISASimulator(mem_init=image, memDepth=SIM_DEPTH, usePerfCounters=config.get("usePerfCounters", False), usePipeline=config.get("usePipeline", False),
+                         useDualPort=config.get("useDualPort", False), multiplier=config.get("multiplier", MulMode.SINGLE), isa=config.get("isa", "full"))
+    if wrapper == None:
+        m.submodules.core = core = Core(useMemory=True, mem_init=image, memDepth=SIM_DEPTH, **config)
+    else:
+        from amaranth.lib import wiring
+        from include.wishbone import SISCFWishboneWrapper, WishboneMemory
+        core = Core(**config)
+        m.submodules.cpu = cpu = SISCFWishboneWrapper(core, **wrapper)
+        m.submodules.ram = ram = WishboneMemory(image, latency=latency, burst=wrapper.get("burst", False), pipelined=wrapper.get("pipelined", False), harvard=wrapper.get("harvard", False))
+        if cpu.harvard:
+            wiring.connect(m, cpu.ibus, ram.ibus)
+            wiring.connect(m, cpu.dbus, ram.dbus)
+        else:
+            wiring.connect(m, cpu.bus, ram.bus)
+        # Without useMemory Core does not reset sp
+        model.sp = 0
+
+    sim = Simulator(m)
+    sim.add_clock(1e-6)
+    cosim = LockstepCoSim(core, model, max_cycles=200000)
+    sim.add_testbench(cosim.testbench)
+    sim.run()
+    if not model.halted:
+        raise RuntimeError(f"Program did not halt in {cosim.max_cycles} cycles")
+    return {"cycles": cosim.cycles, "retired": cosim.retired, "stalls": cosim.stalls}
+
+def yosys_script(family: str) -> str:
+    if family == "generic":
+        # No synth, abc or techmap: generic gates only
+        return "hierarchy -top top\nproc\nflatten\nopt\nmemory_collect\nwreduce\nopt_clean\nsimplemap\nopt\nwrite_json /dev/stdout\n"
+    return f"synth_{family} -top top -json /dev/stdout\n"
+
+def yosys_command(yosys: Optional[str]) -> str:
+    """
+    yosys, else $YOSYS, else yosys or yowasp-yosys from PATH.
+    """
+    if yosys == None:
+        yosys = os.environ.get("YOSYS") or shutil.which("yosys") or shutil.which("yowasp-yosys")
+    if yosys == None:
+        raise RuntimeError("No yosys found, pass --yosys or set YOSYS")
+    return yosys
+
+def run_yosys(text: str, yosys: Optional[str], family: str) -> dict:
+    """
+    Synthesises RTLIL text and returns the yosys JSON netlist. yosys is a command
+    (e.g. yosys or yowasp-yosys), None looks it up with yosys_command.
+    """
+    script = f"read_rtlil <<rtlil\n{text}\nrtlil\n" + yosys_script(family)
+    # Relative paths only, so WebAssembly builds of yosys work too
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "top.ys"), "w") as f:
+            f.write(script.replace("/dev/stdout", "top.json"))
+        subprocess.run(shlex.split(yosys_command(yosys)) + ["-q", "top.ys"], cwd=tmp, check=True, stdout=subprocess.DEVNULL)
+        with open(os.path.join(tmp, "top.json")) as f:
+            return json.loads(f.read())
+
+def cell_weight(cell: dict) -> float:
+    for pattern, weight in LEVEL_WEIGHTS:
+        if pattern.match(cell["type"]):
+            if weight == None:
+                return 1 + 0.1 * int(cell["parameters"].get("Y_WIDTH", "1"), 2)
+            return weight
+    return 1
+
+def logic_levels(module: dict) -> float:
+    """
+    Longest weighted combinational path between sequential cells and ports.
+    """
+    drivers = {}
+    for cell in module["cells"].values():
+        if SEQUENTIAL.match(cell["type"]):
+            continue
+        for port, direction in cell["port_directions"].items():
+            if direction == "output":
+                for bit in cell["connections"][port]:
+                    drivers[bit] = cell
+
+    arrival = {}
+    cell_arrival = {}
+    longest = 0
+    for start in drivers:
+        stack = [drivers[start]]
+        while stack:
+            cell = stack[-1]
+            if id(cell) in cell_arrival:
+                stack.pop()
+                continue
+            inputs = [drivers[bit] for port, direction in cell["port_directions"].items() if direction == "input"
+                      for bit in cell["connections"][port] if bit in drivers]
+            pending = [c for c in inputs if id(c) not in cell_arrival]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            cell_arrival[id(cell)] = cell_weight(cell) + max((cell_arrival[id(c)] for c in inputs), default=0)
+            longest = max(longest, cell_arrival[id(cell)])
+    return longest
+
+def resources(netlist: dict) -> Dict[str, int]:
+    cells = Counter(cell["type"] for module in netlist["modules"].values() for cell in module["cells"].values())
+    counts = {column: sum(n for cell, n in cells.items() if pattern.match(cell)) for column, pattern in RESOURCES.items()}
+    counts["cells"] = sum(cells.values())
+    return counts
+
+def run_nextpnr(netlist: dict, nextpnr: str, device: str, nextpnrArgs: str, cst: Optional[str]) -> Optional[float]:
+    """
+    Places and routes the netlist, returns the post-route fmax in MHz.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "top.json"), "w") as f:
+            json.dump(netlist, f)
+        args = shlex.split(nextpnr) + ["--json", "top.json", "--device", device] + shlex.split(nextpnrArgs)
+        if cst != None:
+            shutil.copy(cst, os.path.join(tmp, "top.cst"))
+            args += ["--vopt", "cst=top.cst"]
+        result = subprocess.run(args, cwd=tmp, capture_output=True, text=True)
+    found = re.findall(r"Max frequency for clock\s+'[^']*':\s+([\d.]+) MHz", result.stderr + result.stdout)
+    # The last report is the post-route one
+    return float(found[-1]) if found else None
+
+def benchmark(name: str, args: argparse.Namespace) -> dict:
+    """
+    Synthesises and simulates one configuration, runs in a worker process.
+    """
+    warnings.simplefilter("ignore")
+    config = CONFIGS[name]
+    row = {"config": name}
+    errors = []
+    try:
+        start = time.perf_counter()
+        netlist = run_yosys(rtlil.convert(BenchmarkTop(config, args.mem_depth), ports=[]), args.yosys, args.family)
+        row.update(resources(netlist))
+        row["logic_levels"] = round(logic_levels(netlist["modules"]["top"]), 1)
+        row["fmax_est"] = round(1000 / (row["logic_levels"] * args.ns_per_level + args.ns_overhead), 2)
+        if args.nextpnr != None:
+            row["fmax"] = run_nextpnr(netlist, args.nextpnr, args.device, args.nextpnr_args, args.cst)
+        row["synth_seconds"] = round(time.perf_counter() - start, 1)
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+        if args.verbose:
+            traceback.print_exc()
+
+    isa = config.get("isa", "full")
+    for program in args.programs:
+        image = program_image(program, isa)
+        if image == None:
+            continue
+        try:
+            result = simulate(config, image)
+            row[f"{program}_cycles"] = result["cycles"]
+            row[f"{program}_cpi"] = round(result["cycles"] / result["retired"], 3)
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            if args.verbose:
+                traceback.print_exc()
+    if errors:
+        row["error"] = "; ".join(dict.fromkeys(errors))
+    return row
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SISC-F area, fmax and CPI benchmark")
+    parser.add_argument("configs", nargs="*", default=list(CONFIGS), help=f"Configurations to run, from: {', '.join(CONFIGS)}")
+    parser.add_argument("--programs", nargs="+", choices=list(PROGRAMS), default=list(PROGRAMS), help="Programs to simulate for cycle counts")
+    parser.add_argument("--yosys", default=None, help="yosys command (e.g. yosys, yowasp-yosys), defaults to $YOSYS or the first one on PATH")
+    parser.add_argument("--family", default="gowin", help="FPGA family of the synth_<family> pass, generic only maps to yosys gates")
+    parser.add_argument("--nextpnr", default=None, help="nextpnr command (e.g. nextpnr-himbaechel) to place and route the netlist for the post-route fmax")
+    parser.add_argument("--device", default="GW2AR-LV18QN88C8/I7", help="Device passed to nextpnr")
+    parser.add_argument("--nextpnr-args", default="--vopt family=GW2A-18C --freq 27", help="Extra nextpnr arguments")
+    parser.add_argument("--cst", default=None, help="Constraint file placing the clk and rst pins, passed to nextpnr")
+    parser.add_argument("--mem-depth", type=lambda x: int(x, 0), default=1024, help="Words of memory in the synthesised configurations")
+    parser.add_argument("--ns-per-level", type=float, default=0.75, help="Delay of one logic level in the fmax estimate")
+    parser.add_argument("--ns-overhead", type=float, default=3.5, help="Clock-to-out, setup and routing delay added to the fmax estimate")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Configurations run in parallel")
+    parser.add_argument("--json", default=None, help="Write the table as JSON")
+    parser.add_argument("--csv", default=None, help="Write the table as CSV")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print the traceback of failed configurations")
+    args = parser.parse_args()
+
+    for name in args.configs:
+        if CONFIGS.get(name) == None:
+            parser.error(f"unknown configuration {name}, the configurations are {', '.join(CONFIGS)}")
+
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        rows = list(pool.map(benchmark, args.configs, [args] * len(args.configs)))
+
+    columns = list(dict.fromkeys(column for row in rows for column in row))
+    if "error" in columns:
+        columns.append(columns.pop(columns.index("error")))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    widths = {column: max(len(column), *(len(str(row.get(column, ""))) for row in rows)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(str(row.get(column, "")).ljust(widths[column]) for column in columns))
+
+    if "error" in columns:
+        sys.exit(1)
@@ -0,0 +1,219 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import argparse, itertools, sys
+from typing import Callable, Iterator, List, Optional, Tuple
+from instructions import load_modules
+from include.instruction import Instruction, instruction_opcodes, instruction_names, OPCODE_BITS, OPCODE_MASK, REG_FIELD_BITS, REGISTERS, reg_field
+from include.memory import PAGE_BITS, MemoryImage, load_image
+
+# Every instruction module, whatever ISA profile the core is built with
+load_modules()
+
+register_names = {
+    0xFFFFFF00: "ra",
+    0xFFFFFF01: "rb",
+    0xFFFFFF02: "rx",
+}
+
+def build_decode_table() -> List[Optional[Instruction]]:
+    """
+    Dense opcode -> Instruction table, indexed by the OPCODE_BITS opcode field.
+    """
+    table: List[Optional[Instruction]] = [None] * (1 << OPCODE_BITS)
+    for opcode, inst in instruction_opcodes.items():
+        table[opcode] = inst
+    return table
+
+decode_table = build_decode_table()
+_nop = instruction_names["NOP"].opcode
+
+def decode(word: int) -> Optional[Instruction]:
+    """
+    Instruction Core executes for word, which only looks at the opcode field.
+    """
+    return decode_table[word & OPCODE_MASK]
+
+def encodable(word: int) -> Optional[Instruction]:
+    """
+    Instruction of word if the assembler can rebuild word from its listing: no bits
+    set above the opcode field and its register fields, no register field 3.
+    """
+    inst = decode_table[word & OPCODE_MASK]
+    if inst == None or word >> (OPCODE_BITS + REG_FIELD_BITS * inst.regFields):
+        return None
+    if any(reg_field(word, index) >= len(REGISTERS) for index in range(inst.regFields)):
+        return None
+    return inst
+
+def format_instruction(inst: Instruction, operands: List[int], word: Optional[int] = None) -> str:
+    # Trailing NOP words after the operands are the assembler padding up to Instruction.length
+    operands, padding = operands[:inst.operandWords], operands[inst.operandWords:]
+    while padding and padding[-1] == _nop:
+        padding = padding[:-1]
+    operands += padding
+    # A register field 3 only shows up in traces, the listing writes such words as .word
+    fields = [reg_field(word, index) for index in range(inst.regFields)] if word != None else []
+    names = [REGISTERS[field] if field < len(REGISTERS) else str(field) for field in fields]
+    names += [register_names.get(op, f"0x{op:08X}") for op in operands]
+    if not names:
+        return inst.name
+    return inst.name + " " + ", ".join(names)
+
+def disassemble_at(read: Callable[[int], int], addr: int) -> Tuple[str, int]:
+    """
+    Returns the text of the instruction at addr and the number of words it takes.
+    Words that are not an opcode become .word, like Core they would execute as NOP.
+    So do words with bits set above the opcode and register fields, the assembler
+    could not rebuild them from the listing.
+    """
+    word = read(addr)
+    inst = encodable(word)
+    if inst == None:
+        return f".word 0x{word:08X}", 1
+    return format_instruction(inst, [read(addr + i) for i in range(1, inst.length)], word), inst.length
+
+def disassemble(image: MemoryImage, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+    """
+    Yields (address, length, text) for every instruction in the allocated pages
+    of image, skipping runs of fill words.
+    """
+    if end == None:
+        end = image.depth
+    read = image.__getitem__
+    fill = image.fill
+    for index in sorted(image.pages):
+        addr = max(start, index << PAGE_BITS)
+        stop = min(end, (index + 1) << PAGE_BITS)
+        while addr < stop:
+            if read(addr) == fill:
+                addr += 1
+                continue
+            text, length = disassemble_at(read, addr)
+            yield addr, length, text
+            addr += length
+
+def listing(image: MemoryImage, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Source that assembles back to image, with an .org before every gap.
+    """
+    next_addr = None
+    for addr, length, text in disassemble(image, start, end):
+        if addr != next_addr:
+            yield f"        .org 0x{addr:08X}"
+        yield f"        {text:<40}; 0x{addr:08X}"
+        next_addr = addr + length
+
+class _VCDSignal:
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0
+
+def trace_retire(path: str, scope: str = "core") -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Streams a VCD written by the simulation (see main.py) and yields
+    (fetch cycle, retire cycle, address, instruction word) for every retired
+    instruction. The word is rebuilt from opcode and operand_fields, which hold
+    the register fields of the instruction being executed.
+    Signals are sampled on the rising edge of clk, retirement is
+    end_instr_flag once the reset sequence is over and an instruction starts on
+    the cycle after the previous end_instr_flag, pipelined or not.
+    """
+    wanted = ("clk", "reset_state", "ip", "opcode", "operand_fields", "end_instr_flag")
+    signals = {}
+    scopes = []
+    with open(path, "r") as f:
+        for line in f:
+            if line.startswith("$scope"):
+                scopes.append(line.split()[2])
+            elif line.startswith("$upscope"):
+                scopes.pop()
+            elif line.startswith("$var"):
+                _, _, _, ident, name = line.split()[:5]
+                # Only the first declaration, the same signal may show up again in submodules
+                if scopes and scopes[-1] == scope and name in wanted and name not in [s.name for s in signals.values()]:
+                    signals[ident] = _VCDSignal(name)
+            elif line.startswith("$enddefinitions"):
+                break
+
+        missing = set(wanted) - {s.name for s in signals.values()}
+        if missing:
+            raise ValueError(f"{path} has no {', '.join(sorted(missing))} in scope {scope}")
+        by_name = {s.name: s for s in signals.values()}
+        clk = by_name["clk"]
+        reset_state = by_name["reset_state"]
+        ip = by_name["ip"]
+        opcode = by_name["opcode"]
+        operand_fields = by_name["operand_fields"]
+        end_instr_flag = by_name["end_instr_flag"]
+
+        cycle = 0
+        fetch = None
+        starting = False
+        pending = []
+        # The extra timestamp flushes the last timestep
+        for line in itertools.chain(f, ["#\n"]):
+            c = line[0]
+            if c == "#":
+                # A rising edge samples the values committed before its timestep
+                if any(sig is clk and value and not clk.value for sig, value in pending):
+                    if starting:
+                        fetch = (cycle, ip.value)
+                    starting = end_instr_flag.value
+                    if reset_state.value == 2 and end_instr_flag.value and fetch != None:
+                        yield fetch[0], cycle, fetch[1], opcode.value | (operand_fields.value << OPCODE_BITS)
+                        fetch = None
+                    cycle += 1
+                for sig, value in pending:
+                    sig.value = value
+                pending = []
+            elif c == "b":
+                value, ident = line[1:].split()
+                sig = signals.get(ident)
+                if sig != None:
+                    pending.append((sig, int(value, 2) if "x" not in value else 0))
+            elif c in "01":
+                sig = signals.get(line[1:].strip())
+                if sig != None:
+                    pending.append((sig, int(c)))
+
+
+def retire_log(path: str, image: Optional[MemoryImage] = None, scope: str = "core") -> Iterator[str]:
+    """
+    Formats trace_retire. Operands are only known when the program image is given.
+    """
+    read = image.__getitem__ if image != None else None
+    for fetch_cycle, cycle, addr, word in trace_retire(path, scope):
+        if read != None:
+            text, _ = disassemble_at(read, addr)
+        else:
+            inst = decode(word)
+            text = format_instruction(inst, [], word) if inst != None else f".word 0x{word:08X}"
+        yield f"{fetch_cycle:>10} {cycle:>10}  0x{addr:08X}  {text}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SISC-F disassembler and trace decoder")
+    parser.add_argument("image", nargs="?", help="Program image (.bin, Intel HEX or ELF) to disassemble")
+    parser.add_argument("--trace", help="VCD written by the simulation, prints the instruction retire log")
+    parser.add_argument("--start", type=lambda x: int(x, 0), default=0, help="First word address to disassemble")
+    parser.add_argument("--end", type=lambda x: int(x, 0), default=None, help="Word address to stop disassembling at")
+    parser.add_argument("--depth", type=lambda x: int(x, 0), default=2**16, help="Memory depth in words")
+    args = parser.parse_args()
+
+    image = load_image(args.image, depth=args.depth) if args.image else None
+    if args.trace:
+        lines = retire_log(args.trace, image)
+    elif image != None:
+        lines = listing(image, args.start, args.end)
+    else:
+        parser.error("Give an image to disassemble or a --trace to decode")
+
+    out = sys.stdout
+    for line in lines:
+        out.write(line + "\n")
@@ -0,0 +1,605 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from typing import List, Optional, Tuple
+from amaranth import Signal, Module, Elaboratable, Memory, Mux, Cat, Const, Array
+from amaranth.build import Platform
+from include.enums import CacheOps
+
+CTI_CLASSIC = 0b000
+CTI_INCR_BURST = 0b010
+CTI_END_OF_BURST = 0b111
+
+def _log2(value: int, name: str) -> int:
+    if value <= 0 or value & (value - 1):
+        raise ValueError(f"{name} must be a power of two, not {value}")
+    return value.bit_length() - 1
+
+def _cacheable(regions: Optional[List[Tuple[int, int]]], addr: Signal):
+    if regions == None:
+        return Const(1)
+    hit = Const(0)
+    for origin, size in regions:
+        hit = hit | ((addr >= origin) & (addr < origin + size))
+    return hit
+
+class ICache(Elaboratable):
+    """
+    Read-only instruction cache of size words, ways ways of lineWords-word lines,
+    used by SISCFWishboneWrapper.
+    A fetch that hits is answered in the same cycle with no bus cycle, a miss
+    refills the whole line from the bus (one incrementing burst, or back to back
+    requests in pipelined mode) while the core stalls. Writes go to the bus and
+    update the word if it is cached. Only fetches inside cachedRegions,
+    [(origin, size)], are cached, None caches everything.
+    A refill only starts while bus_free. invalidate drops every line, one set
+    per cycle, invalidated is high once it is done until invalidate is released.
+    hits counts the cycles a fetch was served, misses the refilled lines.
+    Tags and lines are read asynchronously, so they map to LUTRAM rather than
+    block RAM and size has to fit the distributed RAM of the device.
+    """
+    def __init__(self, size: int = 64, lineWords: int = 4, ways: int = 1, *, cachedRegions: Optional[List[Tuple[int, int]]] = None, pipelined: bool = False):
+        offset_bits = _log2(lineWords, "lineWords")
+        _log2(ways, "ways")
+        _log2(size, "size")
+        if size < lineWords * ways:
+            raise ValueError(f"A {size} word cache cannot hold {ways} ways of {lineWords} word lines")
+
+        self.size = size
+        self.lineWords = lineWords
+        self.ways = ways
+        self.sets = size // (lineWords * ways)
+        self.cachedRegions = cachedRegions
+        self.pipelined = pipelined
+
+        self.offset_bits = offset_bits
+        self.index_bits = _log2(self.sets, "sets")
+        self.tag_bits = 32 - self.offset_bits - self.index_bits
+
+        # Core side
+        self.addr = Signal(32)
+        self.fetch = Signal()   # Instruction read this cycle
+        self.write = Signal()   # Write of write_data to addr completes this cycle
+        self.write_data = Signal(32)
+        self.lookup = Signal()  # fetch is cacheable, the bus must not see it
+        self.hit = Signal()     # lookup is answered from the cache, data is valid
+        self.data = Signal(32)
+        self.refill = Signal()  # The cache owns the bus
+
+        # Bus side, only used while refill
+        self.bus_adr = Signal(32)
+        self.bus_stb = Signal()
+        self.bus_cti = Signal(3)
+        self.bus_ack = Signal()
+        self.bus_stall = Signal()
+        self.bus_dat_r = Signal(32)
+        self.bus_free = Signal()
+
+        self.invalidate = Signal()
+        self.invalidated = Signal()
+
+        self.hits = Signal(32)
+        self.misses = Signal(32)
+
+        self.tag_mem = [Memory(width=self.tag_bits + 1, depth=self.sets, init=[]) for _ in range(ways)]
+        self.data_mem = [Memory(width=32, depth=self.sets * lineWords, init=[]) for _ in range(ways)]
+
+    def elaborate(self, platform: Platform) -> Module:
+        m = Module()
+
+        offset = self.addr[:self.offset_bits]
+        index = self.addr[self.offset_bits:self.offset_bits + self.index_bits]
+        tag = self.addr[self.offset_bits + self.index_bits:]
+
+        # Line being refilled
+        refill_index = Signal(self.index_bits)
+        refill_tag = Signal(self.tag_bits)
+        refill_way = Signal(range(self.ways))
+        issued = Signal(range(self.lineWords + 1))
+        acked = Signal(range(self.lineWords + 1))
+        victim = Signal(range(self.ways))
+        # Set being invalidated
+        walk = Signal(range(self.sets + 1))
+
+        cached = Signal()
+        m.d.comb += cached.eq(_cacheable(self.cachedRegions, self.addr))
+
+        way_hit = Signal(self.ways)
+        for way in range(self.ways):
+            tag_read = self.tag_mem[way].read_port(domain="comb")
+            tag_write = self.tag_mem[way].write_port()
+            data_read = self.data_mem[way].read_port(domain="comb")
+            data_write = self.data_mem[way].write_port()
+            m.submodules[f"tag_{way}"] = self.tag_mem[way]
+            m.submodules[f"data_{way}"] = self.data_mem[way]
+
+            m.d.comb += [
+                tag_read.addr.eq(index),
+                data_read.addr.eq(Cat(offset, index)),
+                way_hit[way].eq(tag_read.data[-1] & (tag_read.data[:-1] == tag)),
+                tag_write.addr.eq(refill_index),
+                tag_write.data.eq(Cat(refill_tag, Const(1, 1))),
+            ]
+            with m.If(way_hit[way]):
+                m.d.comb += self.data.eq(data_read.data)
+
+            with m.If(self.refill):
+                m.d.comb += [
+                    data_write.addr.eq(Cat(acked[:self.offset_bits], refill_index)),
+                    data_write.data.eq(self.bus_dat_r),
+                    data_write.en.eq(self.bus_ack & (refill_way == way))
+                ]
+                with m.If(self.bus_ack & (acked == self.lineWords - 1) & (refill_way == way)):
+                    m.d.comb += tag_write.en.eq(1)
+            with m.Elif(self.invalidate & (walk != self.sets)):
+                m.d.comb += [
+                    tag_write.addr.eq(walk),
+                    tag_write.data.eq(0),
+                    tag_write.en.eq(1)
+                ]
+            with m.Else():
+                # Write-through, the cached copy follows the bus
+                m.d.comb += [
+                    data_write.addr.eq(Cat(offset, index)),
+                    data_write.data.eq(self.write_data),
+                    data_write.en.eq(self.write & way_hit[way])
+                ]
+
+        m.d.comb += [
+            self.lookup.eq(self.fetch & cached),
+            self.hit.eq(self.lookup & way_hit.any() & ~self.refill)
+        ]
+
+        with m.If(self.refill):
+            if self.pipelined:
+                m.d.comb += [
+                    self.bus_adr.eq(Cat(issued[:self.offset_bits], refill_index, refill_tag)),
+                    self.bus_stb.eq(issued != self.lineWords)
+                ]
+                with m.If(self.bus_stb & ~self.bus_stall):
+                    m.d.sync += issued.eq(issued + 1)
+            else:
+                m.d.comb += [
+                    self.bus_adr.eq(Cat(acked[:self.offset_bits], refill_index, refill_tag)),
+                    self.bus_stb.eq(1),
+                    self.bus_cti.eq(Mux(acked == self.lineWords - 1, CTI_END_OF_BURST, CTI_INCR_BURST))
+                ]
+            with m.If(self.bus_ack):
+                m.d.sync += acked.eq(acked + 1)
+                with m.If(acked == self.lineWords - 1):
+                    m.d.sync += self.refill.eq(0)
+        with m.Elif(self.lookup & ~way_hit.any() & self.bus_free):
+            m.d.sync += [
+                self.refill.eq(1),
+                refill_index.eq(index),
+                refill_tag.eq(tag),
+                refill_way.eq(victim),
+                victim.eq(victim + 1),
+                issued.eq(0),
+                acked.eq(0),
+                self.misses.eq(self.misses + 1)
+            ]
+
+        with m.If(self.hit):
+            m.d.sync += self.hits.eq(self.hits + 1)
+
+        m.d.comb += self.invalidated.eq(walk == self.sets)
+        with m.If(~self.invalidate):
+            m.d.sync += walk.eq(0)
+        with m.Elif(walk != self.sets):
+            m.d.sync += walk.eq(walk + 1)
+
+        return m
+
+# DCache transfers on the bus
+_XFER_NONE = 0
+_XFER_LINE = 1  # Line refill
+_XFER_READ = 2  # Uncached read of the core
+_XFER_WRITE = 3 # Head of the write buffer
+
+# DCache states
+_IDLE = 0
+_EVICT = 1  # Dirty line to the write buffer
+_REFILL = 2
+_FLUSH = 3  # Walking every line for cache_op
+_DONE = 4
+
+class DCache(Elaboratable):
+    """
+    Write-back, write-allocate data cache of size words (ways ways of
+    lineWords-word lines) with a writeBuffer-entry posted write buffer, used by
+    SISCFWishboneWrapper for every access ICache does not serve.
+    Accesses inside cachedRegions ([(origin, size)], None for all of them) that
+    hit complete in the same cycle. A miss moves a dirty victim line to the
+    write buffer, then refills the line while the core stalls. Other writes, or
+    every write with size 0, are posted to the buffer and complete at once
+    unless it is full. Reads outside cachedRegions wait for the buffer to
+    drain, reads inside only for buffered writes to the same word (line).
+    cache_op FLUSH writes back every dirty line and drains the buffer,
+    INVALIDATE also drops every line; done is high once it is over until
+    cache_op goes back to NONE.
+    hits counts the accesses served by the cache, misses the refilled lines.
+    Like ICache the arrays are read asynchronously and map to LUTRAM.
+    """
+    def __init__(self, size: int = 64, lineWords: int = 4, ways: int = 1, writeBuffer: int = 4, *, cachedRegions: Optional[List[Tuple[int, int]]] = None, pipelined: bool = False):
+        self.buffer_bits = _log2(writeBuffer, "writeBuffer")
+        offset_bits = _log2(lineWords, "lineWords")
+        _log2(ways, "ways")
+        if size != 0:
+            _log2(size, "size")
+            if size < lineWords * ways:
+                raise ValueError(f"A {size} word cache cannot hold {ways} ways of {lineWords} word lines")
+            if writeBuffer < lineWords:
+                raise ValueError(f"A {writeBuffer} entry write buffer cannot hold a {lineWords} word line")
+
+        self.size = size
+        self.lineWords = lineWords
+        self.ways = ways
+        self.writeBuffer = writeBuffer
+        self.sets = size // (lineWords * ways)
+        self.cachedRegions = cachedRegions
+        self.pipelined = pipelined
+
+        self.offset_bits = offset_bits
+        self.index_bits = _log2(self.sets, "sets") if size != 0 else 0
+        self.tag_bits = 32 - self.offset_bits - self.index_bits
+
+        # Core side
+        self.addr = Signal(32)
+        self.access = Signal()  # Read or write this cycle
+        self.we = Signal()
+        self.write_data = Signal(32)
+        self.ready = Signal()   # The access completes this cycle, data is valid
+        self.data = Signal(32)
+        self.cache_op = Signal(CacheOps)
+        self.done = Signal()
+
+        # Bus side, stb low when there is nothing to transfer
+        self.bus_adr = Signal(32)
+        self.bus_dat_w = Signal(32)
+        self.bus_we = Signal()
+        self.bus_stb = Signal()
+        self.bus_cti = Signal(3)
+        self.bus_ack = Signal()
+        self.bus_stall = Signal()
+        self.bus_dat_r = Signal(32)
+        self.bus_grant = Signal() # A transfer may start
+        self.idle = Signal()      # No transfer and the write buffer is empty
+
+        self.hits = Signal(32)
+        self.misses = Signal(32)
+
+        # Tags are stored with a valid and a dirty bit
+        self.tag_mem = [Memory(width=self.tag_bits + 2, depth=self.sets, init=[]) for _ in range(ways)] if size != 0 else []
+        self.data_mem = [Memory(width=32, depth=self.sets * lineWords, init=[]) for _ in range(ways)] if size != 0 else []
+
+    def elaborate(self, platform: Platform) -> Module:
+        m = Module()
+
+        offset = self.addr[:self.offset_bits]
+        index = self.addr[self.offset_bits:self.offset_bits + self.index_bits]
+        tag = self.addr[self.offset_bits + self.index_bits:]
+        valid_bit = self.tag_bits
+        dirty_bit = self.tag_bits + 1
+
+        cached = Signal()
+        m.d.comb += cached.eq(_cacheable(self.cachedRegions, self.addr))
+
+        # Write buffer, a FIFO of (address, data)
+        buf_adr = Array(Signal(32, name=f"wbuf_adr_{i}") for i in range(self.writeBuffer))
+        buf_dat = Array(Signal(32, name=f"wbuf_dat_{i}") for i in range(self.writeBuffer))
+        head = Signal(self.buffer_bits)
+        count = Signal(range(self.writeBuffer + 1))
+        tail = Signal(self.buffer_bits)
+        full = Signal()
+        push = Signal()
+        push_adr = Signal(32)
+        push_dat = Signal(32)
+        pop = Signal()
+        # A buffered write hits the word, the line of addr
+        word_match = Signal()
+        line_match = Signal()
+
+        m.d.comb += [
+            tail.eq(head + count),
+            full.eq(count == self.writeBuffer)
+        ]
+        with m.If(push):
+            m.d.sync += [
+                buf_adr[tail].eq(push_adr),
+                buf_dat[tail].eq(push_dat)
+            ]
+        with m.If(pop):
+            m.d.sync += head.eq(head + 1)
+        m.d.sync += count.eq(count + push - pop)
+
+        for i in range(self.writeBuffer):
+            age = Signal(self.buffer_bits, name=f"wbuf_age_{i}")
+            m.d.comb += age.eq(i - head)
+            with m.If(age < count):
+                with m.If(buf_adr[i] == self.addr):
+                    m.d.comb += word_match.eq(1)
+                with m.If(buf_adr[i][self.offset_bits:] == self.addr[self.offset_bits:]):
+                    m.d.comb += line_match.eq(1)
+
+        # Bus transfer, reads and writes start in the cycle they are requested
+        xfer = Signal(2)
+        xfer_adr = Signal(32)
+        kind = Signal(2)
+        base = Signal(32)
+        issued = Signal(range(self.lineWords + 1))
+        acked = Signal(range(self.lineWords + 1))
+        words = Signal(range(self.lineWords + 1))
+        last = Signal()
+        can_start = Signal()
+        start_line = Signal()
+        start_read = Signal()
+
+        m.d.comb += [
+            kind.eq(xfer),
+            base.eq(xfer_adr),
+            can_start.eq((xfer == _XFER_NONE) & self.bus_grant),
+            self.idle.eq((xfer == _XFER_NONE) & (count == 0))
+        ]
+        with m.If(can_start):
+            with m.If(start_line):
+                m.d.sync += [
+                    xfer.eq(_XFER_LINE),
+                    xfer_adr.eq(Cat(Const(0, self.offset_bits), self.addr[self.offset_bits:]))
+                ]
+            with m.Elif(start_read):
+                m.d.comb += [
+                    kind.eq(_XFER_READ),
+                    base.eq(self.addr)
+                ]
+            with m.Elif(count != 0):
+                m.d.comb += [
+                    kind.eq(_XFER_WRITE),
+                    base.eq(buf_adr[head])
+                ]
+
+        m.d.comb += [
+            words.eq(Mux(kind == _XFER_LINE, self.lineWords, 1)),
+            last.eq(acked == words - 1)
+        ]
+        with m.If(kind != _XFER_NONE):
+            m.d.comb += [
+                self.bus_we.eq(kind == _XFER_WRITE),
+                self.bus_dat_w.eq(buf_dat[head])
+            ]
+            m.d.sync += [
+                xfer.eq(kind),
+                xfer_adr.eq(base)
+            ]
+            if self.pipelined:
+                m.d.comb += [
+                    self.bus_adr.eq(base + issued),
+                    self.bus_stb.eq(issued != words)
+                ]
+                with m.If(self.bus_stb & ~self.bus_stall):
+                    m.d.sync += issued.eq(issued + 1)
+            else:
+                m.d.comb += [
+                    self.bus_adr.eq(base + acked),
+                    self.bus_stb.eq(1)
+                ]
+                with m.If(kind == _XFER_LINE):
+                    m.d.comb += self.bus_cti.eq(Mux(last, CTI_END_OF_BURST, CTI_INCR_BURST))
+            with m.If(self.bus_ack):
+                m.d.sync += acked.eq(acked + 1)
+                with m.If(last):
+                    m.d.sync += [
+                        xfer.eq(_XFER_NONE),
+                        issued.eq(0),
+                        acked.eq(0)
+                    ]
+                with m.If(kind == _XFER_WRITE):
+                    m.d.comb += pop.eq(1)
+                with m.If(kind == _XFER_READ):
+                    m.d.comb += [
+                        self.ready.eq(1),
+                        self.data.eq(self.bus_dat_r)
+                    ]
+
+        state = Signal(range(_DONE + 1))
+
+        if self.size == 0:
+            with m.Switch(state):
+                with m.Case(_IDLE):
+                    with m.If(self.cache_op != CacheOps.NONE):
+                        with m.If(self.idle):
+                            m.d.sync += state.eq(_DONE)
+                    with m.Elif(self.access & self.we):
+                        with m.If(~full):
+                            m.d.comb += [
+                                push.eq(1),
+                                push_adr.eq(self.addr),
+                                push_dat.eq(self.write_data),
+                                self.ready.eq(1)
+                            ]
+                    with m.Elif(self.access):
+                        m.d.comb += start_read.eq(~Mux(cached, word_match, count != 0))
+                with m.Case(_DONE):
+                    m.d.comb += self.done.eq(1)
+                    with m.If(self.cache_op == CacheOps.NONE):
+                        m.d.sync += state.eq(_IDLE)
+            return m
+
+        way_bits = _log2(self.ways, "ways")
+
+        # Line refilled, or written back by _EVICT
+        line_index = Signal(self.index_bits)
+        line_tag = Signal(self.tag_bits)
+        line_way = Signal(range(self.ways))
+        evict_word = Signal(self.offset_bits)
+        flushing = Signal()
+        victim = Signal(range(self.ways))
+        # Line _FLUSH is at, the way in the low bits
+        walk = Signal(range(self.sets * self.ways + 1))
+        walk_way = walk[:way_bits]
+        walk_index = walk[way_bits:way_bits + self.index_bits]
+
+        way_hit = Signal(self.ways)
+        hit_data = Signal(32)
+        victim_tag = Signal(self.tag_bits + 2)
+        walk_tag = Signal(self.tag_bits + 2)
+        evict_data = Signal(32)
+        tag_writes = []
+        data_writes = []
+        for way in range(self.ways):
+            tag_read = self.tag_mem[way].read_port(domain="comb")
+            tag_write = self.tag_mem[way].write_port()
+            data_read = self.data_mem[way].read_port(domain="comb")
+            data_write = self.data_mem[way].write_port()
+            m.submodules[f"tag_{way}"] = self.tag_mem[way]
+            m.submodules[f"data_{way}"] = self.data_mem[way]
+            tag_writes.append(tag_write)
+            data_writes.append(data_write)
+
+            with m.Switch(state):
+                with m.Case(_EVICT):
+                    m.d.comb += [
+                        tag_read.addr.eq(line_index),
+                        data_read.addr.eq(Cat(evict_word, line_index))
+                    ]
+                with m.Case(_FLUSH):
+                    m.d.comb += tag_read.addr.eq(walk_index)
+                with m.Default():
+                    m.d.comb += [
+                        tag_read.addr.eq(index),
+                        data_read.addr.eq(Cat(offset, index))
+                    ]
+            m.d.comb += way_hit[way].eq(tag_read.data[valid_bit] & (tag_read.data[:self.tag_bits] == tag))
+            with m.If(way_hit[way]):
+                m.d.comb += hit_data.eq(data_read.data)
+            with m.If(victim == way):
+                m.d.comb += victim_tag.eq(tag_read.data)
+            with m.If(walk_way == way):
+                m.d.comb += walk_tag.eq(tag_read.data)
+            with m.If(line_way == way):
+                m.d.comb += evict_data.eq(data_read.data)
+
+            # Refill
+            with m.If((xfer == _XFER_LINE) & self.bus_ack & (line_way == way)):
+                m.d.comb += [
+                    data_write.addr.eq(Cat(acked[:self.offset_bits], line_index)),
+                    data_write.data.eq(self.bus_dat_r),
+                    data_write.en.eq(1)
+                ]
+                with m.If(last):
+                    m.d.comb += [
+                        tag_write.addr.eq(line_index),
+                        tag_write.data.eq(Cat(line_tag, Const(1, 1), Const(0, 1))),
+                        tag_write.en.eq(1)
+                    ]
+
+        with m.Switch(state):
+            with m.Case(_IDLE):
+                with m.If(self.cache_op != CacheOps.NONE):
+                    m.d.sync += [
+                        state.eq(_FLUSH),
+                        walk.eq(0)
+                    ]
+                with m.Elif(self.access & cached & way_hit.any()):
+                    m.d.comb += [
+                        self.ready.eq(1),
+                        self.data.eq(hit_data)
+                    ]
+                    m.d.sync += self.hits.eq(self.hits + 1)
+                    with m.If(self.we):
+                        for way in range(self.ways):
+                            with m.If(way_hit[way]):
+                                m.d.comb += [
+                                    data_writes[way].addr.eq(Cat(offset, index)),
+                                    data_writes[way].data.eq(self.write_data),
+                                    data_writes[way].en.eq(1),
+                                    tag_writes[way].addr.eq(index),
+                                    tag_writes[way].data.eq(Cat(tag, Const(1, 1), Const(1, 1))),
+                                    tag_writes[way].en.eq(1)
+                                ]
+                with m.Elif(self.access & cached):
+                    with m.If(victim_tag[valid_bit] & victim_tag[dirty_bit]):
+                        m.d.sync += [
+                            state.eq(_EVICT),
+                            line_index.eq(index),
+                            line_tag.eq(victim_tag[:self.tag_bits]),
+                            line_way.eq(victim),
+                            evict_word.eq(0),
+                            flushing.eq(0)
+                        ]
+                    with m.Elif(~line_match):
+                        m.d.comb += start_line.eq(1)
+                        with m.If(can_start):
+                            m.d.sync += [
+                                state.eq(_REFILL),
+                                line_index.eq(index),
+                                line_tag.eq(tag),
+                                line_way.eq(victim),
+                                victim.eq(victim + 1),
+                                self.misses.eq(self.misses + 1)
+                            ]
+                with m.Elif(self.access & self.we):
+                    with m.If(~full):
+                        m.d.comb += [
+                            push.eq(1),
+                            push_adr.eq(self.addr),
+                            push_dat.eq(self.write_data),
+                            self.ready.eq(1)
+                        ]
+                with m.Elif(self.access):
+                    m.d.comb += start_read.eq(count == 0)
+            with m.Case(_EVICT):
+                with m.If(~full):
+                    m.d.comb += [
+                        push.eq(1),
+                        push_adr.eq(Cat(evict_word, line_index, line_tag)),
+                        push_dat.eq(evict_data)
+                    ]
+                    m.d.sync += evict_word.eq(evict_word + 1)
+                    with m.If(evict_word == self.lineWords - 1):
+                        for way in range(self.ways):
+                            with m.If(line_way == way):
+                                m.d.comb += [
+                                    tag_writes[way].addr.eq(line_index),
+                                    tag_writes[way].data.eq(Cat(line_tag, Const(1, 1), Const(0, 1))),
+                                    tag_writes[way].en.eq(1)
+                                ]
+                        m.d.sync += state.eq(Mux(flushing, _FLUSH, _IDLE))
+            with m.Case(_REFILL):
+                with m.If((xfer == _XFER_LINE) & self.bus_ack & last):
+                    m.d.sync += state.eq(_IDLE)
+            with m.Case(_FLUSH):
+                with m.If(walk == self.sets * self.ways):
+                    with m.If(self.idle):
+                        m.d.sync += state.eq(_DONE)
+                with m.Elif(walk_tag[valid_bit] & walk_tag[dirty_bit]):
+                    m.d.sync += [
+                        state.eq(_EVICT),
+                        line_index.eq(walk_index),
+                        line_tag.eq(walk_tag[:self.tag_bits]),
+                        line_way.eq(walk_way),
+                        evict_word.eq(0),
+                        flushing.eq(1)
+                    ]
+                with m.Else():
+                    with m.If(self.cache_op == CacheOps.INVALIDATE):
+                        for way in range(self.ways):
+                            with m.If(walk_way == way):
+                                m.d.comb += [
+                                    tag_writes[way].addr.eq(walk_index),
+                                    tag_writes[way].data.eq(0),
+                                    tag_writes[way].en.eq(1)
+                                ]
+                    m.d.sync += walk.eq(walk + 1)
+            with m.Case(_DONE):
+                m.d.comb += self.done.eq(1)
+                with m.If(self.cache_op == CacheOps.NONE):
+                    m.d.sync += state.eq(_IDLE)
+
+        return m
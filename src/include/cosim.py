@@ -0,0 +1,158 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import random
+from typing import Dict, Iterable, Optional
+from amaranth.sim import SimulatorContext
+from include.enums import *
+from include.exceptions import CoSimDivergence
+from include.instruction import instruction_names, encode_reg_fields, REGISTERS
+from instructions import isa_subset, load_modules
+from include.isasim import ISASimulator, MASK32
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+
+class LockstepCoSim:
+    """
+    Steps an Amaranth simulation of Core and an ISASimulator in lockstep.
+    Every time the core retires an instruction (end_instr_flag) the model executes
+    one instruction and the architectural state, the memory writes and the cycle
+    count are compared. The first mismatch raises CoSimDivergence.
+    Cycles where core.stall is high are counted in stalls and left out of the
+    comparison, the model never waits for the bus.
+    Add testbench to the Simulator with add_testbench.
+    """
+    def __init__(self, core: "Core", model: ISASimulator, max_cycles: int = 100000):
+        self.core = core
+        self.model = model
+        self.max_cycles = max_cycles
+        self.cycles = 0
+        self.stalls = 0
+        self.retired = 0
+
+    def _compare(self, field: str, rtl: int, model: int, ip: int):
+        if rtl != model:
+            raise CoSimDivergence(self.retired, ip, field, f"0x{rtl:08X}", f"0x{model:08X}")
+
+    def check(self, ctx: SimulatorContext, writes: list):
+        core = self.core
+        model = self.model
+        ip = model.ip
+        model.step()
+        self.retired += 1
+
+        for field in ("ra", "rb", "rx", "ip", "sp", "flags"):
+            self._compare(field, ctx.get(getattr(core, field)) & MASK32, getattr(model, field), ip)
+        self._compare("hash", ctx.get(core.hash.value), model.hash_state, ip)
+        self._compare("mac", ctx.get(core.mac.value), model.mac_acc, ip)
+        if writes != model.writes:
+            raise CoSimDivergence(self.retired, ip, "memory writes", writes, model.writes)
+        if self.cycles - self.stalls != model.cycles:
+            raise CoSimDivergence(self.retired, ip, "cycle count", self.cycles - self.stalls, model.cycles)
+        if core.usePerfCounters:
+            self._compare("perf_cycles", ctx.get(core.perf_cycles), (model.cycles + self.stalls) & MASK32, ip)
+            self._compare("perf_stall", ctx.get(core.perf_stall), self.stalls & MASK32, ip)
+            self._compare("perf_retired", ctx.get(core.perf_retired), model.retired & MASK32, ip)
+            self._compare("perf_stack", ctx.get(core.perf_stack), model.stack_ops & MASK32, ip)
+            for opcode, counter in core.perf_opcode.items():
+                self._compare(counter.name, ctx.get(counter), model.opcode_retired.get(opcode, 0), ip)
+
+    async def testbench(self, ctx: SimulatorContext):
+        core = self.core
+        mask = self.model.memDepth - 1
+        writes = []
+        # The model starts after reset, which takes as many cycles as it accounts for.
+        self.cycles = 0
+        self.stalls = 0
+        while self.cycles < self.max_cycles:
+            stalled = ctx.get(core.stall)
+            if not stalled and not ctx.get(core.RW):
+                writes.append((ctx.get(core.addr) & mask, ctx.get(core.data_out) & MASK32))
+            retire = not stalled and ctx.get(core.reset_state) == 2 and ctx.get(core.end_instr_flag)
+            await ctx.tick()
+            self.cycles += 1
+            if stalled:
+                self.stalls += 1
+            if retire:
+                self.check(ctx, writes)
+                writes = []
+                if self.model.halted:
+                    return
+
+def random_program(seed: int = 0, count: int = 1000, codeAddr: int = 0x0020, dataAddr: int = 0x8000, dataSize: int = 0x100, usePerfCounters: bool = False, isa: str | Iterable[str] = "full") -> Dict[int, int]:
+    """
+    Generates a random straight-line program ending in HALT, with forward
+    conditional jumps only, so it always terminates.
+    With usePerfCounters MOV also reads the performance counters.
+    Only instructions of isa are used.
+    Returns a memory dict including the reset vector at 0x0009.
+    """
+    rng = random.Random(seed)
+    subset = {inst.name for inst in isa_subset(isa).values()}
+    if usePerfCounters:
+        load_modules(("MOV",))
+    regs = [0xFFFFFF00, 0xFFFFFF01, 0xFFFFFF02]
+    sources = regs + ([PerfCounter.CYCLES, PerfCounter.RETIRED, PerfCounter.STALL, PerfCounter.STACK,
+                       PerfCounter.OPCODE + instruction_names["MOV"].opcode, PerfCounter.OPCODE + instruction_names["NOP"].opcode] if usePerfCounters else [])
+    data = lambda: dataAddr + rng.randrange(dataSize)
+    imm = lambda: rng.choice([0, 1, 31, 32, 0x7FFFFFFF, 0x80000000, MASK32, rng.getrandbits(32)])
+    operands = {
+        "NOP": lambda: [], "INCA": lambda: [], "INCB": lambda: [], "INCX": lambda: [],
+        "DECA": lambda: [], "DECB": lambda: [], "DECX": lambda: [],
+        "SCF": lambda: [], "CCF": lambda: [], "SEF": lambda: [], "CEF": lambda: [],
+        "FLUSH": lambda: [], "INVAL": lambda: [],
+        "LDA_ABS": lambda: [imm()], "LDB_ABS": lambda: [imm()], "LDX_ABS": lambda: [imm()],
+        "LDA": lambda: [data()], "LDB": lambda: [data()], "LDX": lambda: [data()],
+        "ADDA_ABS": lambda: [imm()], "ADDB_ABS": lambda: [imm()], "ADDX_ABS": lambda: [imm()],
+        "SUBA_ABS": lambda: [imm()], "SUBB_ABS": lambda: [imm()], "SUBX_ABS": lambda: [imm()],
+        "ADDA": lambda: [data()], "ADDB": lambda: [data()], "ADDX": lambda: [data()],
+        "SUBA": lambda: [data()], "SUBB": lambda: [data()], "SUBX": lambda: [data()],
+        "MULA_ABS": lambda: [imm()], "MULB_ABS": lambda: [imm()], "MULX_ABS": lambda: [imm()],
+        "MULA": lambda: [data()], "MULB": lambda: [data()], "MULX": lambda: [data()],
+        "STA": lambda: [data()], "STB": lambda: [data()], "STX": lambda: [data()],
+        "MOV": lambda: [int(rng.choice(sources + [data()])), rng.choice(regs + [data()])],
+        "PUSHA": lambda: [], "PUSHB": lambda: [], "PUSHX": lambda: [],
+        "POPA": lambda: [], "POPB": lambda: [], "POPX": lambda: [],
+        "PUSH_ABS": lambda: [imm()], "PUSH": lambda: [data()], "POP": lambda: [data()],
+        "ADD": lambda: [], "SUB": lambda: [], "CMP": lambda: [], "MUL": lambda: [],
+    }
+    for op in ("AND", "OR", "XOR", "SHL", "SHR", "SAR", "ROL", "ROR"):
+        operands.update({op: lambda: [], op + "_ABS": lambda: [imm()], op + "_MEM": lambda: [data()]})
+    operands["NOT"] = lambda: []
+    # The streaming hash forms and DOT/TMAC are left out, a register could ask for billions of words
+    for name in ("HSET", "HGET", "CRC32", "FNV1A", "MURMUR", "MCLR", "MSET", "MGET", "MAC"):
+        operands[name] = lambda: []
+    for op in PACKED_OPS:
+        operands[op.name] = lambda: []
+    jumps = ["JIZ", "JNZ", "JIC", "JNC", "JIE", "JNE"]
+    names = [name for name in list(operands) + jumps if name in subset]
+
+    program = []
+    addr = codeAddr
+    for _ in range(count):
+        name = rng.choice(names)
+        program.append((addr, name))
+        addr += instruction_names[name].length
+    end = addr
+
+    mem = {0x00000009: codeAddr}
+    for i, (addr, name) in enumerate(program):
+        inst = instruction_names[name]
+        if name in jumps:
+            args = [program[rng.randrange(i + 1, count)][0] if i + 1 < count else end]
+        else:
+            args = operands[name]()
+        words = [encode_reg_fields(inst.opcode, [rng.randrange(len(REGISTERS)) for _ in range(inst.regFields)])] + args
+        words += [instruction_names["NOP"].opcode] * (inst.length - len(words))
+        for offset, word in enumerate(words):
+            mem[addr + offset] = word
+    mem[end] = instruction_names["HALT"].opcode
+    return mem
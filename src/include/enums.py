@@ -16,15 +16,75 @@ class AluOps(IntEnum):
     MUL = auto()
     INC = auto()
     DEC = auto()
+    AND = auto()
+    OR = auto()
+    XOR = auto()
+    NOT = auto()
+    SHL = auto()
+    SHR = auto()
+    SAR = auto()
+    ROL = auto()
+    ROR = auto()
+    # Packed unsigned lanes, 4 x 8 bits (B) or 2 x 16 bits (H). CMPEQ and CMPGT set
+    # the lanes where they hold to all ones, ADDS saturates at the lane maximum.
+    # Bit 3 selects halfword lanes and only the adds have bits 1 and 2 clear, so
+    # Core.packed_alu takes both from the op without decoding it.
+    PADDB = 0x10
+    PADDSB = 0x11
+    PSUBB = 0x12
+    PCMPEQB = 0x13
+    PCMPGTB = 0x14
+    PMINB = 0x15
+    PMAXB = 0x16
+    PADDH = 0x18
+    PADDSH = 0x19
+    PSUBH = 0x1A
+    PCMPEQH = 0x1B
+    PCMPGTH = 0x1C
+    PMINH = 0x1D
+    PMAXH = 0x1E
+
+PACKED_BYTE_OPS = (AluOps.PADDB, AluOps.PSUBB, AluOps.PADDSB, AluOps.PCMPEQB, AluOps.PCMPGTB, AluOps.PMINB, AluOps.PMAXB)
+PACKED_HALF_OPS = (AluOps.PADDH, AluOps.PSUBH, AluOps.PADDSH, AluOps.PCMPEQH, AluOps.PCMPGTH, AluOps.PMINH, AluOps.PMAXH)
+PACKED_OPS = PACKED_BYTE_OPS + PACKED_HALF_OPS
+
+class MulMode(IntEnum):
+    SINGLE = 0    # One combinational multiply, maps to DSP blocks
+    PIPELINED = 1 # Registered inputs and product
+    ITERATIVE = 2 # Shift-add, one bit per cycle
+
+class HashOps(IntEnum):
+    NONE = 0
+    SET = auto()    # Load the state with the word
+    CRC32 = auto()  # Reflected CRC32 (zlib polynomial) of the word, no pre or post inversion
+    FNV1A = auto()  # 32-bit FNV-1a step on the whole word: (state ^ word) * FNV prime
+    MURMUR = auto() # MurmurHash3 x86_32 body round with the word as block
+
+class MacOps(IntEnum):
+    NONE = 0
+    SET = auto() # Load the accumulator with a
+    MAC = auto() # Add a * b to the accumulator
 
 class StackOps(IntEnum):
     NONE = 0
     PUSH = auto()
     POP = auto()
 
+class CacheOps(IntEnum):
+    NONE = 0
+    FLUSH = auto()      # Write back every dirty line
+    INVALIDATE = auto() # Write back, then drop every line
+
 class Flags(IntEnum):
     ZERO = 0
     CARRY = 1
     NEGATIVE = 2
     ERROR = 3
-    OVERFLOW = 4
\ No newline at end of file
+    OVERFLOW = 4
+
+class PerfCounter(IntEnum):
+    CYCLES = 0xFFFFFF10
+    RETIRED = 0xFFFFFF11
+    STALL = 0xFFFFFF12
+    STACK = 0xFFFFFF13
+    OPCODE = 0xFFFFFE00 # OPCODE + opcode reads the retire count of that opcode
@@ -33,4 +33,84 @@ class AssemblerInstructionAlreadyExists(Exception):
         if self.addInfo != None:
             e += f" Additional info are supplied: {self.addInfo}"
         
+        return e
+
+class OpcodeOutOfRange(Exception):
+    def __init__(self, opcode: int, instrName: str, bits: int, addInfo = None):
+        self.opcode = opcode
+        self.instrName = instrName
+        self.bits = bits
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"Tried to assign instruction {self.instrName} to opcode 0x{self.opcode:X}, but opcodes only have {self.bits} bits."
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
+        return e
+
+class InstructionNotFound(Exception):
+    def __init__(self, instrName: str, addInfo = None):
+        self.instrName = instrName
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"No instruction or instruction module is called {self.instrName}."
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
+        return e
+
+class ISAProfileNotFound(Exception):
+    def __init__(self, profile: str, profiles: list, addInfo = None):
+        self.profile = profile
+        self.profiles = profiles
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"There is no ISA profile called {self.profile}, the profiles are {', '.join(self.profiles)}."
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
+        return e
+
+class InstructionNotSimulated(Exception):
+    def __init__(self, instrName: str, addInfo = None):
+        self.instrName = instrName
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"Instruction {self.instrName} has no simulation function, so the ISA simulator cannot execute it."
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
+        return e
+
+class CoSimDivergence(Exception):
+    def __init__(self, retired: int, ip: int, field: str, rtl, model, addInfo = None):
+        self.retired = retired
+        self.ip = ip
+        self.field = field
+        self.rtl = rtl
+        self.model = model
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"RTL and ISA model diverged on {self.field} after retiring instruction {self.retired} at 0x{self.ip:08X}: RTL has {self.rtl}, model has {self.model}."
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
+        return e
+
+class AssemblerError(Exception):
+    def __init__(self, line: int, message: str, addInfo = None):
+        self.line = line
+        self.message = message
+        self.addInfo = addInfo
+
+    def __str__(self) -> str:
+        e = f"Line {self.line}: {self.message}"
+        if self.addInfo != None:
+            e += f" Additional info are supplied: {self.addInfo}"
+
         return e
\ No newline at end of file
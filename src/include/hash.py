@@ -0,0 +1,99 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from amaranth import Signal, Module, Elaboratable, Value, Cat, Mux
+from amaranth.build import Platform
+from include.enums import HashOps
+
+MASK32 = 0xFFFFFFFF
+CRC32_POLY = 0xEDB88320
+FNV_PRIME = 0x01000193
+MURMUR_C1 = 0xCC9E2D51
+MURMUR_C2 = 0x1B873593
+
+def _rotl(value: Value, amount: int) -> Value:
+    return Cat(value[32 - amount:], value[:32 - amount])
+
+def crc32_word(m: Module, state: Value, word: Value) -> Value:
+    # One signal per bit step, an expression alone would copy the previous steps twice each time
+    crc = state ^ word
+    for step in range(32):
+        next_crc = Signal(32, name=f"crc_{step}")
+        m.d.comb += next_crc.eq((crc >> 1) ^ (crc[0].replicate(32) & CRC32_POLY))
+        crc = next_crc
+    return crc
+
+def fnv1a_word(state: Value, word: Value) -> Value:
+    return ((state ^ word) * FNV_PRIME)[:32]
+
+def murmur_word(state: Value, word: Value) -> Value:
+    k = (word * MURMUR_C1)[:32]
+    k = (_rotl(k, 15) * MURMUR_C2)[:32]
+    h = _rotl(state ^ k, 13)
+    return (h * 5 + 0xE6546B64)[:32]
+
+class HashUnit(Elaboratable):
+    """
+    Hash state register updated one 32-bit word at a time.
+    Set op and data and raise start: the word is registered, and folded into
+    state in the next cycle, so any number of words can go in back to back.
+    value is the state with the word in flight already folded, read it instead of state.
+    """
+    def __init__(self):
+        self.op = Signal(HashOps)
+        self.data = Signal(32)
+        self.start = Signal()
+        self.state = Signal(32)
+        self.value = Signal(32)
+
+    def elaborate(self, platform: Platform) -> Module:
+        m = Module()
+
+        op = Signal(HashOps)
+        data = Signal(32)
+        m.d.sync += [
+            op.eq(Mux(self.start, self.op, HashOps.NONE)),
+            data.eq(self.data)
+        ]
+
+        with m.Switch(op):
+            with m.Case(HashOps.SET):
+                m.d.comb += self.value.eq(data)
+            with m.Case(HashOps.CRC32):
+                m.d.comb += self.value.eq(crc32_word(m, self.state, data))
+            with m.Case(HashOps.FNV1A):
+                m.d.comb += self.value.eq(fnv1a_word(self.state, data))
+            with m.Case(HashOps.MURMUR):
+                m.d.comb += self.value.eq(murmur_word(self.state, data))
+            with m.Default():
+                m.d.comb += self.value.eq(self.state)
+        m.d.sync += self.state.eq(self.value)
+
+        return m
+
+def hash_word(op: HashOps, state: int, word: int) -> int:
+    """
+    Reference of HashUnit for the ISA model.
+    """
+    if op == HashOps.SET:
+        return word & MASK32
+    if op == HashOps.CRC32:
+        crc = (state ^ word) & MASK32
+        for _ in range(32):
+            crc = (crc >> 1) ^ (CRC32_POLY if crc & 1 else 0)
+        return crc
+    if op == HashOps.FNV1A:
+        return ((state ^ word) * FNV_PRIME) & MASK32
+    if op == HashOps.MURMUR:
+        k = (word * MURMUR_C1) & MASK32
+        k = (((k << 15) | (k >> 17)) * MURMUR_C2) & MASK32
+        h = (state ^ k) & MASK32
+        h = ((h << 13) | (h >> 19)) & MASK32
+        return (h * 5 + 0xE6546B64) & MASK32
+    return state
@@ -11,6 +11,24 @@ from amaranth import Module
 from typing import Callable
 from include.exceptions import *
 
+# Core decodes the low OPCODE_BITS of an instruction word, the rest is left for operand/format fields
+OPCODE_BITS = 8
+OPCODE_MASK = (1 << OPCODE_BITS) - 1
+
+# Register operand fields follow the opcode field, REG_FIELD_BITS each, numbered like
+# the low bits of the register aliases (0xFFFFFF00 + index). Index 3 reads 0 and drops writes.
+REG_FIELD_BITS = 2
+REGISTERS = ("ra", "rb", "rx")
+
+def reg_field(word: int, index: int) -> int:
+    return (word >> (OPCODE_BITS + REG_FIELD_BITS * index)) & ((1 << REG_FIELD_BITS) - 1)
+
+def encode_reg_fields(opcode: int, registers: list[int]) -> int:
+    word = opcode
+    for index, register in enumerate(registers):
+        word |= register << (OPCODE_BITS + REG_FIELD_BITS * index)
+    return word
+
 instruction_opcodes = {}
 instruction_names = {}
 assembler_inst = {}
@@ -29,11 +47,25 @@ class OpcodeAlreadyExists(Exception):
 
 class Instruction:
     """
-    Create an instruction with an opcode, name, length and function
+    Create an instruction with an opcode, name, length and function.
+    regFields is the number of register operands encoded in the opcode word,
+    they come before the operand words in the assembler.
+    operandWords is the number of operand words the instruction reads, length - 1
+    by default, the assembler pads the words after them with NOP.
+    Instructions registered with the same execute function share one decoder case.
     """
     def execute(self, m: Module, core):
         self._executeFunc(m, core)
 
+    @property
+    def executeFunc(self) -> Callable:
+        return self._executeFunc
+
+    def simulate(self, sim) -> int:
+        if self._simFunc == None:
+            raise InstructionNotSimulated(self.name)
+        return self._simFunc(sim)
+
     def asmOverride(self, assembler, parameters: list[str] | None = None):
         if self._asmFunc != None:
             self._asmFunc(self, assembler, parameters)
@@ -41,12 +73,17 @@ class Instruction:
         else:
             return False
 
-    def __init__(self, opcode: int, name: str, execute: Callable, length: int = 0x01, asmFunc: Callable | None = None):
+    def __init__(self, opcode: int, name: str, execute: Callable, length: int = 0x01, asmFunc: Callable | None = None, simFunc: Callable | None = None, regFields: int = 0, operandWords: int | None = None):
         self.opcode: int = opcode
         self.length: int = length
+        self.regFields: int = regFields
+        self.operandWords: int = length - 1 if operandWords == None else operandWords
         self.name: str = name
         self._executeFunc: Callable = execute
         self._asmFunc: Callable | None = asmFunc
+        self._simFunc: Callable | None = simFunc
+        if not 0 <= self.opcode <= OPCODE_MASK:
+            raise OpcodeOutOfRange(self.opcode, self.name, OPCODE_BITS)
         if instruction_opcodes.get(self.opcode) != None:
             raise OpcodeAlreadyExists(self.opcode, self.name)
         if instruction_names.get(self.name) != None:
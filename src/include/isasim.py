@@ -0,0 +1,266 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from typing import Dict, Iterable, Optional
+from instructions import isa_subset
+from include.enums import *
+from include.instruction import instruction_names, OPCODE_MASK, REGISTERS, reg_field
+from include.memory import MemoryImage, as_memory_image
+from include.multiplier import MUL_LATENCY
+
+MASK32 = 0xFFFFFFFF
+
+def to_signed(value: int) -> int:
+    value &= MASK32
+    if value & 0x80000000:
+        return value - 0x100000000
+    return value
+
+class ISASimulator:
+    """
+    Instruction-level reference model of Core.
+    Every step fetches one instruction, decodes its opcode field through the isa subset and
+    runs its simFunc. simFuncs return the number of clock cycles the RTL spends
+    on the instruction with a separate fetch cycle, so cycles matches the RTL
+    cycle count. With usePipeline the fetch overlaps the previous instruction
+    and fetchCycles is 0 instead of 1. operandCycles is the cycle Core spends
+    bringing an operand word to data_in, 0 with useDualPort, mulLatency the
+    cycles MUL instructions wait for the multiplier. Like Core, instructions
+    outside isa run as NOP.
+    """
+    def __init__(self, *, mem_init: Optional[Dict | MemoryImage | str] = None, useResetVector: bool = True, startAddr: int = 0x0009, memDepth: int = 2**16, usePerfCounters: bool = False, usePipeline: bool = False, useDualPort: bool = False, multiplier: MulMode = MulMode.SINGLE, isa: str | Iterable[str] = "full"):
+        self.memDepth = memDepth
+        self.mem = as_memory_image(mem_init, memDepth).to_array()
+
+        #Registries, stored as unsigned 32-bit values
+        self.ra = 0
+        self.rb = 0
+        self.rx = 0
+        self.ir = 0
+        self.sp = memDepth - 1
+        self.flags = 0
+        self.hash_state = 0 # HashUnit.value
+        self.mac_acc = 0 # MacUnit.value
+
+        self.halted = False
+        self.retired = 0
+        self.writes = []
+
+        # Mirrors Core's performance counters, the model never stalls
+        self.usePerfCounters = usePerfCounters
+        self.stack_ops = 0
+        self.opcode_retired: Dict[int, int] = {}
+        self.instructions = isa_subset(isa)
+        self._nop = instruction_names["NOP"]
+        self._next_ip = 0
+
+        self.usePipeline = usePipeline
+        self.fetchCycles = 0 if usePipeline else 1
+        self.useDualPort = useDualPort
+        self.operandCycles = 0 if useDualPort else 1
+        self.multiplier = multiplier
+        self.mulLatency = MUL_LATENCY[multiplier]
+
+        # The reset vector costs two cycles (address, then jump), a fixed start address one.
+        if useResetVector:
+            self.ip = self.read(startAddr)
+            self.cycles = 2
+        else:
+            self.ip = startAddr
+            self.cycles = 1
+
+    def read(self, addr: int) -> int:
+        return self.mem[addr & (self.memDepth - 1)]
+
+    def write(self, addr: int, value: int):
+        addr &= self.memDepth - 1
+        value &= MASK32
+        self.mem[addr] = value
+        self.writes.append((addr, value))
+
+    def operand(self, offset: int = 1) -> int:
+        return self.read(self.ip + offset)
+
+    def reg(self, register: str) -> int:
+        return getattr(self, register)
+
+    def set_reg(self, register: str, value: int):
+        setattr(self, register, value & MASK32)
+
+    def field_reg(self, index: int) -> int:
+        """
+        Value of the register selected by register field index of ir, 0 for index 3.
+        """
+        field = reg_field(self.ir, index)
+        return self.reg(REGISTERS[field]) if field < len(REGISTERS) else 0
+
+    def set_field_reg(self, index: int, value: int):
+        field = reg_field(self.ir, index)
+        if field < len(REGISTERS):
+            self.set_reg(REGISTERS[field], value)
+
+    def flag(self, flag: Flags) -> int:
+        return (self.flags >> flag) & 1
+
+    def set_flag(self, flag: Flags, value):
+        if value:
+            self.flags |= 1 << flag
+        else:
+            self.flags &= ~(1 << flag)
+
+    def read_alias(self, addr: int, cycle: int) -> Optional[int]:
+        """
+        Value of a Core.read_aliases signal at cycle, None if addr is not one.
+        """
+        if not self.usePerfCounters:
+            return None
+        if addr == PerfCounter.CYCLES:
+            return cycle & MASK32
+        if addr == PerfCounter.RETIRED:
+            return self.retired & MASK32
+        if addr == PerfCounter.STALL:
+            return 0
+        if addr == PerfCounter.STACK:
+            return self.stack_ops & MASK32
+        opcode = addr - PerfCounter.OPCODE
+        if opcode in self.instructions:
+            return self.opcode_retired.get(opcode, 0) & MASK32
+        return None
+
+    def push(self, value: int):
+        self.stack_ops += 1
+        self.write(self.sp, value)
+        self.sp = (self.sp - 1) & MASK32
+
+    def pop(self) -> int:
+        self.stack_ops += 1
+        self.sp = (self.sp + 1) & MASK32
+        return self.read(self.sp)
+
+    def alu(self, op: AluOps, a: int, b: int = 0) -> int:
+        """
+        Mirrors Core.alu_handler, flags included.
+        """
+        a &= MASK32
+        b &= MASK32
+        if op == AluOps.ADD:
+            out = (a + b) & MASK32
+            carry = (a + b) >> 32
+            overflow = (a >> 31) == (b >> 31) and (a >> 31) != (out >> 31)
+        elif op == AluOps.SUB:
+            out = (a - b) & MASK32
+            carry = a < b
+            overflow = (a >> 31) != (b >> 31) and (a >> 31) != (out >> 31)
+        elif op == AluOps.MUL:
+            out = (a * b) & MASK32
+            carry = (a * b) >> 32 != 0
+            product = to_signed(a) * to_signed(b)
+            overflow = product < -0x80000000 or product > 0x7FFFFFFF
+        elif op == AluOps.INC:
+            out = (a + 1) & MASK32
+            carry = 0
+            overflow = a == 0x7FFFFFFF
+        elif op == AluOps.DEC:
+            out = (a - 1) & MASK32
+            carry = 0
+            overflow = a == 0x80000000
+        elif op in (AluOps.AND, AluOps.OR, AluOps.XOR, AluOps.NOT):
+            out = {AluOps.AND: a & b, AluOps.OR: a | b, AluOps.XOR: a ^ b, AluOps.NOT: ~a & MASK32}[op]
+            carry = 0
+            overflow = 0
+        elif op in (AluOps.SHL, AluOps.SHR, AluOps.SAR, AluOps.ROL, AluOps.ROR):
+            out, carry = self.shift(op, a, b & 0x1F)
+            overflow = 0
+        elif op in PACKED_OPS:
+            out, carry = self.packed(op, a, b)
+            overflow = 0
+        else:
+            self.flags = 1 << Flags.ERROR
+            return 0
+
+        self.set_flag(Flags.ZERO, out == 0)
+        self.set_flag(Flags.NEGATIVE, out >> 31)
+        self.set_flag(Flags.OVERFLOW, overflow)
+        self.set_flag(Flags.CARRY, carry)
+        return out
+
+    def shift(self, op: AluOps, a: int, amount: int):
+        """
+        Result and carry (last bit moved out, 0 for amount 0) of Core.shifter.
+        """
+        if amount == 0:
+            return a, 0
+        if op == AluOps.SHL:
+            return (a << amount) & MASK32, (a >> (32 - amount)) & 1
+        if op == AluOps.SHR:
+            return a >> amount, (a >> (amount - 1)) & 1
+        if op == AluOps.SAR:
+            return (to_signed(a) >> amount) & MASK32, (a >> (amount - 1)) & 1
+        if op == AluOps.ROL:
+            out = ((a << amount) | (a >> (32 - amount))) & MASK32
+            return out, out & 1
+        out = ((a >> amount) | (a << (32 - amount))) & MASK32
+        return out, out >> 31
+
+    def packed(self, op: AluOps, a: int, b: int):
+        """
+        Result and carry (any lane carried out of an add or borrowed) of Core.packed_alu.
+        """
+        width = 16 if op in PACKED_HALF_OPS else 8
+        name = op.name[1:-1]
+        lane_max = (1 << width) - 1
+        out = 0
+        carry = 0
+        for shift in range(0, 32, width):
+            x = (a >> shift) & lane_max
+            y = (b >> shift) & lane_max
+            if name in ("ADD", "ADDS"):
+                lane = min(x + y, lane_max) if name == "ADDS" else (x + y) & lane_max
+                carry |= x + y > lane_max
+            else:
+                lane = {
+                    "SUB": (x - y) & lane_max,
+                    "CMPEQ": lane_max if x == y else 0,
+                    "CMPGT": lane_max if x > y else 0,
+                    "MIN": min(x, y),
+                    "MAX": max(x, y),
+                }[name]
+                carry |= x < y
+            out |= lane << shift
+        return out, int(carry)
+
+    def end_instr(self, addr: int):
+        self._next_ip = addr & MASK32
+
+    def step(self) -> int:
+        self.writes.clear()
+        self.ir = self.read(self.ip)
+        opcode = self.ir & OPCODE_MASK
+        inst = self.instructions.get(opcode, self._nop)
+        cycles = inst.simulate(self) - 1 + self.fetchCycles
+        self.ip = self._next_ip
+        self.cycles += cycles
+        self.retired += 1
+        if self.usePerfCounters and opcode in self.instructions:
+            self.opcode_retired[opcode] = self.opcode_retired.get(opcode, 0) + 1
+        return cycles
+
+    def run(self, max_instructions: int = 1000000) -> int:
+        """
+        Runs until HALT retires or max_instructions have been executed.
+        Returns the total number of cycles, reset included.
+        """
+        for _ in range(max_instructions):
+            self.step()
+            if self.halted:
+                break
+        return self.cycles
+
+    def __str__(self) -> str:
+        return f"ISASimulator ip=0x{self.ip:08X} ra=0x{self.ra:08X} rb=0x{self.rb:08X} rx=0x{self.rx:08X} sp=0x{self.sp:08X} flags=0x{self.flags:02X} cycles={self.cycles} retired={self.retired}"
@@ -0,0 +1,63 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from amaranth import Signal, Module, Elaboratable, Mux
+from amaranth.build import Platform
+from include.enums import MacOps
+
+MASK32 = 0xFFFFFFFF
+
+class MacUnit(Elaboratable):
+    """
+    32-bit multiply-accumulate register with its own multiplier, so it takes a
+    product every cycle whatever multiplier Core uses.
+    Set op, a and b and raise start: the operands are registered and added to acc
+    in the next cycle, so products can go in back to back.
+    value is acc with the operation in flight already applied, read it instead of acc.
+    """
+    def __init__(self):
+        self.op = Signal(MacOps)
+        self.a = Signal(32)
+        self.b = Signal(32)
+        self.start = Signal()
+        self.acc = Signal(32)
+        self.value = Signal(32)
+
+    def elaborate(self, platform: Platform) -> Module:
+        m = Module()
+
+        op = Signal(MacOps)
+        a = Signal(32)
+        b = Signal(32)
+        m.d.sync += [
+            op.eq(Mux(self.start, self.op, MacOps.NONE)),
+            a.eq(self.a),
+            b.eq(self.b)
+        ]
+
+        with m.Switch(op):
+            with m.Case(MacOps.SET):
+                m.d.comb += self.value.eq(a)
+            with m.Case(MacOps.MAC):
+                m.d.comb += self.value.eq(self.acc + (a * b)[:32])
+            with m.Default():
+                m.d.comb += self.value.eq(self.acc)
+        m.d.sync += self.acc.eq(self.value)
+
+        return m
+
+def mac_word(op: MacOps, acc: int, a: int, b: int = 0) -> int:
+    """
+    Reference of MacUnit for the ISA model.
+    """
+    if op == MacOps.SET:
+        return a & MASK32
+    if op == MacOps.MAC:
+        return (acc + a * b) & MASK32
+    return acc
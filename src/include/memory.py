@@ -0,0 +1,277 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import mmap, os, struct, sys
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+PAGE_BITS = 10
+PAGE_SIZE = 1 << PAGE_BITS
+
+class MemoryImage:
+    """
+    Sparse contents of a word-addressed memory.
+    Words that were never written read as fill; the rest is kept in
+    array('I') pages of PAGE_SIZE words that are allocated on first write.
+    Memory(init=...) has to spell out every fill word unless fill is 0, which
+    costs about 1 s per 100k words when Core is built. Images with fill 0 only
+    pass the words up to the last used one.
+    """
+    def __init__(self, init: Optional[Dict[int, int]] = None, *, fill: int = 0xFFFFFFFF, depth: int = 2**16):
+        if depth <= 0 or depth & (depth - 1):
+            raise ValueError(f"Memory depth must be a power of two, not {depth}")
+
+        self.fill = fill & 0xFFFFFFFF
+        self.depth = depth
+        self.pages: Dict[int, array] = {}
+        if init != None:
+            self.update(init)
+
+    def _page(self, index: int) -> array:
+        page = self.pages.get(index)
+        if page == None:
+            page = array("I", [self.fill]) * PAGE_SIZE
+            self.pages[index] = page
+        return page
+
+    def __getitem__(self, addr: int) -> int:
+        addr &= self.depth - 1
+        page = self.pages.get(addr >> PAGE_BITS)
+        if page == None:
+            return self.fill
+        return page[addr & (PAGE_SIZE - 1)]
+
+    def __setitem__(self, addr: int, value: int):
+        addr &= self.depth - 1
+        self._page(addr >> PAGE_BITS)[addr & (PAGE_SIZE - 1)] = value & 0xFFFFFFFF
+
+    def store(self, addr: int, words):
+        """
+        Writes a list of 32-bit words starting at addr, one page slice at a time.
+        """
+        offset = 0
+        while offset < len(words):
+            start = (addr + offset) & (self.depth - 1)
+            index = start & (PAGE_SIZE - 1)
+            count = min(PAGE_SIZE - index, len(words) - offset)
+            self._page(start >> PAGE_BITS)[index:index + count] = array("I", words[offset:offset + count])
+            offset += count
+
+    def update(self, init: Dict[int, int]):
+        for addr, val in init.items():
+            self[addr] = val
+
+    def load(self, addr: int, data):
+        """
+        Copies little-endian 32-bit words from a bytes-like object (bytes, mmap,
+        memoryview...) starting at word address addr, one page slice at a time.
+        Slicing goes through a memoryview, so the source is never copied as a whole.
+        """
+        view = memoryview(data).cast("B")
+        if len(view) % 4:
+            raise ValueError(f"Image length {len(view)} is not a multiple of 4 bytes")
+        words = len(view) // 4
+        offset = 0
+        while offset < words:
+            start = (addr + offset) & (self.depth - 1)
+            index = start & (PAGE_SIZE - 1)
+            count = min(PAGE_SIZE - index, words - offset)
+            chunk = array("I")
+            chunk.frombytes(view[offset * 4:(offset + count) * 4])
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            self._page(start >> PAGE_BITS)[index:index + count] = chunk
+            offset += count
+        view.release()
+
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields (address, word) for every word that differs from fill.
+        """
+        for index in sorted(self.pages):
+            base = index << PAGE_BITS
+            fill = self.fill
+            for offset, val in enumerate(self.pages[index]):
+                if val != fill:
+                    yield base + offset, val
+
+    def init_words(self) -> array:
+        """
+        What Memory(init=...) needs: the words up to the last non-zero one, rows
+        past it keep Memory's zero default. Every word when fill is not 0.
+        """
+        if self.fill != 0:
+            return self.to_array()
+        for index in sorted(self.pages, reverse=True):
+            page = self.pages[index]
+            for offset in range(PAGE_SIZE - 1, -1, -1):
+                if page[offset]:
+                    return self.to_array()[:(index << PAGE_BITS) + offset + 1]
+        return array("I")
+
+    def to_array(self) -> array:
+        mem = array("I", [self.fill]) * self.depth
+        for index, page in self.pages.items():
+            base = index << PAGE_BITS
+            mem[base:base + PAGE_SIZE] = page[:self.depth - base]
+        return mem
+
+
+def load_bin(path: str, base: int = 0, *, fill: int = 0xFFFFFFFF, depth: int = 2**16) -> MemoryImage:
+    """
+    Raw little-endian image, loaded at word address base.
+    """
+    image = MemoryImage(fill=fill, depth=depth)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return image
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            image.load(base, mm)
+    return image
+
+def _load_bytes(image: MemoryImage, byteAddr: int, data):
+    """
+    Loads bytes at a byte address. Unaligned edges are merged with the words
+    already in the image, so segments and records sharing a word keep their bytes.
+    """
+    head = byteAddr % 4
+    tail = -(byteAddr + len(data)) % 4
+    if head or tail:
+        first = byteAddr // 4
+        last = (byteAddr + len(data) - 1) // 4
+        data = image[first].to_bytes(4, "little")[:head] + bytes(data) + image[last].to_bytes(4, "little")[4 - tail:]
+    image.load(byteAddr // 4, data)
+
+def load_ihex(path: str, *, fill: int = 0xFFFFFFFF, depth: int = 2**16) -> MemoryImage:
+    """
+    Intel HEX image. Record addresses are byte addresses, word address = byte address / 4.
+    Contiguous data records are merged before being loaded.
+    """
+    image = MemoryImage(fill=fill, depth=depth)
+    upper = 0
+    start = None
+    chunk = bytearray()
+    with open(path, "r") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] != ":":
+                raise ValueError(f"{path}:{lineno}: Intel HEX records must start with ':'")
+            record = bytes.fromhex(line[1:])
+            if len(record) < 5 or len(record) != record[0] + 5 or sum(record) & 0xFF:
+                raise ValueError(f"{path}:{lineno}: malformed Intel HEX record")
+            count, addr, kind = record[0], (record[1] << 8) | record[2], record[3]
+            payload = record[4:4 + count]
+            if kind == 0x00:
+                addr += upper
+                if start == None or addr != start + len(chunk):
+                    if chunk:
+                        _load_bytes(image, start, chunk)
+                    start = addr
+                    chunk = bytearray()
+                chunk += payload
+            elif kind == 0x01:
+                break
+            elif kind == 0x02:
+                upper = int.from_bytes(payload, "big") << 4
+            elif kind == 0x04:
+                upper = int.from_bytes(payload, "big") << 16
+    if chunk:
+        _load_bytes(image, start, chunk)
+    return image
+
+def load_elf(path: str, *, fill: int = 0xFFFFFFFF, depth: int = 2**16) -> MemoryImage:
+    """
+    Little-endian ELF32 image. Every PT_LOAD segment is copied to its physical
+    byte address, the part of p_memsz beyond p_filesz is zeroed.
+    """
+    image = MemoryImage(fill=fill, depth=depth)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:4] != b"\x7fELF" or mm[4] != 1 or mm[5] != 1:
+            raise ValueError(f"{path} is not a little-endian ELF32 image")
+        phoff, = struct.unpack_from("<I", mm, 0x1C)
+        phentsize, phnum = struct.unpack_from("<HH", mm, 0x2A)
+        view = memoryview(mm)
+        for i in range(phnum):
+            p_type, p_offset, p_vaddr, p_paddr, p_filesz, p_memsz = struct.unpack_from("<6I", mm, phoff + i * phentsize)
+            if p_type != 1:
+                continue
+            if p_filesz:
+                _load_bytes(image, p_paddr, view[p_offset:p_offset + p_filesz])
+            if p_memsz > p_filesz:
+                _load_bytes(image, p_paddr + p_filesz, bytes(p_memsz - p_filesz))
+        view.release()
+    return image
+
+def load_image(path: str, base: int = 0, *, fill: int = 0xFFFFFFFF, depth: int = 2**16) -> MemoryImage:
+    """
+    Picks the loader from the file: ELF magic, .hex/.ihex, anything else is raw binary.
+    base only applies to raw binaries.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic == b"\x7fELF":
+        return load_elf(path, fill=fill, depth=depth)
+    if os.path.splitext(path)[1].lower() in (".hex", ".ihex"):
+        return load_ihex(path, fill=fill, depth=depth)
+    return load_bin(path, base, fill=fill, depth=depth)
+
+
+def save_bin(image: MemoryImage, path: str, end: Optional[int] = None):
+    """
+    Writes words 0 to end (default: last allocated page) as a raw little-endian image.
+    """
+    if end == None:
+        end = (max(image.pages) + 1) << PAGE_BITS if image.pages else 0
+    words = image.to_array()[:end]
+    if sys.byteorder != "little":
+        words.byteswap()
+    with open(path, "wb") as f:
+        f.write(words.tobytes())
+
+def save_ihex(image: MemoryImage, path: str):
+    """
+    Writes every allocated page as Intel HEX data records at byte address = word address * 4.
+    """
+    lines = []
+    upper = None
+    for index in sorted(image.pages):
+        page = image.pages[index]
+        if sys.byteorder != "little":
+            page = array("I", page)
+            page.byteswap()
+        data = page.tobytes()
+        base = (index << PAGE_BITS) * 4
+        for offset in range(0, len(data), 16):
+            addr = base + offset
+            if addr >> 16 != upper:
+                upper = addr >> 16
+                lines.append(_ihex_record(0x04, 0, upper.to_bytes(2, "big")))
+            lines.append(_ihex_record(0x00, addr & 0xFFFF, data[offset:offset + 16]))
+    lines.append(_ihex_record(0x01, 0, b""))
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+def _ihex_record(kind: int, addr: int, payload: bytes) -> str:
+    record = bytes([len(payload), addr >> 8, addr & 0xFF, kind]) + payload
+    return ":" + (record + bytes([-sum(record) & 0xFF])).hex().upper()
+
+def as_memory_image(init, depth: int = 2**16) -> MemoryImage:
+    """
+    Accepts what Core and ISASimulator take as mem_init: a {address: word} dict,
+    a MemoryImage or the path of an image file.
+    """
+    if isinstance(init, MemoryImage):
+        if init.depth != depth:
+            raise ValueError(f"Memory image depth {init.depth} does not match memDepth {depth}")
+        return init
+    if isinstance(init, (str, os.PathLike)):
+        return load_image(os.fspath(init), depth=depth)
+    return MemoryImage(init, depth=depth)
@@ -0,0 +1,98 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from amaranth import Signal, Module, Elaboratable, Mux
+from amaranth.build import Platform
+from include.enums import MulMode
+
+# Cycles from start to done
+MUL_LATENCY = {
+    MulMode.SINGLE: 0,
+    MulMode.PIPELINED: 2,
+    MulMode.ITERATIVE: 32,
+}
+
+class Multiplier(Elaboratable):
+    """
+    32 x 32 -> 64-bit multiplier behind AluOps.MUL.
+    Set a and b and raise start for one cycle; MUL_LATENCY[mode] cycles later done
+    is high for one cycle with the unsigned product on product and the upper word
+    of the signed product on high.
+    """
+    def __init__(self, mode: MulMode = MulMode.SINGLE):
+        self.mode = mode
+        self.latency = MUL_LATENCY[mode]
+
+        self.a = Signal(32)
+        self.b = Signal(32)
+        self.start = Signal()
+        self.done = Signal()
+        self.product = Signal(64)
+        self.high = Signal(32)
+
+    def elaborate(self, platform: Platform) -> Module:
+        m = Module()
+
+        # Operands of the product currently on product
+        a = Signal(32)
+        b = Signal(32)
+
+        if self.mode == MulMode.SINGLE:
+            m.d.comb += [
+                a.eq(self.a),
+                b.eq(self.b),
+                self.product.eq(a * b),
+                self.done.eq(self.start)
+            ]
+        elif self.mode == MulMode.PIPELINED:
+            a_in = Signal(32)
+            b_in = Signal(32)
+            valid = Signal(2)
+            m.d.sync += [
+                a_in.eq(self.a),
+                b_in.eq(self.b),
+                valid[0].eq(self.start),
+                a.eq(a_in),
+                b.eq(b_in),
+                self.product.eq(a_in * b_in),
+                valid[1].eq(valid[0])
+            ]
+            m.d.comb += self.done.eq(valid[1])
+        else:
+            multiplicand = Signal(64)
+            multiplier = Signal(32)
+            count = Signal(range(32))
+            busy = Signal()
+            # The start cycle already adds the partial product of bit 0
+            with m.If(self.start):
+                m.d.sync += [
+                    a.eq(self.a),
+                    b.eq(self.b),
+                    self.product.eq(Mux(self.b[0], self.a, 0)),
+                    multiplicand.eq(self.a << 1),
+                    multiplier.eq(self.b >> 1),
+                    count.eq(31),
+                    busy.eq(1)
+                ]
+            with m.Elif(count != 0):
+                with m.If(multiplier[0]):
+                    m.d.sync += self.product.eq(self.product + multiplicand)
+                m.d.sync += [
+                    multiplicand.eq(multiplicand << 1),
+                    multiplier.eq(multiplier >> 1),
+                    count.eq(count - 1)
+                ]
+            with m.Elif(busy):
+                m.d.sync += busy.eq(0)
+            m.d.comb += self.done.eq(busy & (count == 0))
+
+        # Signed product from the unsigned one: subtract b << 32 if a < 0 and a << 32 if b < 0
+        m.d.comb += self.high.eq(self.product[32:] - Mux(a[31], b, 0) - Mux(b[31], a, 0))
+
+        return m
@@ -10,31 +10,457 @@
 from amaranth import *
 from amaranth.lib import wiring
 from amaranth_soc import wishbone
+from typing import List, Optional, Tuple
+from include.memory import MemoryImage
+from include.cache import ICache, DCache
+from include.enums import CacheOps
+
+class _Port:
+    """
+    Master signals of the core accesses that bypass the DCache, routed to ibus
+    or dbus when the wrapper is split.
+    """
+    def __init__(self):
+        self.adr = Signal(32)
+        self.dat_w = Signal(32)
+        self.dat_r = Signal(32)
+        self.we = Signal()
+        self.sel = Signal()
+        self.cyc = Signal()
+        self.stb = Signal()
+        self.ack = Signal()
+        self.stall = Signal()
+        self.cti = Signal(3)
+        self.bte = Signal(2)
 
 class SISCFWishboneWrapper(wiring.Component):
-    def __init__(self, core):
+    """
+    Wishbone master for Core.
+    classic:   one classic cycle per access, cyc/stb held high
+    burst:     adds cti/bte, opcode fetches go out as INCR_BURST and the read
+               of addr + 1 after them as END_OF_BURST, so the slave can
+               acknowledge it without wait states. When the core does not
+               read addr + 1 next (core.addr_incr) cyc drops for a cycle
+               to end the burst. Not combined with pipelined.
+    pipelined: B4 pipelined mode, stb for one cycle per request; on the ack of
+               an access the core follows with addr + 1 the next request is
+               already issued, sequential reads run at one word per cycle
+    icacheSize words of ICache in front of the bus, for instruction words inside
+    cachedRegions ([(origin, size)], None for all of them). The cache refills
+    lines on its own, core accesses do not burst. Both caches are read
+    asynchronously and built from LUTRAM, a few hundred words at most.
+    dcacheSize words of DCache and a writeBuffer-entry posted write buffer for
+    every other access, dcacheSize 0 with writeBuffer only posts writes. Both
+    caches answer core.cache_op. With the DCache the bus only sees line
+    refills, buffered writes and uncached reads, self-modifying code has to
+    FLUSH before running the words it wrote.
+    harvard:   ibus and dbus instead of bus. Fetches and ICache refills go to
+               ibus, everything else to dbus, so with caches a refill runs
+               while the DCache drains its write buffer.
+    registered: every bus is driven from registers and its ack and dat_r are
+               registered before they reach the core or the caches, so no
+               combinational path runs through the interconnect. An access
+               takes two more cycles, which the core spends stalled. Accesses
+               of the core itself do not burst, only cache lines do.
+    """
+    def __init__(self, core, *, burst: bool = False, pipelined: bool = False, icacheSize: int = 0, icacheLine: int = 4, icacheWays: int = 1,
+                 dcacheSize: int = 0, dcacheLine: int = 4, dcacheWays: int = 1, writeBuffer: int = 0, cachedRegions: Optional[List[Tuple[int, int]]] = None,
+                 harvard: bool = False, registered: bool = False):
         self.core = core
+        self.burst = burst
+        self.pipelined = pipelined
+        self.harvard = harvard
+        self.registered = registered
+
+        self.icache = None
+        if icacheSize > 0:
+            self.icache = ICache(icacheSize, icacheLine, icacheWays, cachedRegions=cachedRegions, pipelined=pipelined)
+        self.dcache = None
+        if dcacheSize > 0 or writeBuffer > 0:
+            self.dcache = DCache(dcacheSize, dcacheLine, dcacheWays, max(writeBuffer, dcacheLine if dcacheSize > 0 else 1), cachedRegions=cachedRegions, pipelined=pipelined)
+
+        features = set()
+        if burst:
+            features |= {wishbone.Feature.CTI, wishbone.Feature.BTE}
+        if pipelined:
+            features.add(wishbone.Feature.STALL)
+        bus_signature = wishbone.Signature(addr_width=32, data_width=32, granularity=32, features=features)
         
-        bus_signature = wishbone.Signature(addr_width=32, data_width=32, granularity=32)
-        
-        super().__init__({"bus": wiring.Out(bus_signature)})
+        if harvard:
+            super().__init__({"ibus": wiring.Out(bus_signature), "dbus": wiring.Out(bus_signature)})
+        else:
+            super().__init__({"bus": wiring.Out(bus_signature)})
 
     def elaborate(self, platform):
         m = Module()
         m.submodules.core = core = self.core
+        icache = self.icache
+        dcache = self.dcache
+
+        if self.harvard:
+            ibus = self.ibus
+            dbus = self.dbus
+        else:
+            ibus = dbus = self.bus
+        if self.registered:
+            # The logic below drives the inner side of a register slice for each bus
+            outer = [ibus, dbus] if self.harvard else [ibus]
+            inner = [_Port() for _ in outer]
+            ibus, dbus = inner if self.harvard else inner * 2
+        port = _Port() if self.harvard else ibus
+
+        # Access of the core that does not go to the ICache, and its completion
+        request = Signal()
+        ack = Signal()
+        # Instruction read
+        fetch = Signal()
+        # The ICache owns ibus
+        refill = Const(0)
+        # core.cache_op is over
+        op_done = Const(1)
 
         m.d.comb += [
-            self.bus.adr.eq(core.addr),
-            self.bus.dat_w.eq(core.data_out),
-            core.data_in.eq(self.bus.dat_r),
-            self.bus.we.eq(~core.RW),
+            port.adr.eq(core.addr),
+            port.dat_w.eq(core.data_out),
+            core.data_in.eq(port.dat_r),
+            port.we.eq(~core.RW),
             
-            self.bus.sel.eq(1), 
+            port.sel.eq(1), 
             
-            self.bus.cyc.eq(1),
-            self.bus.stb.eq(~core.internal_op)
+            port.cyc.eq(1),
+            port.stb.eq(request),
+            request.eq(~core.internal_op),
+            ack.eq(port.ack),
+            fetch.eq(core.RW & (core.addr == core.ip))
+        ]
+
+        if icache != None or dcache != None:
+            # The core access of a cache maintenance instruction is dropped
+            maintenance = Signal()
+            m.d.comb += [
+                maintenance.eq(core.cache_op != CacheOps.NONE),
+                request.eq(~core.internal_op & ~maintenance)
+            ]
+
+        if icache != None:
+            m.submodules.icache = icache
+            refill = icache.refill
+            m.d.comb += [
+                icache.addr.eq(core.addr),
+                icache.fetch.eq(fetch & ~core.internal_op & ~maintenance),
+                icache.write.eq(~core.RW & request & ack),
+                icache.write_data.eq(core.data_out),
+                icache.bus_ack.eq(ibus.ack),
+                icache.bus_dat_r.eq(ibus.dat_r),
+                icache.bus_free.eq(1),
+                icache.invalidate.eq(core.cache_op == CacheOps.INVALIDATE),
+                request.eq(~core.internal_op & ~maintenance & ~icache.lookup),
+                ack.eq(port.ack & ~icache.refill)
+            ]
+            if self.pipelined:
+                m.d.comb += icache.bus_stall.eq(ibus.stall)
+            op_done = op_done & (icache.invalidated | (core.cache_op != CacheOps.INVALIDATE))
+
+        if dcache != None:
+            m.submodules.dcache = dcache
+            op_done = op_done & dcache.done
+            # On a split bus ICache refills do not wait for dbus
+            dbus_free = Const(1) if self.harvard else ~refill
+            m.d.comb += [
+                dcache.addr.eq(core.addr),
+                dcache.access.eq(request),
+                dcache.we.eq(~core.RW),
+                dcache.write_data.eq(core.data_out),
+                dcache.cache_op.eq(core.cache_op),
+                core.data_in.eq(dcache.data),
+                ack.eq(dcache.ready),
+
+                dcache.bus_ack.eq(dbus.ack & dbus_free),
+                dcache.bus_dat_r.eq(dbus.dat_r),
+                dcache.bus_grant.eq(dbus_free),
+                dbus.adr.eq(dcache.bus_adr),
+                dbus.dat_w.eq(dcache.bus_dat_w),
+                dbus.we.eq(dcache.bus_we),
+                dbus.sel.eq(1),
+                dbus.cyc.eq(1),
+                dbus.stb.eq(dcache.bus_stb)
+            ]
+            if self.pipelined:
+                m.d.comb += dcache.bus_stall.eq(dbus.stall)
+            if self.burst:
+                m.d.comb += [
+                    dbus.cti.eq(dcache.bus_cti),
+                    dbus.bte.eq(wishbone.BurstTypeExt.LINEAR)
+                ]
+            if icache != None and not self.harvard:
+                # Buffered writes reach the bus before a line is refilled
+                m.d.comb += icache.bus_free.eq(dcache.idle)
+
+        if icache != None:
+            with m.If(icache.lookup):
+                m.d.comb += core.data_in.eq(icache.data)
+
+        # Bursts and early requests stay on one bus, on a split bus the next
+        # word is only requested for a fetch, which the core follows with a fetch
+        sequential = Signal()
+        m.d.comb += sequential.eq(core.addr_incr & (fetch if self.harvard else 1))
+
+        if self.pipelined and dcache == None:
+            # A request was accepted and its ack has not come yet
+            pending = Signal()
+            if icache == None:
+                # On the ack of an access the core follows with addr + 1, request it right away
+                early = Signal()
+                m.d.comb += early.eq(pending & ack & sequential & ~core.internal_op)
+                with m.If(early):
+                    m.d.comb += [
+                        port.adr.eq(core.addr + 1),
+                        port.we.eq(0),
+                        port.stb.eq(1)
+                    ]
+                with m.Elif(pending):
+                    m.d.comb += port.stb.eq(0)
+            else:
+                with m.If(pending):
+                    m.d.comb += port.stb.eq(0)
+            m.d.sync += pending.eq((pending & ~ack) | (port.stb & ~port.stall & ~refill))
+
+        if self.burst and dcache == None:
+            m.d.comb += port.bte.eq(wishbone.BurstTypeExt.LINEAR)
+            if icache == None and not self.registered and not self.pipelined:
+                # cti only depends on registers, so it is set when an access starts and
+                # held until its ack. The read of the opcode word in instruction state 1
+                # is INCR_BURST, nearly every instruction reads ip + 1 next; the access
+                # that continues a burst otherwise is its END_OF_BURST.
+                in_burst = Signal()
+                opcode_fetch = Signal()
+                m.d.comb += opcode_fetch.eq(fetch & (core.instr_state == 1))
+                with m.If(opcode_fetch):
+                    m.d.comb += port.cti.eq(wishbone.CycleType.INCR_BURST)
+                with m.Elif(in_burst):
+                    m.d.comb += port.cti.eq(wishbone.CycleType.END_OF_BURST)
+                with m.Else():
+                    m.d.comb += port.cti.eq(wishbone.CycleType.CLASSIC)
+                with m.If(ack):
+                    m.d.sync += in_burst.eq(sequential)
+
+                # An instruction that does not read ip + 1 after its opcode ends the
+                # burst by dropping cyc for a cycle, the core stalls meanwhile
+                ending = Signal()
+                m.d.sync += ending.eq(ack & opcode_fetch & ~sequential)
+                with m.If(ending):
+                    m.d.comb += [
+                        port.cyc.eq(0),
+                        port.stb.eq(0)
+                    ]
+            else:
+                m.d.comb += port.cti.eq(wishbone.CycleType.CLASSIC)
+
+        if self.harvard and dcache == None:
+            # Fetches to ibus, the rest to dbus
+            for bus, selected in ((ibus, fetch), (dbus, ~fetch)):
+                m.d.comb += [
+                    bus.adr.eq(port.adr),
+                    bus.dat_w.eq(port.dat_w),
+                    bus.we.eq(port.we),
+                    bus.sel.eq(port.sel),
+                    bus.cyc.eq(port.cyc),
+                    bus.stb.eq(port.stb & selected)
+                ]
+                if self.burst:
+                    m.d.comb += [
+                        bus.cti.eq(port.cti),
+                        bus.bte.eq(port.bte)
+                    ]
+            m.d.comb += [
+                port.ack.eq(Mux(fetch, ibus.ack, dbus.ack)),
+                port.dat_r.eq(Mux(fetch, ibus.dat_r, dbus.dat_r)),
+                port.stall.eq(Mux(fetch, ibus.stall, dbus.stall) if self.pipelined else 0)
+            ]
+        elif self.harvard:
+            m.d.comb += [
+                ibus.sel.eq(1),
+                ibus.cyc.eq(1)
+            ]
+
+        m.d.comb += core.stall.eq(request & ~ack)
+
+        if icache != None:
+            with m.If(icache.refill):
+                m.d.comb += [
+                    ibus.adr.eq(icache.bus_adr),
+                    ibus.we.eq(0),
+                    ibus.stb.eq(icache.bus_stb)
+                ]
+                if self.burst:
+                    m.d.comb += ibus.cti.eq(icache.bus_cti)
+            with m.If(icache.lookup & ~icache.hit):
+                m.d.comb += core.stall.eq(1)
+
+        if icache != None or dcache != None:
+            with m.If(maintenance & ~op_done):
+                m.d.comb += core.stall.eq(1)
+
+        if self.registered:
+            for inner_bus, bus in zip(inner, outer):
+                self._register(m, inner_bus, bus)
+
+        return m
+
+    def _register(self, m: Module, port: _Port, bus):
+        """
+        Register slice from port to bus. A request on port is taken when the
+        slice is empty and reaches bus on the next cycle, ack and dat_r of bus
+        come back to port one cycle late. In classic mode the request still on
+        port while its ack comes back is not taken again.
+        """
+        busy = Signal()
+        ack = Signal()
+        dat_r = Signal(32)
+
+        m.d.comb += [
+            bus.sel.eq(port.sel),
+            bus.cyc.eq(port.cyc),
+            bus.stb.eq(busy),
+            port.ack.eq(ack),
+            port.dat_r.eq(dat_r)
+        ]
+        m.d.sync += [
+            ack.eq(bus.ack),
+            dat_r.eq(bus.dat_r)
+        ]
+
+        taken = Signal()
+        if self.pipelined:
+            m.d.comb += [
+                port.stall.eq(busy),
+                taken.eq(~busy & port.cyc & port.stb)
+            ]
+            with m.If(busy & ~bus.stall):
+                m.d.sync += busy.eq(0)
+        else:
+            m.d.comb += taken.eq(~busy & ~ack & port.cyc & port.stb)
+            with m.If(busy & bus.ack):
+                m.d.sync += busy.eq(0)
+
+        with m.If(taken):
+            m.d.sync += [
+                busy.eq(1),
+                bus.adr.eq(port.adr),
+                bus.dat_w.eq(port.dat_w),
+                bus.we.eq(port.we)
+            ]
+            if self.burst:
+                m.d.sync += [
+                    bus.cti.eq(port.cti),
+                    bus.bte.eq(port.bte)
+                ]
+
+class WishboneMemory(wiring.Component):
+    """
+    Wishbone slave over a MemoryImage for simulation. An access is acknowledged
+    after latency wait states, so the core stalls like behind SRAM/SDRAM in the SoC.
+    burst:     after a transfer with cti INCR_BURST the access to the next
+               address is acknowledged without wait states
+    pipelined: B4 pipelined mode, requests are accepted when no other one is in
+               flight and acknowledged latency + 1 cycles later
+    harvard:   ibus and dbus instead of bus, two independent ports on the same memory
+    """
+    def __init__(self, image: MemoryImage, latency: int = 0, *, burst: bool = False, pipelined: bool = False, harvard: bool = False):
+        self.image = image
+        self.latency = latency
+        self.burst = burst
+        self.pipelined = pipelined
+        self.harvard = harvard
+
+        self.mem = Memory(width=32, depth=image.depth, init=image.init_words())
+
+        features = set()
+        if burst:
+            features |= {wishbone.Feature.CTI, wishbone.Feature.BTE}
+        if pipelined:
+            features.add(wishbone.Feature.STALL)
+        bus_signature = wishbone.Signature(addr_width=32, data_width=32, granularity=32, features=features)
+
+        if harvard:
+            super().__init__({"ibus": wiring.In(bus_signature), "dbus": wiring.In(bus_signature)})
+        else:
+            super().__init__({"bus": wiring.In(bus_signature)})
+
+    def elaborate(self, platform):
+        m = Module()
+        m.submodules.mem = self.mem
+        if self.harvard:
+            self._port(m, self.ibus)
+            self._port(m, self.dbus)
+        else:
+            self._port(m, self.bus)
+        return m
+
+    def _port(self, m: Module, bus):
+        read = self.mem.read_port(domain="comb")
+        write = self.mem.write_port()
+        wait = Signal(range(self.latency + 2))
+
+        if self.pipelined:
+            # The request is latched, the bus only holds it while stb is high
+            busy = Signal()
+            adr = Signal(32)
+            m.d.comb += [
+                bus.stall.eq(busy & ~bus.ack),
+                read.addr.eq(adr),
+                write.addr.eq(bus.adr),
+                write.data.eq(bus.dat_w),
+                bus.dat_r.eq(read.data)
+            ]
+            with m.If(busy):
+                with m.If(wait == self.latency):
+                    m.d.comb += bus.ack.eq(1)
+                    m.d.sync += [
+                        busy.eq(0),
+                        wait.eq(0)
+                    ]
+                with m.Else():
+                    m.d.sync += wait.eq(wait + 1)
+            with m.If(bus.cyc & bus.stb & ~bus.stall):
+                m.d.comb += write.en.eq(bus.we)
+                m.d.sync += [
+                    busy.eq(1),
+                    adr.eq(bus.adr),
+                    wait.eq(0)
+                ]
+            return
+
+        m.d.comb += [
+            read.addr.eq(bus.adr),
+            write.addr.eq(bus.adr),
+            bus.dat_r.eq(read.data),
+            write.data.eq(bus.dat_w)
         ]
 
-        m.d.comb += core.stall.eq(self.bus.stb & ~self.bus.ack)
+        # Address the burst continues at, valid after a transfer with INCR_BURST
+        burst_adr = Signal(32)
+        burst_valid = Signal()
+        continues = Signal()
+        if self.burst:
+            m.d.comb += continues.eq(burst_valid & (bus.adr == burst_adr) & ~bus.we)
 
-        return m
\ No newline at end of file
+        with m.If(bus.cyc & bus.stb):
+            with m.If(continues | (wait == self.latency)):
+                m.d.comb += [
+                    bus.ack.eq(1),
+                    write.en.eq(bus.we)
+                ]
+                m.d.sync += wait.eq(0)
+                if self.burst:
+                    m.d.sync += [
+                        burst_adr.eq(bus.adr + 1),
+                        burst_valid.eq(bus.cti == wishbone.CycleType.INCR_BURST)
+                    ]
+            with m.Else():
+                m.d.sync += wait.eq(wait + 1)
+        with m.Else():
+            m.d.sync += [
+                wait.eq(0),
+                burst_valid.eq(0)
+            ]
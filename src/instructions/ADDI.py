@@ -15,14 +15,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _ADDI(m: Module, core: "Core", register: Signal):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
+        with core.operand_state(m, 1) as (operand, _):
             m.d.sync += [
-                core.addr.eq(core.data_in),
+                core.addr.eq(operand),
                 core.instr_state.eq(3)
             ]
         with m.Case(3):
@@ -44,6 +43,20 @@ def ADDB_exec(m: Module, core):
 def ADDX_exec(m: Module, core):
     _ADDI(m, core, core.rx)
 
-Instruction(0xE0, "ADDA", ADDA_exec, 0x2)
-Instruction(0xE1, "ADDB", ADDB_exec, 0x2)
-Instruction(0xE2, "ADDX", ADDX_exec, 0x2)
\ No newline at end of file
+def _ADDI_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.ADD, sim.reg(register), sim.read(sim.operand())))
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+def ADDA_sim(sim):
+    return _ADDI_sim(sim, "ra")
+
+def ADDB_sim(sim):
+    return _ADDI_sim(sim, "rb")
+
+def ADDX_sim(sim):
+    return _ADDI_sim(sim, "rx")
+
+Instruction(0xE0, "ADDA", ADDA_exec, 0x2, simFunc=ADDA_sim)
+Instruction(0xE1, "ADDB", ADDB_exec, 0x2, simFunc=ADDB_sim)
+Instruction(0xE2, "ADDX", ADDX_exec, 0x2, simFunc=ADDX_sim)
\ No newline at end of file
@@ -15,19 +15,19 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _ADDI_ABS(m: Module, core: "Core", register: Signal):
-    with m.If(core.instr_state == 1):
-        core.advance_ip_goto_state(m, 2)
-    with m.Else():
-        m.d.comb += [
-            core.alu_1.eq(register),
-            core.alu_2.eq(core.data_in),
-            core.alu_op.eq(AluOps.ADD),
-            core.alu_en.eq(1)
-        ]
-        m.d.sync += register.eq(core.alu_out)
-        core.end_instr(m, core.ip + 1)
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, ip):
+            m.d.comb += [
+                core.alu_1.eq(register),
+                core.alu_2.eq(operand),
+                core.alu_op.eq(AluOps.ADD),
+                core.alu_en.eq(1)
+            ]
+            m.d.sync += register.eq(core.alu_out)
+            core.end_instr(m, ip + 1)
 
 def ADDA_ABS_exec(m: Module, core):
     _ADDI_ABS(m, core, core.ra)
@@ -38,6 +38,20 @@ def ADDB_ABS_exec(m: Module, core):
 def ADDX_ABS_exec(m: Module, core):
     _ADDI_ABS(m, core, core.rx)
 
-Instruction(0x30, "ADDA_ABS", ADDA_ABS_exec, 0x2)
-Instruction(0x31, "ADDB_ABS", ADDB_ABS_exec, 0x2)
-Instruction(0x32, "ADDX_ABS", ADDX_ABS_exec, 0x2)
\ No newline at end of file
+def _ADDI_ABS_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.ADD, sim.reg(register), sim.operand()))
+    sim.end_instr(sim.ip + 2)
+    return 2 + sim.operandCycles
+
+def ADDA_ABS_sim(sim):
+    return _ADDI_ABS_sim(sim, "ra")
+
+def ADDB_ABS_sim(sim):
+    return _ADDI_ABS_sim(sim, "rb")
+
+def ADDX_ABS_sim(sim):
+    return _ADDI_ABS_sim(sim, "rx")
+
+Instruction(0x30, "ADDA_ABS", ADDA_ABS_exec, 0x2, simFunc=ADDA_ABS_sim)
+Instruction(0x31, "ADDB_ABS", ADDB_ABS_exec, 0x2, simFunc=ADDB_ABS_sim)
+Instruction(0x32, "ADDX_ABS", ADDX_ABS_exec, 0x2, simFunc=ADDX_ABS_sim)
\ No newline at end of file
@@ -0,0 +1,59 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+# dst, src register forms: dst is register field 0, src register field 1.
+# They run in the execute cycle that decodes them, no operand word is read.
+def _exec(m: Module, core: "Core", op: AluOps, write: bool = True):
+    m.d.comb += [
+        core.alu_1.eq(core.field_reg(0)),
+        core.alu_2.eq(core.field_reg(1)),
+        core.alu_op.eq(op),
+        core.alu_en.eq(1)
+    ]
+    if write:
+        core.set_field_reg(m, 0, core.alu_out)
+    core.end_instr(m, core.ip + 1)
+
+def ADD_exec(m: Module, core):
+    _exec(m, core, AluOps.ADD)
+
+def SUB_exec(m: Module, core):
+    _exec(m, core, AluOps.SUB)
+
+def CMP_exec(m: Module, core):
+    _exec(m, core, AluOps.SUB, write=False)
+
+def _sim(sim: "ISASimulator", op: AluOps, write: bool = True) -> int:
+    out = sim.alu(op, sim.field_reg(0), sim.field_reg(1))
+    if write:
+        sim.set_field_reg(0, out)
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def ADD_sim(sim):
+    return _sim(sim, AluOps.ADD)
+
+def SUB_sim(sim):
+    return _sim(sim, AluOps.SUB)
+
+def CMP_sim(sim):
+    return _sim(sim, AluOps.SUB, write=False)
+
+Instruction(0x50, "ADD", ADD_exec, simFunc=ADD_sim, regFields=2)
+Instruction(0x51, "SUB", SUB_exec, simFunc=SUB_sim, regFields=2)
+Instruction(0x52, "CMP", CMP_exec, simFunc=CMP_sim, regFields=2)
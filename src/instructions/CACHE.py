@@ -0,0 +1,43 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+# The wrapper holds core.stall in state 2 until the caches are done, without caches these are NOPs
+def _execute(m: Module, core: "Core", op: CacheOps):
+    with m.Switch(core.instr_state):
+        with m.Case(1):
+            m.d.sync += [
+                core.cache_op.eq(op),
+                core.instr_state.eq(2)
+            ]
+        with m.Case(2):
+            m.d.sync += core.cache_op.eq(CacheOps.NONE)
+            core.end_instr(m, core.ip + 1)
+
+def FLUSH_exec(m: Module, core):
+    _execute(m, core, CacheOps.FLUSH)
+
+def INVAL_exec(m: Module, core):
+    _execute(m, core, CacheOps.INVALIDATE)
+
+def _sim(sim: "ISASimulator") -> int:
+    sim.end_instr(sim.ip + 1)
+    return 3
+
+Instruction(0xF4, "FLUSH", FLUSH_exec, simFunc=_sim)
+Instruction(0xF5, "INVAL", INVAL_exec, simFunc=_sim)
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core", flag, invert: bool = False):
     if invert:
@@ -22,10 +23,8 @@ def _exec(m: Module, core: "Core", flag, invert: bool = False):
 
     with m.If(flag):
         with m.Switch(core.instr_state):
-            with m.Case(2):
-                core.end_instr(m, core.data_in)
-            with m.Default():
-                core.advance_ip_goto_state(m, 2)
+            with core.operand_state(m, 1) as (operand, _):
+                core.end_instr(m, operand)
     with m.Else():
         core.end_instr(m, core.ip + 3)
 
@@ -47,10 +46,35 @@ def _JIE_exec(m: Module, core: "Core"):
 def _JNE_exec(m: Module, core: "Core"):
     _exec(m, core, core.flags[Flags.ERROR], True)
 
+def _sim(sim: "ISASimulator", flag: Flags, invert: bool = False) -> int:
+    if sim.flag(flag) != invert:
+        sim.end_instr(sim.operand())
+        return 2 + sim.operandCycles
+    sim.end_instr(sim.ip + 3)
+    return 2
 
-Instruction(0x11, "JIZ", _JIZ_exec, 0x03)
-Instruction(0x12, "JNZ", _JNZ_exec, 0x03)
-Instruction(0x13, "JIC", _JIC_exec, 0x03)
-Instruction(0x14, "JNC", _JNC_exec, 0x03)
-Instruction(0x15, "JIE", _JIE_exec, 0x03)
-Instruction(0x16, "JNE", _JNE_exec, 0x03)
\ No newline at end of file
+def _JIZ_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.ZERO)
+
+def _JNZ_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.ZERO, True)
+
+def _JIC_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.CARRY)
+
+def _JNC_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.CARRY, True)
+
+def _JIE_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.ERROR)
+
+def _JNE_sim(sim: "ISASimulator"):
+    return _sim(sim, Flags.ERROR, True)
+
+
+Instruction(0x11, "JIZ", _JIZ_exec, 0x03, simFunc=_JIZ_sim, operandWords=1)
+Instruction(0x12, "JNZ", _JNZ_exec, 0x03, simFunc=_JNZ_sim, operandWords=1)
+Instruction(0x13, "JIC", _JIC_exec, 0x03, simFunc=_JIC_sim, operandWords=1)
+Instruction(0x14, "JNC", _JNC_exec, 0x03, simFunc=_JNC_sim, operandWords=1)
+Instruction(0x15, "JIE", _JIE_exec, 0x03, simFunc=_JIE_sim, operandWords=1)
+Instruction(0x16, "JNE", _JNE_exec, 0x03, simFunc=_JNE_sim, operandWords=1)
\ No newline at end of file
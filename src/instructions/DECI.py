@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core", register: Signal):
     m.d.comb += [
@@ -34,6 +35,20 @@ def _exec_DECB(m: Module, core: "Core"):
 def _exec_DECX(m: Module, core: "Core"):
     _exec(m, core, core.rx)
 
-Instruction(0x39, "DECA", _exec_DECA)
-Instruction(0x3A, "DECB", _exec_DECB)
-Instruction(0x3B, "DECX", _exec_DECX)
\ No newline at end of file
+def _sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.DEC, sim.reg(register)))
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def _sim_DECA(sim: "ISASimulator"):
+    return _sim(sim, "ra")
+
+def _sim_DECB(sim: "ISASimulator"):
+    return _sim(sim, "rb")
+
+def _sim_DECX(sim: "ISASimulator"):
+    return _sim(sim, "rx")
+
+Instruction(0x39, "DECA", _exec_DECA, simFunc=_sim_DECA)
+Instruction(0x3A, "DECB", _exec_DECB, simFunc=_sim_DECB)
+Instruction(0x3B, "DECX", _exec_DECX, simFunc=_sim_DECX)
\ No newline at end of file
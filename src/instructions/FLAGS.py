@@ -15,9 +15,11 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _execute(m: Module, core: "Core", flag: Flags, value: int):
     m.d.sync += core.flags[flag].eq(value)
+    core.end_instr(m, core.ip + 1)
 
 def _SCF(m: Module, core):
     _execute(m, core, Flags.CARRY, 1)
@@ -31,7 +33,24 @@ def _SEF(m: Module, core):
 def _CEF(m: Module, core):
     _execute(m, core, Flags.ERROR, 0)
 
-Instruction(0xF0, "SCF", _SCF)
-Instruction(0xF1, "CCF", _CCF)
-Instruction(0xF2, "SEF", _SEF)
-Instruction(0xF3, "CEF", _CEF)
\ No newline at end of file
+def _sim(sim: "ISASimulator", flag: Flags, value: int) -> int:
+    sim.set_flag(flag, value)
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def _SCF_sim(sim):
+    return _sim(sim, Flags.CARRY, 1)
+
+def _CCF_sim(sim):
+    return _sim(sim, Flags.CARRY, 0)
+
+def _SEF_sim(sim):
+    return _sim(sim, Flags.ERROR, 1)
+
+def _CEF_sim(sim):
+    return _sim(sim, Flags.ERROR, 0)
+
+Instruction(0xF0, "SCF", _SCF, simFunc=_SCF_sim)
+Instruction(0xF1, "CCF", _CCF, simFunc=_CCF_sim)
+Instruction(0xF2, "SEF", _SEF, simFunc=_SEF_sim)
+Instruction(0xF3, "CEF", _CEF, simFunc=_CEF_sim)
\ No newline at end of file
@@ -14,8 +14,14 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def HALT_exec(m: Module, core: "Core"):
     core.end_instr(m, core.ip)
 
-Instruction(0x00, "HALT", HALT_exec)
\ No newline at end of file
+def HALT_sim(sim: "ISASimulator") -> int:
+    sim.halted = True
+    sim.end_instr(sim.ip)
+    return 2
+
+Instruction(0x00, "HALT", HALT_exec, simFunc=HALT_sim)
\ No newline at end of file
@@ -0,0 +1,128 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from include.hash import hash_word
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+def _fold(m: Module, core: "Core", op: HashOps, word):
+    m.d.comb += [
+        core.hash.op.eq(op),
+        core.hash.data.eq(word),
+        core.hash.start.eq(1)
+    ]
+
+# HSET src, CRC32 src, ...: one word from register field 0
+def _word(m: Module, core: "Core", op: HashOps):
+    _fold(m, core, op, core.field_reg(0))
+    core.end_instr(m, core.ip + 1)
+
+# CRC32S count, ...: folds count (register field 0) words from rx on, one per cycle,
+# and leaves rx after the last one
+def _stream(m: Module, core: "Core", op: HashOps):
+    with m.Switch(core.instr_state):
+        with m.Case(1):
+            m.d.sync += [
+                core.tmp32.eq(core.field_reg(0)),
+                core.addr.eq(core.rx),
+                core.RW.eq(1),
+                core.instr_state.eq(2)
+            ]
+            with m.If(core.field_reg(0) == 0):
+                core.end_instr(m, core.ip + 1)
+        with m.Case(2):
+            _fold(m, core, op, core.data_in)
+            m.d.sync += [
+                core.rx.eq(core.rx + 1),
+                core.addr.eq(core.addr + 1),
+                core.tmp32.eq(core.tmp32 - 1)
+            ]
+            with m.If(core.tmp32 == 1):
+                core.end_instr(m, core.ip + 1)
+            with m.Else():
+                m.d.comb += core.addr_incr.eq(1)
+
+def HGET_exec(m: Module, core: "Core"):
+    core.set_field_reg(m, 0, core.hash.value)
+    core.end_instr(m, core.ip + 1)
+
+def HSET_exec(m: Module, core):
+    _word(m, core, HashOps.SET)
+
+def CRC32_exec(m: Module, core):
+    _word(m, core, HashOps.CRC32)
+
+def FNV1A_exec(m: Module, core):
+    _word(m, core, HashOps.FNV1A)
+
+def MURMUR_exec(m: Module, core):
+    _word(m, core, HashOps.MURMUR)
+
+def CRC32S_exec(m: Module, core):
+    _stream(m, core, HashOps.CRC32)
+
+def FNV1AS_exec(m: Module, core):
+    _stream(m, core, HashOps.FNV1A)
+
+def MURMURS_exec(m: Module, core):
+    _stream(m, core, HashOps.MURMUR)
+
+def _word_sim(sim: "ISASimulator", op: HashOps) -> int:
+    sim.hash_state = hash_word(op, sim.hash_state, sim.field_reg(0))
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def _stream_sim(sim: "ISASimulator", op: HashOps) -> int:
+    count = sim.field_reg(0)
+    for i in range(count):
+        sim.hash_state = hash_word(op, sim.hash_state, sim.read(sim.rx + i))
+    sim.set_reg("rx", sim.rx + count)
+    sim.end_instr(sim.ip + 1)
+    return 2 + count
+
+def HGET_sim(sim: "ISASimulator"):
+    sim.set_field_reg(0, sim.hash_state)
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def HSET_sim(sim):
+    return _word_sim(sim, HashOps.SET)
+
+def CRC32_sim(sim):
+    return _word_sim(sim, HashOps.CRC32)
+
+def FNV1A_sim(sim):
+    return _word_sim(sim, HashOps.FNV1A)
+
+def MURMUR_sim(sim):
+    return _word_sim(sim, HashOps.MURMUR)
+
+def CRC32S_sim(sim):
+    return _stream_sim(sim, HashOps.CRC32)
+
+def FNV1AS_sim(sim):
+    return _stream_sim(sim, HashOps.FNV1A)
+
+def MURMURS_sim(sim):
+    return _stream_sim(sim, HashOps.MURMUR)
+
+Instruction(0x80, "HSET", HSET_exec, simFunc=HSET_sim, regFields=1)
+Instruction(0x81, "HGET", HGET_exec, simFunc=HGET_sim, regFields=1)
+Instruction(0x82, "CRC32", CRC32_exec, simFunc=CRC32_sim, regFields=1)
+Instruction(0x83, "FNV1A", FNV1A_exec, simFunc=FNV1A_sim, regFields=1)
+Instruction(0x84, "MURMUR", MURMUR_exec, simFunc=MURMUR_sim, regFields=1)
+Instruction(0x86, "CRC32S", CRC32S_exec, simFunc=CRC32S_sim, regFields=1)
+Instruction(0x87, "FNV1AS", FNV1AS_exec, simFunc=FNV1AS_sim, regFields=1)
+Instruction(0x88, "MURMURS", MURMURS_exec, simFunc=MURMURS_sim, regFields=1)
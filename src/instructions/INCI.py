@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core", register: Signal):
     m.d.comb += [
@@ -34,6 +35,20 @@ def _exec_INCB(m: Module, core: "Core"):
 def _exec_INCX(m: Module, core: "Core"):
     _exec(m, core, core.rx)
 
-Instruction(0x36, "INCA", _exec_INCA)
-Instruction(0x37, "INCB", _exec_INCB)
-Instruction(0x38, "INCX", _exec_INCX)
\ No newline at end of file
+def _sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.INC, sim.reg(register)))
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def _sim_INCA(sim: "ISASimulator"):
+    return _sim(sim, "ra")
+
+def _sim_INCB(sim: "ISASimulator"):
+    return _sim(sim, "rb")
+
+def _sim_INCX(sim: "ISASimulator"):
+    return _sim(sim, "rx")
+
+Instruction(0x36, "INCA", _exec_INCA, simFunc=_sim_INCA)
+Instruction(0x37, "INCB", _exec_INCB, simFunc=_sim_INCB)
+Instruction(0x38, "INCX", _exec_INCX, simFunc=_sim_INCX)
\ No newline at end of file
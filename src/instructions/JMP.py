@@ -14,12 +14,15 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def JMP_exec(m: Module, core:"Core"):
     with m.Switch(core.instr_state):
-        with m.Case(2):
-            core.end_instr(m, core.data_in)
-        with m.Default():
-            core.advance_ip_goto_state(m, 2)
+        with core.operand_state(m, 1) as (operand, _):
+            core.end_instr(m, operand)
 
-Instruction(0x10, "JMP", JMP_exec, 0x3)
\ No newline at end of file
+def JMP_sim(sim: "ISASimulator") -> int:
+    sim.end_instr(sim.operand())
+    return 2 + sim.operandCycles
+
+Instruction(0x10, "JMP", JMP_exec, 0x3, simFunc=JMP_sim, operandWords=1)
\ No newline at end of file
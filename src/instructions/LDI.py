@@ -14,16 +14,15 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 _length = 0x2
 
 def _LDI(m: Module, core:"Core", register: Signal):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
+        with core.operand_state(m, 1) as (operand, _):
             m.d.sync += [
-                core.addr.eq(core.data_in),
+                core.addr.eq(operand),
                 core.instr_state.eq(3)
             ]
         with m.Case(3):
@@ -41,6 +40,21 @@ def LDB_exec(m: Module, core):
 def LDX_exec(m: Module, core):
     _LDI(m, core, core.rx)
 
-Instruction(0xD0, "LDA", LDA_exec, _length)
-Instruction(0xD1, "LDB", LDB_exec, _length)
-Instruction(0xD2, "LDX", LDX_exec, _length)
\ No newline at end of file
+def _LDI_sim(sim: "ISASimulator", register: str) -> int:
+    value = sim.read(sim.operand())
+    sim.set_reg(register, value)
+    sim.set_flag(Flags.NEGATIVE, value >> 31)
+    sim.set_flag(Flags.ZERO, value == 0)
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+def LDA_sim(sim):
+    return _LDI_sim(sim, "ra")
+def LDB_sim(sim):
+    return _LDI_sim(sim, "rb")
+def LDX_sim(sim):
+    return _LDI_sim(sim, "rx")
+
+Instruction(0xD0, "LDA", LDA_exec, _length, simFunc=LDA_sim)
+Instruction(0xD1, "LDB", LDB_exec, _length, simFunc=LDB_sim)
+Instruction(0xD2, "LDX", LDX_exec, _length, simFunc=LDX_sim)
\ No newline at end of file
@@ -15,19 +15,19 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 _length = 0x2
 
 def _LDI_ABS(m: Module, core:"Core", register: Signal):
-    with m.If(core.instr_state == 1):
-        core.advance_ip_goto_state(m, 2)
-    with m.Else():
-        m.d.sync += [
-            register.eq(core.data_in),
-            core.flags[Flags.NEGATIVE].eq(core.data_in < 0),
-            core.flags[Flags.ZERO].eq(core.data_in == 0),
-        ]
-        core.end_instr(m, core.ip + 1)
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, ip):
+            m.d.sync += [
+                register.eq(operand),
+                core.flags[Flags.NEGATIVE].eq(operand < 0),
+                core.flags[Flags.ZERO].eq(operand == 0),
+            ]
+            core.end_instr(m, ip + 1)
 
 def LDA_ABS_exec(m: Module, core):
     _LDI_ABS(m, core, core.ra)
@@ -36,6 +36,21 @@ def LDB_ABS_exec(m: Module, core):
 def LDX_ABS_exec(m: Module, core):
     _LDI_ABS(m, core, core.rx)
 
-Instruction(0x20, "LDA_ABS", LDA_ABS_exec, _length)
-Instruction(0x21, "LDB_ABS", LDB_ABS_exec, _length)
-Instruction(0x22, "LDX_ABS", LDX_ABS_exec, _length)
\ No newline at end of file
+def _LDI_ABS_sim(sim: "ISASimulator", register: str) -> int:
+    value = sim.operand()
+    sim.set_reg(register, value)
+    sim.set_flag(Flags.NEGATIVE, value >> 31)
+    sim.set_flag(Flags.ZERO, value == 0)
+    sim.end_instr(sim.ip + 2)
+    return 2 + sim.operandCycles
+
+def LDA_ABS_sim(sim):
+    return _LDI_ABS_sim(sim, "ra")
+def LDB_ABS_sim(sim):
+    return _LDI_ABS_sim(sim, "rb")
+def LDX_ABS_sim(sim):
+    return _LDI_ABS_sim(sim, "rx")
+
+Instruction(0x20, "LDA_ABS", LDA_ABS_exec, _length, simFunc=LDA_ABS_sim)
+Instruction(0x21, "LDB_ABS", LDB_ABS_exec, _length, simFunc=LDB_ABS_sim)
+Instruction(0x22, "LDX_ABS", LDX_ABS_exec, _length, simFunc=LDX_ABS_sim)
\ No newline at end of file
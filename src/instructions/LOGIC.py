@@ -0,0 +1,247 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+_shifts = (AluOps.SHL, AluOps.SHR, AluOps.SAR, AluOps.ROL, AluOps.ROR)
+
+# Every form takes the destination in register field 0: OP dst, src (register field 1),
+# OP_ABS dst, value and OP_MEM dst, address. Shifts and rotates move by the low 5 bits of the source.
+def _alu(m: Module, core: "Core", op: AluOps, operand):
+    m.d.comb += [
+        core.alu_1.eq(core.field_reg(0)),
+        core.alu_2.eq(operand)
+    ]
+    if op in _shifts:
+        core.shift(m, op)
+    else:
+        m.d.comb += [
+            core.alu_op.eq(op),
+            core.alu_en.eq(1)
+        ]
+    core.set_field_reg(m, 0, core.alu_out)
+
+def _reg(m: Module, core: "Core", op: AluOps):
+    _alu(m, core, op, core.field_reg(1))
+    core.end_instr(m, core.ip + 1)
+
+def _abs(m: Module, core: "Core", op: AluOps):
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, ip):
+            _alu(m, core, op, operand)
+            core.end_instr(m, ip + 1)
+
+def _mem(m: Module, core: "Core", op: AluOps):
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, _):
+            m.d.sync += [
+                core.addr.eq(operand),
+                core.instr_state.eq(3)
+            ]
+        with m.Case(3):
+            _alu(m, core, op, core.data_in)
+            core.end_instr(m, core.ip + 1)
+
+def _reg_sim(sim: "ISASimulator", op: AluOps) -> int:
+    sim.set_field_reg(0, sim.alu(op, sim.field_reg(0), sim.field_reg(1)))
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def _abs_sim(sim: "ISASimulator", op: AluOps) -> int:
+    sim.set_field_reg(0, sim.alu(op, sim.field_reg(0), sim.operand()))
+    sim.end_instr(sim.ip + 2)
+    return 2 + sim.operandCycles
+
+def _mem_sim(sim: "ISASimulator", op: AluOps) -> int:
+    sim.set_field_reg(0, sim.alu(op, sim.field_reg(0), sim.read(sim.operand())))
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+def AND_exec(m: Module, core):
+    _reg(m, core, AluOps.AND)
+
+def AND_sim(sim):
+    return _reg_sim(sim, AluOps.AND)
+
+def AND_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.AND)
+
+def AND_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.AND)
+
+def AND_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.AND)
+
+def AND_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.AND)
+
+def OR_exec(m: Module, core):
+    _reg(m, core, AluOps.OR)
+
+def OR_sim(sim):
+    return _reg_sim(sim, AluOps.OR)
+
+def OR_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.OR)
+
+def OR_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.OR)
+
+def OR_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.OR)
+
+def OR_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.OR)
+
+def XOR_exec(m: Module, core):
+    _reg(m, core, AluOps.XOR)
+
+def XOR_sim(sim):
+    return _reg_sim(sim, AluOps.XOR)
+
+def XOR_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.XOR)
+
+def XOR_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.XOR)
+
+def XOR_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.XOR)
+
+def XOR_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.XOR)
+
+def NOT_exec(m: Module, core):
+    _reg(m, core, AluOps.NOT)
+
+def NOT_sim(sim):
+    return _reg_sim(sim, AluOps.NOT)
+
+def SHL_exec(m: Module, core):
+    _reg(m, core, AluOps.SHL)
+
+def SHL_sim(sim):
+    return _reg_sim(sim, AluOps.SHL)
+
+def SHL_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.SHL)
+
+def SHL_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.SHL)
+
+def SHL_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.SHL)
+
+def SHL_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.SHL)
+
+def SHR_exec(m: Module, core):
+    _reg(m, core, AluOps.SHR)
+
+def SHR_sim(sim):
+    return _reg_sim(sim, AluOps.SHR)
+
+def SHR_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.SHR)
+
+def SHR_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.SHR)
+
+def SHR_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.SHR)
+
+def SHR_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.SHR)
+
+def SAR_exec(m: Module, core):
+    _reg(m, core, AluOps.SAR)
+
+def SAR_sim(sim):
+    return _reg_sim(sim, AluOps.SAR)
+
+def SAR_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.SAR)
+
+def SAR_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.SAR)
+
+def SAR_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.SAR)
+
+def SAR_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.SAR)
+
+def ROL_exec(m: Module, core):
+    _reg(m, core, AluOps.ROL)
+
+def ROL_sim(sim):
+    return _reg_sim(sim, AluOps.ROL)
+
+def ROL_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.ROL)
+
+def ROL_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.ROL)
+
+def ROL_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.ROL)
+
+def ROL_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.ROL)
+
+def ROR_exec(m: Module, core):
+    _reg(m, core, AluOps.ROR)
+
+def ROR_sim(sim):
+    return _reg_sim(sim, AluOps.ROR)
+
+def ROR_ABS_exec(m: Module, core):
+    _abs(m, core, AluOps.ROR)
+
+def ROR_ABS_sim(sim):
+    return _abs_sim(sim, AluOps.ROR)
+
+def ROR_MEM_exec(m: Module, core):
+    _mem(m, core, AluOps.ROR)
+
+def ROR_MEM_sim(sim):
+    return _mem_sim(sim, AluOps.ROR)
+
+Instruction(0x54, "AND", AND_exec, simFunc=AND_sim, regFields=2)
+Instruction(0x55, "OR", OR_exec, simFunc=OR_sim, regFields=2)
+Instruction(0x56, "XOR", XOR_exec, simFunc=XOR_sim, regFields=2)
+Instruction(0x57, "NOT", NOT_exec, simFunc=NOT_sim, regFields=1)
+Instruction(0x58, "AND_ABS", AND_ABS_exec, 0x2, simFunc=AND_ABS_sim, regFields=1)
+Instruction(0x59, "OR_ABS", OR_ABS_exec, 0x2, simFunc=OR_ABS_sim, regFields=1)
+Instruction(0x5A, "XOR_ABS", XOR_ABS_exec, 0x2, simFunc=XOR_ABS_sim, regFields=1)
+Instruction(0x5C, "AND_MEM", AND_MEM_exec, 0x2, simFunc=AND_MEM_sim, regFields=1)
+Instruction(0x5D, "OR_MEM", OR_MEM_exec, 0x2, simFunc=OR_MEM_sim, regFields=1)
+Instruction(0x5E, "XOR_MEM", XOR_MEM_exec, 0x2, simFunc=XOR_MEM_sim, regFields=1)
+Instruction(0x60, "SHL", SHL_exec, simFunc=SHL_sim, regFields=2)
+Instruction(0x61, "SHR", SHR_exec, simFunc=SHR_sim, regFields=2)
+Instruction(0x62, "SAR", SAR_exec, simFunc=SAR_sim, regFields=2)
+Instruction(0x63, "ROL", ROL_exec, simFunc=ROL_sim, regFields=2)
+Instruction(0x64, "ROR", ROR_exec, simFunc=ROR_sim, regFields=2)
+Instruction(0x68, "SHL_ABS", SHL_ABS_exec, 0x2, simFunc=SHL_ABS_sim, regFields=1)
+Instruction(0x69, "SHR_ABS", SHR_ABS_exec, 0x2, simFunc=SHR_ABS_sim, regFields=1)
+Instruction(0x6A, "SAR_ABS", SAR_ABS_exec, 0x2, simFunc=SAR_ABS_sim, regFields=1)
+Instruction(0x6B, "ROL_ABS", ROL_ABS_exec, 0x2, simFunc=ROL_ABS_sim, regFields=1)
+Instruction(0x6C, "ROR_ABS", ROR_ABS_exec, 0x2, simFunc=ROR_ABS_sim, regFields=1)
+Instruction(0x70, "SHL_MEM", SHL_MEM_exec, 0x2, simFunc=SHL_MEM_sim, regFields=1)
+Instruction(0x71, "SHR_MEM", SHR_MEM_exec, 0x2, simFunc=SHR_MEM_sim, regFields=1)
+Instruction(0x72, "SAR_MEM", SAR_MEM_exec, 0x2, simFunc=SAR_MEM_sim, regFields=1)
+Instruction(0x73, "ROL_MEM", ROL_MEM_exec, 0x2, simFunc=ROL_MEM_sim, regFields=1)
+Instruction(0x74, "ROR_MEM", ROR_MEM_exec, 0x2, simFunc=ROR_MEM_sim, regFields=1)
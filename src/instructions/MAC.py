@@ -0,0 +1,222 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from include.mac import mac_word
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+# TMAC tile side
+TILE = 4
+
+def _mac(m: Module, core: "Core", op: MacOps, a, b = 0):
+    m.d.comb += [
+        core.mac.op.eq(op),
+        core.mac.a.eq(a),
+        core.mac.b.eq(b),
+        core.mac.start.eq(1)
+    ]
+
+def MCLR_exec(m: Module, core: "Core"):
+    _mac(m, core, MacOps.SET, 0)
+    core.end_instr(m, core.ip + 1)
+
+def MSET_exec(m: Module, core: "Core"):
+    _mac(m, core, MacOps.SET, core.field_reg(0))
+    core.end_instr(m, core.ip + 1)
+
+def MGET_exec(m: Module, core: "Core"):
+    core.set_field_reg(m, 0, core.mac.value)
+    core.end_instr(m, core.ip + 1)
+
+# MAC a, b: acc += a * b
+def MAC_exec(m: Module, core: "Core"):
+    _mac(m, core, MacOps.MAC, core.field_reg(0), core.field_reg(1))
+    core.end_instr(m, core.ip + 1)
+
+# DOT: acc += dot product of the rx words from ra and from rb, two cycles a product.
+# ra and rb are left after the vectors and rx at 0.
+def DOT_exec(m: Module, core: "Core"):
+    with m.Switch(core.instr_state):
+        with m.Case(1):
+            m.d.sync += [
+                core.addr.eq(core.ra),
+                core.RW.eq(1),
+                core.instr_state.eq(2)
+            ]
+            with m.If(core.rx == 0):
+                core.end_instr(m, core.ip + 1)
+        with m.Case(2):
+            m.d.sync += [
+                core.tmp32.eq(core.data_in),
+                core.addr.eq(core.rb),
+                core.ra.eq(core.ra + 1),
+                core.instr_state.eq(3)
+            ]
+        with m.Case(3):
+            _mac(m, core, MacOps.MAC, core.tmp32, core.data_in)
+            m.d.sync += [
+                core.addr.eq(core.ra),
+                core.rb.eq(core.rb + 1),
+                core.rx.eq(core.rx - 1),
+                core.instr_state.eq(2)
+            ]
+            with m.If(core.rx == 1):
+                core.end_instr(m, core.ip + 1)
+
+# TMAC stride: C += A * B on 4x4 tiles of matrices with stride words per row,
+# A at ra, B at rb and C at rx. Each C word is read, gets its four products and
+# is written back, ten cycles a word. ra is left on the next tile to the right
+# and rb on the next tile below, so repeating TMAC walks a whole row of A tiles
+# against a column of B tiles into the same C tile. acc holds the last C word.
+def TMAC_exec(m: Module, core: "Core"):
+    # ra and rb are the A row and the B column of the C word at rx,
+    # tmp32 holds the stride, tmp32_2 the A word and tmp32_3 walks B down
+    stride = core.tmp32
+    k = core.tile_pos[0:2]
+    col = core.tile_pos[2:4]
+    row = core.tile_pos[4:6]
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, _):
+            m.d.sync += [
+                core.tmp32.eq(operand),
+                core.tile_pos.eq(0),
+                core.addr.eq(core.rx),
+                core.instr_state.eq(3)
+            ]
+        with m.Case(3):
+            _mac(m, core, MacOps.SET, core.data_in)
+            m.d.sync += [
+                core.addr.eq(core.ra),
+                core.tmp32_3.eq(core.rb),
+                core.instr_state.eq(4)
+            ]
+        with m.Case(4):
+            m.d.sync += [
+                core.tmp32_2.eq(core.data_in),
+                core.addr.eq(core.tmp32_3),
+                core.tmp32_3.eq(core.tmp32_3 + stride),
+                core.instr_state.eq(5)
+            ]
+        with m.Case(5):
+            _mac(m, core, MacOps.MAC, core.tmp32_2, core.data_in)
+            m.d.sync += core.tile_pos.eq(core.tile_pos + 1)
+            with m.If(k == TILE - 1):
+                # Next C word, read while the last product goes in. After the last
+                # word of the tile state 6 reads that word again, not past the tile.
+                with m.If(col != TILE - 1):
+                    m.d.sync += core.addr.eq(core.rx + 1)
+                with m.Elif(row != TILE - 1):
+                    m.d.sync += core.addr.eq(core.rx + stride - (TILE - 1))
+                with m.Else():
+                    m.d.sync += core.addr.eq(core.rx)
+                m.d.sync += core.instr_state.eq(6)
+            with m.Else():
+                m.d.sync += [
+                    core.addr.eq(core.ra + k + 1),
+                    core.instr_state.eq(4)
+                ]
+        with m.Case(6):
+            with m.If(core.tile_pos != 0):
+                _mac(m, core, MacOps.SET, core.data_in)
+            m.d.sync += [
+                core.data_out.eq(core.mac.value),
+                core.addr.eq(core.rx),
+                core.RW.eq(0),
+                core.instr_state.eq(7)
+            ]
+        with m.Case(7):
+            m.d.sync += [
+                core.RW.eq(1),
+                core.data_out.eq(0),
+                core.instr_state.eq(4)
+            ]
+            with m.If(core.tile_pos == 0):
+                # Back from the last word of the tile
+                tile_rows = (stride << 1) + stride
+                m.d.sync += [
+                    core.ra.eq(core.ra - tile_rows + TILE),
+                    core.rb.eq(core.rb - (TILE - 1) + tile_rows + stride),
+                    core.rx.eq(core.rx - tile_rows - (TILE - 1))
+                ]
+                core.end_instr(m, core.ip + 1)
+            with m.Elif(col == 0):
+                m.d.sync += [
+                    core.addr.eq(core.ra + stride),
+                    core.tmp32_3.eq(core.rb - (TILE - 1)),
+                    core.ra.eq(core.ra + stride),
+                    core.rb.eq(core.rb - (TILE - 1)),
+                    core.rx.eq(core.rx + stride - (TILE - 1))
+                ]
+            with m.Else():
+                m.d.sync += [
+                    core.addr.eq(core.ra),
+                    core.tmp32_3.eq(core.rb + 1),
+                    core.rb.eq(core.rb + 1),
+                    core.rx.eq(core.rx + 1)
+                ]
+
+def _word_sim(sim: "ISASimulator", op: MacOps, a: int, b: int = 0) -> int:
+    sim.mac_acc = mac_word(op, sim.mac_acc, a, b)
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def MCLR_sim(sim: "ISASimulator"):
+    return _word_sim(sim, MacOps.SET, 0)
+
+def MSET_sim(sim: "ISASimulator"):
+    return _word_sim(sim, MacOps.SET, sim.field_reg(0))
+
+def MGET_sim(sim: "ISASimulator"):
+    sim.set_field_reg(0, sim.mac_acc)
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+def MAC_sim(sim: "ISASimulator"):
+    return _word_sim(sim, MacOps.MAC, sim.field_reg(0), sim.field_reg(1))
+
+def DOT_sim(sim: "ISASimulator"):
+    count = sim.rx
+    for i in range(count):
+        sim.mac_acc = mac_word(MacOps.MAC, sim.mac_acc, sim.read(sim.ra + i), sim.read(sim.rb + i))
+    sim.set_reg("ra", sim.ra + count)
+    sim.set_reg("rb", sim.rb + count)
+    sim.set_reg("rx", 0)
+    sim.end_instr(sim.ip + 1)
+    return 2 + 2 * count
+
+def TMAC_sim(sim: "ISASimulator"):
+    stride = sim.operand()
+    words = [sim.rx + i * stride + j for i in range(TILE) for j in range(TILE)]
+    # Like the RTL, the next C word is read before the current one is written
+    acc = sim.read(words[0])
+    for n, addr in enumerate(words):
+        i, j = divmod(n, TILE)
+        for k in range(TILE):
+            acc = mac_word(MacOps.MAC, acc, sim.read(sim.ra + i * stride + k), sim.read(sim.rb + k * stride + j))
+        next_acc = sim.read(words[n + 1]) if n + 1 < len(words) else acc
+        sim.write(addr, acc)
+        acc = next_acc
+    sim.mac_acc = acc
+    sim.set_reg("ra", sim.ra + TILE)
+    sim.set_reg("rb", sim.rb + TILE * stride)
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles + TILE * TILE * (2 * TILE + 2)
+
+Instruction(0x90, "MCLR", MCLR_exec, simFunc=MCLR_sim)
+Instruction(0x91, "MSET", MSET_exec, simFunc=MSET_sim, regFields=1)
+Instruction(0x92, "MGET", MGET_exec, simFunc=MGET_sim, regFields=1)
+Instruction(0x93, "MAC", MAC_exec, simFunc=MAC_sim, regFields=2)
+Instruction(0x94, "DOT", DOT_exec, simFunc=DOT_sim)
+Instruction(0x95, "TMAC", TMAC_exec, 0x2, simFunc=TMAC_sim)
@@ -9,14 +9,32 @@
 
 from include.instruction import *
 from include.enums import *
-from amaranth import Module, Signal, Const, signed
+from amaranth import Module, Signal, Const, Mux, signed
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 _length = 0x3
 
+def _store(m: Module, core: "Core", reg_address: dict, dst, value):
+    with m.Switch(dst):
+        for key, val in reg_address.items():
+            with m.Case(Const(key, signed(32))):
+                m.d.sync += [
+                    val.eq(value),
+                    core.tmp32_2.eq(0),
+                    core.instr_state.eq(5)
+                ]
+        with m.Default():
+            m.d.sync += [
+                core.addr.eq(dst),
+                core.tmp32.eq(value),
+                core.tmp32_2.eq(1),
+                core.instr_state.eq(5)
+            ]
+
 def _exec(m: Module, core:"Core"):
     reg_address = {
         0xFFFFFF00: core.ra,
@@ -24,9 +42,9 @@ def _exec(m: Module, core:"Core"):
         0xFFFFFF02: core.rx,
     }
     with m.Switch(core.instr_state):
-        with m.Case(2):
-            with m.Switch(core.data_in):
-                for key, val in reg_address.items():
+        with core.operand_state(m, 1) as (src, _):
+            with m.Switch(src):
+                for key, val in {**reg_address, **core.read_aliases}.items():
                     with m.Case(Const(key, signed(32))):
                         m.d.sync += [
                             core.tmp32.eq(val),
@@ -35,35 +53,28 @@ def _exec(m: Module, core:"Core"):
                         ]
                 with m.Default():
                     m.d.sync += [
-                        core.addr.eq(core.data_in),
+                        core.addr.eq(src),
                         core.tmp32_2.eq(1),
                         core.instr_state.eq(3)
                     ]
 
-        with m.Case(3):
-            with m.If(core.tmp32_2):
-                m.d.sync += [
-                    core.tmp32.eq(core.data_in),
-                    core.tmp32_2.eq(0)
-                ]
-            core.advance_ip_goto_state(m, 4)
-
-        with m.Case(4):
-            with m.Switch(core.data_in):
-                for key, val in reg_address.items():
-                    with m.Case(Const(key, signed(32))):
-                        m.d.sync += [
-                            val.eq(core.tmp32),
-                            core.tmp32_2.eq(0),
-                            core.instr_state.eq(5)
-                        ]
-                with m.Default():
+        if core.useDualPort:
+            # The source word read from memory and the destination operand arrive together
+            with m.Case(3):
+                m.d.sync += core.ip.eq(core.ip + 1)
+                _store(m, core, reg_address, core.operand_in, Mux(core.tmp32_2, core.data_in, core.tmp32))
+        else:
+            with m.Case(3):
+                with m.If(core.tmp32_2):
                     m.d.sync += [
-                        core.addr.eq(core.data_in),
-                        core.tmp32_2.eq(1),
-                        core.instr_state.eq(5)
+                        core.tmp32.eq(core.data_in),
+                        core.tmp32_2.eq(0)
                     ]
-        
+                core.advance_ip_goto_state(m, 4)
+
+            with m.Case(4):
+                _store(m, core, reg_address, core.data_in, core.tmp32)
+
         with m.Case(5):
             with m.If(core.tmp32_2):
                 m.d.sync += [
@@ -80,9 +91,29 @@ def _exec(m: Module, core:"Core"):
                 core.data_out.eq(0)
             ]
             core.end_instr(m, core.ip + 1)
-            
-        with m.Default():
-            core.advance_ip_goto_state(m, 2)
+
+_sim_reg_address = {
+    0xFFFFFF00: "ra",
+    0xFFFFFF01: "rb",
+    0xFFFFFF02: "rx",
+}
+
+def _sim(sim: "ISASimulator") -> int:
+    src = sim.operand(1)
+    dst = sim.operand(2)
+    if src in _sim_reg_address:
+        value = sim.reg(_sim_reg_address[src])
+    else:
+        # The source is decoded once the fetch and the operand read are done
+        value = sim.read_alias(src, sim.cycles + sim.fetchCycles + sim.operandCycles)
+        if value == None:
+            value = sim.read(src)
+    if dst in _sim_reg_address:
+        sim.set_reg(_sim_reg_address[dst], value)
+    else:
+        sim.write(dst, value)
+    sim.end_instr(sim.ip + 3)
+    return 5 + 2 * sim.operandCycles
 
 
-Instruction(0x02, "MOV", _exec, _length)
\ No newline at end of file
+Instruction(0x02, "MOV", _exec, _length, simFunc=_sim)
\ No newline at end of file
@@ -0,0 +1,62 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from include.instruction import *
+from amaranth import Module, Signal
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+def _MULI(m: Module, core: "Core", register: Signal):
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, _):
+            m.d.sync += [
+                core.addr.eq(operand),
+                core.instr_state.eq(3)
+            ]
+        with m.Case(3):
+            m.d.comb += [
+                core.alu_1.eq(register),
+                core.alu_2.eq(core.data_in),
+                core.mul.start.eq(1)
+            ]
+            m.d.sync += core.instr_state.eq(4)
+            core.mul_result(m, register, core.ip + 1)
+        with m.Case(4):
+            core.mul_result(m, register, core.ip + 1)
+
+def MULA_exec(m: Module, core):
+    _MULI(m, core, core.ra)
+
+def MULB_exec(m: Module, core):
+    _MULI(m, core, core.rb)
+
+def MULX_exec(m: Module, core):
+    _MULI(m, core, core.rx)
+
+def _MULI_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.MUL, sim.reg(register), sim.read(sim.operand())))
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles + sim.mulLatency
+
+def MULA_sim(sim):
+    return _MULI_sim(sim, "ra")
+
+def MULB_sim(sim):
+    return _MULI_sim(sim, "rb")
+
+def MULX_sim(sim):
+    return _MULI_sim(sim, "rx")
+
+Instruction(0xE3, "MULA", MULA_exec, 0x2, simFunc=MULA_sim)
+Instruction(0xE4, "MULB", MULB_exec, 0x2, simFunc=MULB_sim)
+Instruction(0xE5, "MULX", MULX_exec, 0x2, simFunc=MULX_sim)
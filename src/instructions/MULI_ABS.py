@@ -0,0 +1,57 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from include.instruction import *
+from amaranth import Module, Signal
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+def _MULI_ABS(m: Module, core: "Core", register: Signal):
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, ip):
+            m.d.comb += [
+                core.alu_1.eq(register),
+                core.alu_2.eq(operand),
+                core.mul.start.eq(1)
+            ]
+            m.d.sync += core.instr_state.eq(3)
+            core.mul_result(m, register, ip + 1)
+        with m.Case(3):
+            core.mul_result(m, register, core.ip + 1)
+
+def MULA_ABS_exec(m: Module, core):
+    _MULI_ABS(m, core, core.ra)
+
+def MULB_ABS_exec(m: Module, core):
+    _MULI_ABS(m, core, core.rb)
+
+def MULX_ABS_exec(m: Module, core):
+    _MULI_ABS(m, core, core.rx)
+
+def _MULI_ABS_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.MUL, sim.reg(register), sim.operand()))
+    sim.end_instr(sim.ip + 2)
+    return 2 + sim.operandCycles + sim.mulLatency
+
+def MULA_ABS_sim(sim):
+    return _MULI_ABS_sim(sim, "ra")
+
+def MULB_ABS_sim(sim):
+    return _MULI_ABS_sim(sim, "rb")
+
+def MULX_ABS_sim(sim):
+    return _MULI_ABS_sim(sim, "rx")
+
+Instruction(0x3C, "MULA_ABS", MULA_ABS_exec, 0x2, simFunc=MULA_ABS_sim)
+Instruction(0x3D, "MULB_ABS", MULB_ABS_exec, 0x2, simFunc=MULB_ABS_sim)
+Instruction(0x3E, "MULX_ABS", MULX_ABS_exec, 0x2, simFunc=MULX_ABS_sim)
@@ -0,0 +1,47 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+def _result(m: Module, core: "Core"):
+    # Register field 3 drops the product but still ends the instruction with its flags
+    with m.Switch(core.reg_field(0)):
+        for register, name in enumerate(REGISTERS):
+            with m.Case(register):
+                core.mul_result(m, getattr(core, name), core.ip + 1)
+        with m.Default():
+            core.mul_result(m, core.tmp32, core.ip + 1)
+
+# MUL dst, src: dst is register field 0, src register field 1
+def MUL_exec(m: Module, core: "Core"):
+    with m.Switch(core.instr_state):
+        with m.Case(1):
+            m.d.comb += [
+                core.alu_1.eq(core.field_reg(0)),
+                core.alu_2.eq(core.field_reg(1)),
+                core.mul.start.eq(1)
+            ]
+            m.d.sync += core.instr_state.eq(2)
+            _result(m, core)
+        with m.Case(2):
+            _result(m, core)
+
+def MUL_sim(sim: "ISASimulator") -> int:
+    sim.set_field_reg(0, sim.alu(AluOps.MUL, sim.field_reg(0), sim.field_reg(1)))
+    sim.end_instr(sim.ip + 1)
+    return 2 + sim.mulLatency
+
+Instruction(0x53, "MUL", MUL_exec, simFunc=MUL_sim, regFields=2)
@@ -14,8 +14,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def NOP_exec(m: Module, core: "Core"):
     core.end_instr(m, core.ip + 1)
 
-Instruction(0x01, "NOP", NOP_exec)
\ No newline at end of file
+def NOP_sim(sim: "ISASimulator") -> int:
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+Instruction(0x01, "NOP", NOP_exec, simFunc=NOP_sim)
\ No newline at end of file
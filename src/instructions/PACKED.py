@@ -0,0 +1,50 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+from include import exceptions
+from include.instruction import *
+from amaranth import Module, Cat, Const
+from include.enums import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from main import Core
+    from include.isasim import ISASimulator
+
+# OP dst, src: dst (register field 0) = dst op src (register field 1), lane by lane.
+# Every packed instruction shares one decoder case: the low 3 opcode bits are the
+# low bits of its AluOps value and opcode bit 4 selects halfword lanes (bit 3 of it).
+def PACKED_exec(m: Module, core: "Core"):
+    m.d.comb += [
+        core.alu_1.eq(core.field_reg(0)),
+        core.alu_2.eq(core.field_reg(1))
+    ]
+    core.packed(m, Cat(core.opcode[0:3], core.opcode[4], Const(1, 1)))
+    core.set_field_reg(m, 0, core.alu_out)
+    core.end_instr(m, core.ip + 1)
+
+def PACKED_sim(sim: "ISASimulator") -> int:
+    op = AluOps(0x10 | (sim.ir & 0x7) | ((sim.ir >> 1) & 0x8))
+    sim.set_field_reg(0, sim.alu(op, sim.field_reg(0), sim.field_reg(1)))
+    sim.end_instr(sim.ip + 1)
+    return 2
+
+Instruction(0xC8, "PADDB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xC9, "PADDSB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xCA, "PSUBB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xCB, "PCMPEQB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xCC, "PCMPGTB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xCD, "PMINB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xCE, "PMAXB", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xD8, "PADDH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xD9, "PADDSH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xDA, "PSUBH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xDB, "PCMPEQH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xDC, "PCMPGTH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xDD, "PMINH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
+Instruction(0xDE, "PMAXH", PACKED_exec, simFunc=PACKED_sim, regFields=2)
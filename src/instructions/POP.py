@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core"):
     with m.Switch(core.instr_state):
@@ -23,18 +24,29 @@ def _exec(m: Module, core: "Core"):
                 core.stack_en.eq(1),
             ]
             m.d.sync += core.instr_state.eq(2)
-        with m.Case(2):
-            m.d.sync += [
-                core.tmp32.eq(core.data_in),
-            ]
-            core.advance_ip_goto_state(m, 3)
-        with m.Case(3):
-            m.d.sync += [
-                core.addr.eq(core.data_in),
-                core.data_out.eq(core.tmp32),
-                core.instr_state.eq(4),
-                core.RW.eq(0),
-            ]
+        if core.useDualPort:
+            # The popped word and the destination address arrive in the same cycle
+            with m.Case(2):
+                m.d.sync += [
+                    core.ip.eq(core.ip + 1),
+                    core.addr.eq(core.operand_in),
+                    core.data_out.eq(core.data_in),
+                    core.instr_state.eq(4),
+                    core.RW.eq(0),
+                ]
+        else:
+            with m.Case(2):
+                m.d.sync += [
+                    core.tmp32.eq(core.data_in),
+                ]
+                core.advance_ip_goto_state(m, 3)
+            with m.Case(3):
+                m.d.sync += [
+                    core.addr.eq(core.data_in),
+                    core.data_out.eq(core.tmp32),
+                    core.instr_state.eq(4),
+                    core.RW.eq(0),
+                ]
         with m.Case(4):
             m.d.sync += [
                 core.RW.eq(1),
@@ -43,4 +55,9 @@ def _exec(m: Module, core: "Core"):
             ]
             core.end_instr(m, core.ip + 1)
 
-Instruction(0xB0, "POP", _exec, 0x2)
\ No newline at end of file
+def _sim(sim: "ISASimulator") -> int:
+    sim.write(sim.operand(), sim.pop())
+    sim.end_instr(sim.ip + 2)
+    return 4 + sim.operandCycles
+
+Instruction(0xB0, "POP", _exec, 0x2, simFunc=_sim)
\ No newline at end of file
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core", register: Signal):
     with m.Switch(core.instr_state):
@@ -36,6 +37,20 @@ def _exec_POPB(m: Module, core: "Core"):
 def _exec_POPX(m: Module, core: "Core"):
     _exec(m, core, core.rx)
 
-Instruction(0xB1, "POPA", _exec_POPA)
-Instruction(0xB2, "POPB", _exec_POPB)
-Instruction(0xB3, "POPX", _exec_POPX)
\ No newline at end of file
+def _sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.pop())
+    sim.end_instr(sim.ip + 1)
+    return 3
+
+def _sim_POPA(sim: "ISASimulator"):
+    return _sim(sim, "ra")
+
+def _sim_POPB(sim: "ISASimulator"):
+    return _sim(sim, "rb")
+
+def _sim_POPX(sim: "ISASimulator"):
+    return _sim(sim, "rx")
+
+Instruction(0xB1, "POPA", _exec_POPA, simFunc=_sim_POPA)
+Instruction(0xB2, "POPB", _exec_POPB, simFunc=_sim_POPB)
+Instruction(0xB3, "POPX", _exec_POPX, simFunc=_sim_POPX)
\ No newline at end of file
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core", register: Signal):
     with m.Switch(core.instr_state):
@@ -40,6 +41,20 @@ def _exec_PUSHB(m: Module, core: "Core"):
 def _exec_PUSHX(m: Module, core: "Core"):
     _exec(m, core, core.rx)
 
-Instruction(0xA1, "PUSHA", _exec_PUSHA)
-Instruction(0xA2, "PUSHB", _exec_PUSHB)
-Instruction(0xA3, "PUSHX", _exec_PUSHX)
\ No newline at end of file
+def _sim(sim: "ISASimulator", register: str) -> int:
+    sim.push(sim.reg(register))
+    sim.end_instr(sim.ip + 1)
+    return 3
+
+def _sim_PUSHA(sim: "ISASimulator"):
+    return _sim(sim, "ra")
+
+def _sim_PUSHB(sim: "ISASimulator"):
+    return _sim(sim, "rb")
+
+def _sim_PUSHX(sim: "ISASimulator"):
+    return _sim(sim, "rx")
+
+Instruction(0xA1, "PUSHA", _exec_PUSHA, simFunc=_sim_PUSHA)
+Instruction(0xA2, "PUSHB", _exec_PUSHB, simFunc=_sim_PUSHB)
+Instruction(0xA3, "PUSHX", _exec_PUSHX, simFunc=_sim_PUSHX)
\ No newline at end of file
@@ -14,14 +14,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core"):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
+        with core.operand_state(m, 1) as (operand, _):
             m.d.comb += [
-                core.stack_data.eq(core.data_in),
+                core.stack_data.eq(operand),
                 core.stack_op.eq(StackOps.PUSH),
                 core.stack_en.eq(1)
             ]
@@ -33,4 +32,9 @@ def _exec(m: Module, core: "Core"):
             ]
             core.end_instr(m, core.ip + 1)
 
-Instruction(0xA4, "PUSH_ABS", _exec, 0x2)
\ No newline at end of file
+def _sim(sim: "ISASimulator") -> int:
+    sim.push(sim.operand())
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+Instruction(0xA4, "PUSH_ABS", _exec, 0x2, simFunc=_sim)
\ No newline at end of file
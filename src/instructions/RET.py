@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core"):
     with m.Switch(core.instr_state):
@@ -26,4 +27,8 @@ def _exec(m: Module, core: "Core"):
         with m.Case(2):
             core.end_instr(m, core.data_in)
 
-Instruction(0xB5, "RET", _exec, 0x1)
\ No newline at end of file
+def _sim(sim: "ISASimulator") -> int:
+    sim.end_instr(sim.pop())
+    return 3
+
+Instruction(0xB5, "RET", _exec, 0x1, simFunc=_sim)
\ No newline at end of file
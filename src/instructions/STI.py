@@ -15,13 +15,12 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _STI(m: Module, core:"Core", registry: Signal):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
-            m.d.sync += core.addr.eq(core.data_in)
+        with core.operand_state(m, 1) as (operand, _):
+            m.d.sync += core.addr.eq(operand)
             m.d.sync += core.RW.eq(0) 
             m.d.sync += core.data_out.eq(registry)
             m.d.sync += core.instr_state.eq(3)
@@ -39,6 +38,20 @@ def STB_exec(m: Module, core):
 def STX_exec(m: Module, core):
     _STI(m, core, core.rx)
 
-Instruction(0x40, "STA", STA_exec, 0x3)
-Instruction(0x41, "STB", STB_exec, 0x3)
-Instruction(0x42, "STX", STX_exec, 0x3)
\ No newline at end of file
+def _STI_sim(sim: "ISASimulator", registry: str) -> int:
+    sim.write(sim.operand(), sim.reg(registry))
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+def STA_sim(sim):
+    return _STI_sim(sim, "ra")
+
+def STB_sim(sim):
+    return _STI_sim(sim, "rb")
+
+def STX_sim(sim):
+    return _STI_sim(sim, "rx")
+
+Instruction(0x40, "STA", STA_exec, 0x3, simFunc=STA_sim, operandWords=1)
+Instruction(0x41, "STB", STB_exec, 0x3, simFunc=STB_sim, operandWords=1)
+Instruction(0x42, "STX", STX_exec, 0x3, simFunc=STX_sim, operandWords=1)
\ No newline at end of file
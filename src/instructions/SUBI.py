@@ -15,14 +15,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _SUBI(m: Module, core:"Core", register: Signal):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
+        with core.operand_state(m, 1) as (operand, _):
             m.d.sync += [
-                core.addr.eq(core.data_in),
+                core.addr.eq(operand),
                 core.instr_state.eq(3)
             ]
         with m.Case(3):
@@ -44,6 +43,20 @@ def SUBB_exec(m: Module, core):
 def SUBX_exec(m: Module, core):
     _SUBI(m, core, core.rx)
 
-Instruction(0xC0, "SUBA", SUBA_exec, 0x2)
-Instruction(0xC1, "SUBB", SUBB_exec, 0x2)
-Instruction(0xC2, "SUBX", SUBX_exec, 0x2)
\ No newline at end of file
+def _SUBI_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.SUB, sim.reg(register), sim.read(sim.operand())))
+    sim.end_instr(sim.ip + 2)
+    return 3 + sim.operandCycles
+
+def SUBA_sim(sim):
+    return _SUBI_sim(sim, "ra")
+
+def SUBB_sim(sim):
+    return _SUBI_sim(sim, "rb")
+
+def SUBX_sim(sim):
+    return _SUBI_sim(sim, "rx")
+
+Instruction(0xC0, "SUBA", SUBA_exec, 0x2, simFunc=SUBA_sim)
+Instruction(0xC1, "SUBB", SUBB_exec, 0x2, simFunc=SUBB_sim)
+Instruction(0xC2, "SUBX", SUBX_exec, 0x2, simFunc=SUBX_sim)
\ No newline at end of file
@@ -6,19 +6,19 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _SUBI_ABS(m:Module, core:"Core", register: Signal):
-    with m.If(core.instr_state == 1):
-        core.advance_ip_goto_state(m, 2)
-    with m.Else():
-        m.d.comb += [
-            core.alu_1.eq(register),
-            core.alu_2.eq(core.data_in),
-            core.alu_op.eq(AluOps.SUB),
-            core.alu_en.eq(1)
-        ]
-        m.d.sync += register.eq(core.alu_out)
-        core.end_instr(m, core.ip + 1)
+    with m.Switch(core.instr_state):
+        with core.operand_state(m, 1) as (operand, ip):
+            m.d.comb += [
+                core.alu_1.eq(register),
+                core.alu_2.eq(operand),
+                core.alu_op.eq(AluOps.SUB),
+                core.alu_en.eq(1)
+            ]
+            m.d.sync += register.eq(core.alu_out)
+            core.end_instr(m, ip + 1)
 
 def SUBA_ABS_exec(m:Module, core):
     _SUBI_ABS(m, core, core.ra)
@@ -29,6 +29,20 @@ def SUBB_ABS_exec(m:Module, core):
 def SUBX_ABS_exec(m:Module, core):
     _SUBI_ABS(m, core, core.rx)
 
-Instruction(0x33, "SUBA_ABS", SUBA_ABS_exec, 0x02)
-Instruction(0x34, "SUBB_ABS", SUBB_ABS_exec, 0x02)
-Instruction(0x35, "SUBX_ABS", SUBX_ABS_exec, 0x02)
\ No newline at end of file
+def _SUBI_ABS_sim(sim: "ISASimulator", register: str) -> int:
+    sim.set_reg(register, sim.alu(AluOps.SUB, sim.reg(register), sim.operand()))
+    sim.end_instr(sim.ip + 2)
+    return 2 + sim.operandCycles
+
+def SUBA_ABS_sim(sim):
+    return _SUBI_ABS_sim(sim, "ra")
+
+def SUBB_ABS_sim(sim):
+    return _SUBI_ABS_sim(sim, "rb")
+
+def SUBX_ABS_sim(sim):
+    return _SUBI_ABS_sim(sim, "rx")
+
+Instruction(0x33, "SUBA_ABS", SUBA_ABS_exec, 0x02, simFunc=SUBA_ABS_sim)
+Instruction(0x34, "SUBB_ABS", SUBB_ABS_exec, 0x02, simFunc=SUBB_ABS_sim)
+Instruction(0x35, "SUBX_ABS", SUBX_ABS_exec, 0x02, simFunc=SUBX_ABS_sim)
\ No newline at end of file
@@ -14,14 +14,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from main import Core
+    from include.isasim import ISASimulator
 
 def _exec(m: Module, core: "Core"):
     with m.Switch(core.instr_state):
-        with m.Case(1):
-            core.advance_ip_goto_state(m, 2)
-        with m.Case(2):
+        with core.operand_state(m, 1) as (_, ip):
             m.d.comb += [
-                core.stack_data.eq(core.ip + 1),
+                core.stack_data.eq(ip + 1),
                 core.stack_op.eq(StackOps.PUSH),
                 core.stack_en.eq(1)
             ]
@@ -36,4 +35,9 @@ def _exec(m: Module, core: "Core"):
         with m.Case(4):
             core.end_instr(m, core.data_in)
 
-Instruction(0xA5, "VISIT", _exec, 0x2)
\ No newline at end of file
+def _sim(sim: "ISASimulator") -> int:
+    sim.push(sim.ip + 2)
+    sim.end_instr(sim.operand())
+    return 4 + sim.operandCycles
+
+Instruction(0xA5, "VISIT", _exec, 0x2, simFunc=_sim)
\ No newline at end of file
@@ -1,10 +1,72 @@
 # SPDX-FileCopyrightText: 2026 Francesco Angeloni
 # SPDX-License-Identifier: CERN-OHL-W-2.0
 
-import os
 import importlib
+from typing import Dict, Iterable, List
+from include.exceptions import InstructionNotFound, ISAProfileNotFound
+from include.instruction import Instruction, instruction_names
 
-for file in os.listdir(os.path.dirname(__file__)):
-    if file.endswith(".py") and file != "__init__.py":
-        module_name = file[:-3]
-        importlib.import_module(f"instructions.{module_name}")
\ No newline at end of file
+# Instruction modules in registration order. The decoder cases and the perf
+# counters follow it instead of the file system order or the import order.
+MANIFEST = (
+    "NOP", "HALT", "JMP", "CJMP", "FLAGS",
+    "LDI_ABS", "LDI", "STI",
+    "ADDI_ABS", "ADDI", "SUBI_ABS", "SUBI", "INCI", "DECI", "ALU_REG",
+    "PUSHI", "PUSH_ABS", "PUSH", "POPI", "POP", "VISIT", "RET", "LOGIC", "HASH", "PACKED",
+    "MOV", "MULI_ABS", "MULI", "MUL_REG", "MAC", "CACHE",
+)
+
+MINIMAL = (
+    "NOP", "HALT", "JMP", "CJMP", "FLAGS",
+    "LDI_ABS", "LDI", "STI",
+    "ADDI_ABS", "ADDI", "SUBI_ABS", "SUBI", "INCI", "DECI", "ALU_REG",
+)
+STACK = MINIMAL + ("PUSHI", "PUSH_ABS", "PUSH", "POPI", "POP", "VISIT", "RET")
+
+# Modules in each ISA profile
+PROFILES = {
+    "minimal": MINIMAL,
+    "stack": STACK,
+    "full": MANIFEST,
+}
+
+# Instruction names registered by each imported module
+module_instructions: Dict[str, List[str]] = {}
+
+def load_modules(modules: Iterable[str] = MANIFEST):
+    """
+    Imports the instruction modules that are not loaded yet, so a profile only
+    registers its own instructions.
+    """
+    for module_name in modules:
+        if module_instructions.get(module_name) != None:
+            continue
+        if module_name not in MANIFEST:
+            raise InstructionNotFound(module_name)
+        module = importlib.import_module(f"instructions.{module_name}")
+        module_instructions[module_name] = [name for name, inst in instruction_names.items() if inst.executeFunc.__module__ == module.__name__]
+
+def isa_subset(isa: str | Iterable[str] = "full") -> Dict[int, Instruction]:
+    """
+    Opcode -> Instruction table of a profile name or of a list of instruction
+    and module names, in MANIFEST order. NOP and HALT are always included.
+    """
+    if isinstance(isa, str):
+        if PROFILES.get(isa) == None:
+            raise ISAProfileNotFound(isa, list(PROFILES))
+        isa = PROFILES[isa]
+
+    load_modules(("NOP", "HALT"))
+    selected = {"NOP", "HALT"}
+    for name in isa:
+        if name in MANIFEST:
+            load_modules((name,))
+            selected.update(module_instructions[name])
+        else:
+            if instruction_names.get(name) == None:
+                load_modules()
+            if instruction_names.get(name) == None:
+                raise InstructionNotFound(name)
+            selected.add(name)
+
+    return {instruction_names[name].opcode: instruction_names[name] for module_name in MANIFEST for name in module_instructions.get(module_name, []) if name in selected}
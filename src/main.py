@@ -7,40 +7,58 @@
 #
 # SPDX-License-Identifier: CERN-OHL-W-2.0
 
+from contextlib import contextmanager
 from enum import IntEnum, auto
 import os
-from typing import List, Dict, Tuple, Optional
-from amaranth import Signal, Const, Module, Memory, signed, Elaboratable
+from typing import Callable, List, Dict, Iterable, Tuple, Optional
+from amaranth import Signal, Const, Cat, Module, Memory, Mux, Value, signed, Elaboratable, EnableInserter
 from amaranth.hdl.ast import Statement
 from amaranth.build import Platform
 from amaranth.cli import main_parser, main_runner
 from amaranth.sim import Simulator, SimulatorContext, Settle, Tick
-import instructions
+from instructions import PROFILES, isa_subset
 from include.enums import *
-from include.instruction import instruction_opcodes, instruction_names
+from include.instruction import Instruction, instruction_names, OPCODE_BITS, REG_FIELD_BITS, REGISTERS
+from include.memory import MemoryImage, as_memory_image, load_image
+from include.multiplier import Multiplier
+from include.hash import HashUnit
+from include.mac import MacUnit
+from include.isasim import ISASimulator
+from include.cosim import LockstepCoSim
 from math import pow
 
 class Core(Elaboratable):
-    def __init__(self, *, useMemory: bool = False, mem_init: Optional[Dict] = None, useResetVector: bool = True, startAddr: int = 0x0009):
+    def __init__(self, *, useMemory: bool = False, mem_init: Optional[Dict | MemoryImage | str] = None, useResetVector: bool = True, startAddr: int = 0x0009, memDepth: int = 2**16, usePerfCounters: bool = False, usePipeline: bool = False, useDualPort: bool = False, useRegisteredRead: bool = False, multiplier: MulMode = MulMode.SINGLE, isa: str | Iterable[str] = "full"):
         if useMemory and mem_init == None:
             raise ValueError("Set useMemory flag without initializing memory")
+        if useDualPort and not useMemory:
+            raise ValueError("Set useDualPort flag without useMemory")
+        if useRegisteredRead and not useMemory:
+            raise ValueError("Set useRegisteredRead flag without useMemory")
 
         self.useMemory = useMemory
+        self.memDepth = memDepth
         self.useResetVector = useResetVector
         self.startAddr = startAddr
+        self.usePerfCounters = usePerfCounters
+        self.usePipeline = usePipeline
+        self.useDualPort = useDualPort
+        self.useRegisteredRead = useRegisteredRead
+        # Instructions the decoder is built for, the others run as NOP
+        self.instructions = isa_subset(isa)
+        self.mul = Multiplier(multiplier)
+        self.hash = HashUnit()
+        self.mac = MacUnit()
 
         self.addr = Signal(32)
         self.data_in = Signal(signed(32))
         self.data_out = Signal(32)
+        self.operand_in = Signal(signed(32)) # Word at ip + 1, second read port
         self.RW = Signal(reset=1) # Read = 1, Write = 0
 
         if useMemory and not mem_init == None:
-            init = [0xFFFFFFFF] * int(pow(2, 18))
-
-            for addr, val in mem_init.items():
-                init[addr] = val
-
-            self.mem = Memory(width=32, depth=int(pow(2, 18)), init=init)
+            mem_init = as_memory_image(mem_init, memDepth)
+            self.mem = Memory(width=32, depth=memDepth, init=mem_init.init_words())
 
         #Registries
         self.ra = Signal(signed(32), reset_less=True)
@@ -48,8 +66,10 @@ class Core(Elaboratable):
         self.rx = Signal(signed(32), reset_less=True)
         self.ip = Signal(32, reset_less=True)
         self.ir = Signal(32, reset_less=True)
+        self.opcode = Signal(OPCODE_BITS) # Opcode field being executed, of ir or of the word just fetched in pipelined mode
+        self.operand_fields = Signal(32 - OPCODE_BITS) # Bits above the opcode field of the same word, holds the register fields
         if useMemory:
-            self.sp = Signal(32, reset=int(pow(2, 18) - 1))
+            self.sp = Signal(32, reset=memDepth - 1)
         else:
             self.sp = Signal(32, reset_less=True)
         self.qp = Signal(32, reset_less=True)
@@ -57,6 +77,7 @@ class Core(Elaboratable):
         self.tmp32 = Signal(32)
         self.tmp32_2 = Signal(32)
         self.tmp32_3 = Signal(32)
+        self.tile_pos = Signal(6) # Row, column and inner index of the TMAC walk, 2 bits each from the top
 
         #BUSes
         self.interrupt_args = Signal(32)
@@ -66,12 +87,18 @@ class Core(Elaboratable):
         self.alu_op = Signal(AluOps)
         self.alu_out = Signal(signed(32))
         self.alu_33 = Signal(33)
+        self.shift_out = Signal(32)
+        self.shift_carry = Signal()
+        self.packed_out = Signal(32)
+        self.packed_carry = Signal()
         self.alu_en = Signal()
         self.stack_op = Signal(StackOps)
         self.stack_data = Signal(32)
         self.stack_en = Signal()
         self.internal_op = Signal()
-        self.stall = Signal()
+        self.stall = Signal() # Bus access not acknowledged yet, the core holds every register
+        self.addr_incr = Signal() # The next access reads addr + 1, lets the bus burst
+        self.cache_op = Signal(CacheOps) # Cache maintenance requested from the wrapper, the core stalls until it is done
 
         #States
         self.reset_state = Signal(2)
@@ -79,9 +106,98 @@ class Core(Elaboratable):
         self.end_instr_flag = Signal()
         self.end_instr_addr = Signal(32)
 
+        # Read-only signals that MOV can use as source next to the register aliases
+        self.read_aliases: Dict[int, Signal] = {}
+
+        #Performance counters
+        if usePerfCounters:
+            self.perf_cycles = Signal(32)
+            self.perf_retired = Signal(32)
+            self.perf_stall = Signal(32)
+            self.perf_stack = Signal(32)
+            self.perf_opcode = {opcode: Signal(32, name=f"perf_{inst.name}") for opcode, inst in self.instructions.items()}
+            self.read_aliases.update({
+                PerfCounter.CYCLES: self.perf_cycles,
+                PerfCounter.RETIRED: self.perf_retired,
+                PerfCounter.STALL: self.perf_stall,
+                PerfCounter.STACK: self.perf_stack,
+            })
+            for opcode, counter in self.perf_opcode.items():
+                self.read_aliases[PerfCounter.OPCODE + opcode] = counter
+
     def ports(self) -> List[Signal]:
-        return [self.ip, self.ir, self.addr, self.data_in, self.tmp32, self.tmp32_2, self.data_out, self.RW, self.ra, self.rb, self.rx, self.alu_op, self.alu_1, self.alu_2, self.alu_out, self.flags, self.instr_state, self.stack_op]
+        ports = [self.ip, self.ir, self.opcode, self.operand_fields, self.addr, self.data_in, self.tmp32, self.tmp32_2, self.data_out, self.RW, self.ra, self.rb, self.rx, self.alu_op, self.alu_1, self.alu_2, self.alu_out, self.flags, self.instr_state, self.stack_op]
+        if self.usePerfCounters:
+            ports += [self.perf_cycles, self.perf_retired, self.perf_stall, self.perf_stack]
+        return ports
         
+    def shifter(self, m: Module):
+        """
+        Barrel shifter shared by every shift and rotate, by alu_2[0:5] bits. It only
+        shifts right: left shifts and rotates run on alu_1 and on the result with
+        the bits reversed. shift_carry is the last bit shifted or rotated out, 0
+        when nothing moves. Only elaborated for instructions that call shift.
+        """
+        value = self.alu_1.as_unsigned()
+        left = (self.alu_op == AluOps.SHL) | (self.alu_op == AluOps.ROL)
+        rotate = (self.alu_op == AluOps.ROL) | (self.alu_op == AluOps.ROR)
+        source = Mux(left, value[::-1], value)
+        fill = Mux(rotate, source, Mux(self.alu_op == AluOps.SAR, value[31].replicate(32), 0))
+        shifted = Cat(Const(0, 1), source, fill) >> self.alu_2[0:5]
+        m.d.comb += [
+            self.shift_out.eq(Mux(left, shifted[1:33][::-1], shifted[1:33])),
+            self.shift_carry.eq(shifted[0])
+        ]
+
+    def packed_alu(self, m: Module):
+        """
+        One adder for every packed lane operation: gap bits between the bytes stop the
+        carry at the lane boundaries, or pass it on inside halfwords. Subtractions add
+        ~alu_2 with a carry into every lane, so a lane carry means no borrow (alu_1 >= alu_2).
+        packed_carry is set if any lane carried out of an add or borrowed in the others.
+        Only elaborated for instructions that call packed.
+        """
+        op = self.alu_op
+        half = op[3]
+        add = ~op[1] & ~op[2]
+        a = self.alu_1.as_unsigned()
+        b = self.alu_2.as_unsigned()
+        # The carry into the first lane comes from a bit below it, set in both operands
+        addend = Mux(add, b, ~b)
+        a_lanes = [~add, a[0:8]]
+        b_lanes = [~add, addend[0:8]]
+        for byte in range(1, 4):
+            inside = half & (byte != 2)
+            a_lanes += [inside | ~add, a[8 * byte:8 * byte + 8]]
+            b_lanes += [~inside & ~add, addend[8 * byte:8 * byte + 8]]
+        lanes = Signal(36)
+        m.d.comb += lanes.eq((Cat(*a_lanes) + Cat(*b_lanes))[1:])
+
+        out = [lanes[9 * byte:9 * byte + 8] for byte in range(4)]
+        carry = [lanes[9 * byte + 8] for byte in range(4)]
+        a_bytes = [a[8 * byte:8 * byte + 8] for byte in range(4)]
+        b_bytes = [b[8 * byte:8 * byte + 8] for byte in range(4)]
+        # Compared on the operands, next to the adder instead of after it
+        equal = [a_bytes[byte] == b_bytes[byte] for byte in range(4)]
+        # Halfword lanes: both bytes take the carry and equality of the whole halfword
+        carry = [Mux(half, carry[byte | 1], carry[byte]) for byte in range(4)]
+        equal = [Mux(half, equal[byte & 2] & equal[byte | 1], equal[byte]) for byte in range(4)]
+
+        with m.Switch(op):
+            with m.Case(AluOps.PADDSB, AluOps.PADDSH):
+                m.d.comb += self.packed_out.eq(Cat(Mux(carry[byte], 0xFF, out[byte]) for byte in range(4)))
+            with m.Case(AluOps.PCMPEQB, AluOps.PCMPEQH):
+                m.d.comb += self.packed_out.eq(Cat(equal[byte].replicate(8) for byte in range(4)))
+            with m.Case(AluOps.PCMPGTB, AluOps.PCMPGTH):
+                m.d.comb += self.packed_out.eq(Cat((carry[byte] & ~equal[byte]).replicate(8) for byte in range(4)))
+            with m.Case(AluOps.PMINB, AluOps.PMINH):
+                m.d.comb += self.packed_out.eq(Cat(Mux(carry[byte], b_bytes[byte], a_bytes[byte]) for byte in range(4)))
+            with m.Case(AluOps.PMAXB, AluOps.PMAXH):
+                m.d.comb += self.packed_out.eq(Cat(Mux(carry[byte], a_bytes[byte], b_bytes[byte]) for byte in range(4)))
+            with m.Default():
+                m.d.comb += self.packed_out.eq(Cat(*out))
+        m.d.comb += self.packed_carry.eq(Mux(add, Cat(*carry).any(), ~Cat(*carry).all()))
+
     def alu_handler(self, m: Module):
         with m.If(self.alu_en):
             self.flags.eq(0)
@@ -108,6 +224,16 @@ class Core(Elaboratable):
                         self.flags[Flags.OVERFLOW].eq((self.alu_1[31] != self.alu_2[31]) & (self.alu_1[31] != self.alu_out[31])),
                         self.flags[Flags.CARRY].eq(self.alu_33[32])
                    ]
+                with m.Case(AluOps.MUL):
+                    m.d.comb += [
+                        self.alu_out.eq(self.mul.product[:32])
+                    ]
+                    m.d.sync += [
+                        self.flags[Flags.ZERO].eq(self.alu_out == 0),
+                        self.flags[Flags.NEGATIVE].eq(self.alu_out < 0),
+                        self.flags[Flags.OVERFLOW].eq(self.mul.high != self.mul.product[31].replicate(32)),
+                        self.flags[Flags.CARRY].eq(self.mul.product[32:] != 0)
+                    ]
                 with m.Case(AluOps.INC):
                     m.d.comb += [
                         self.alu_out.eq(self.alu_1 + 1)
@@ -128,6 +254,39 @@ class Core(Elaboratable):
                         self.flags[Flags.OVERFLOW].eq(self.alu_out.as_signed() > self.alu_1.as_signed()),
                         self.flags[Flags.CARRY].eq(0)
                    ]
+                with m.Case(AluOps.AND, AluOps.OR, AluOps.XOR, AluOps.NOT):
+                    with m.Switch(self.alu_op):
+                        with m.Case(AluOps.AND):
+                            m.d.comb += self.alu_out.eq(self.alu_1 & self.alu_2)
+                        with m.Case(AluOps.OR):
+                            m.d.comb += self.alu_out.eq(self.alu_1 | self.alu_2)
+                        with m.Case(AluOps.XOR):
+                            m.d.comb += self.alu_out.eq(self.alu_1 ^ self.alu_2)
+                        with m.Case(AluOps.NOT):
+                            m.d.comb += self.alu_out.eq(~self.alu_1)
+                    m.d.sync += [
+                        self.flags[Flags.ZERO].eq(self.alu_out == 0),
+                        self.flags[Flags.NEGATIVE].eq(self.alu_out < 0),
+                        self.flags[Flags.OVERFLOW].eq(0),
+                        self.flags[Flags.CARRY].eq(0)
+                    ]
+                with m.Case(AluOps.SHL, AluOps.SHR, AluOps.SAR, AluOps.ROL, AluOps.ROR):
+                    m.d.comb += self.alu_out.eq(self.shift_out)
+                    m.d.sync += [
+                        self.flags[Flags.ZERO].eq(self.alu_out == 0),
+                        self.flags[Flags.NEGATIVE].eq(self.alu_out < 0),
+                        self.flags[Flags.OVERFLOW].eq(0),
+                        self.flags[Flags.CARRY].eq(self.shift_carry)
+                    ]
+                # PACKED_OPS, the only ops with bit 4 set
+                with m.Case("1----"):
+                    m.d.comb += self.alu_out.eq(self.packed_out)
+                    m.d.sync += [
+                        self.flags[Flags.ZERO].eq(self.alu_out == 0),
+                        self.flags[Flags.NEGATIVE].eq(self.alu_out < 0),
+                        self.flags[Flags.OVERFLOW].eq(0),
+                        self.flags[Flags.CARRY].eq(self.packed_carry)
+                    ]
                 with m.Default():
                     m.d.comb += self.alu_out.eq(0)
                     m.d.sync += self.flags.eq(0)
@@ -153,15 +312,30 @@ class Core(Elaboratable):
                         self.addr.eq(self.sp + 1),
                         self.RW.eq(1)
                     ]
-            m.d.comb += self.stack_en.eq(0)
 
+    def perf_handler(self, m: Module):
+        m.d.sync += self.perf_cycles.eq(self.perf_cycles + 1)
+        with m.If(self.stall):
+            m.d.sync += self.perf_stall.eq(self.perf_stall + 1)
+        with m.If(self.stack_en):
+            m.d.sync += self.perf_stack.eq(self.perf_stack + 1)
+        with m.If(self.end_instr_flag & (self.reset_state == 2)):
+            m.d.sync += self.perf_retired.eq(self.perf_retired + 1)
+            with m.Switch(self.opcode):
+                for opcode, counter in self.perf_opcode.items():
+                    with m.Case(opcode):
+                        m.d.sync += counter.eq(counter + 1)
 
     def elaborate(self, platform: Platform) -> Module:
         m = Module()
+        self._mulUsed = False
+        self._shiftUsed = False
+        self._packedUsed = False
 
         if self.useMemory:
             m.submodules.mem = self.mem
-            self.read = self.mem.read_port(domain="comb")
+            read_args = {"domain": "sync", "transparent": False} if self.useRegisteredRead else {"domain": "comb"}
+            self.read = self.mem.read_port(**read_args)
             self.write = self.mem.write_port()
             m.d.comb += [
                 self.read.addr.eq(self.addr),
@@ -176,30 +350,96 @@ class Core(Elaboratable):
                 m.d.comb += [
                     self.data_in.eq(0xFFFFFFFF),
                     self.write.data.eq(self.data_out),
-                    self.write.en.eq(1)
+                    self.write.en.eq(~self.stall)
                 ]
+            if self.useDualPort:
+                self.read_operand = self.mem.read_port(**read_args)
+                m.d.comb += [
+                    self.read_operand.addr.eq(self.ip + 1),
+                    self.operand_in.eq(self.read_operand.data)
+                ]
+            if self.useRegisteredRead:
+                # The read ports register their address, the core stalls like behind a bus
+                # until they hold the word at addr (and at ip + 1) read after the last write
+                read_addr = Signal(32)
+                operand_addr = Signal(32)
+                read_valid = Signal()
+                m.d.sync += [
+                    read_addr.eq(self.addr),
+                    operand_addr.eq(self.ip + 1),
+                    read_valid.eq(~self.write.en)
+                ]
+                ready = ~self.RW | self.internal_op | (read_valid & (read_addr == self.addr))
+                if self.useDualPort:
+                    ready &= read_valid & (operand_addr == self.ip + 1)
+                m.d.comb += self.stall.eq(~ready)
 
         m.d.comb += [
             self.end_instr_flag.eq(0),
+            self.addr_incr.eq(0),
             self.alu_en.eq(0),
             self.stack_en.eq(0),
         ]
 
-        self.instruction_end_handler(m)
-        self.reset_handler(m)
-        self.alu_handler(m)
-        self.stack_handler(m)
+        if self.usePerfCounters:
+            self.perf_handler(m)
+
+        # A stalled cycle repeats until the bus acknowledges, nothing is committed before
+        with m.If(~self.stall):
+            self.reset_handler(m)
+            self.alu_handler(m)
+            self.stack_handler(m)
+
+            with m.If(self.reset_state == 2):
+                self.cycle(m)
+
+            # Last, so end_instr overrides what the instruction assigned in the same cycle
+            self.instruction_end_handler(m)
+
+        if self._shiftUsed:
+            self.shifter(m)
+        if self._packedUsed:
+            self.packed_alu(m)
+
+        # Without hash or MAC instructions their inputs stay 0 and synthesis drops them, like the multiplier
+        m.submodules.hash = self.hash
+        m.submodules.mac = self.mac
 
-        with m.If(self.reset_state == 2):
-            self.cycle(m)
+        # Without MUL instructions in the subset the multiplier inputs stay 0 and synthesis drops it
+        m.submodules.mul = EnableInserter(~self.stall)(self.mul)
+        if self._mulUsed:
+            m.d.comb += [
+                self.mul.a.eq(self.alu_1),
+                self.mul.b.eq(self.alu_2)
+            ]
 
         return m
 
     def cycle(self, m):
-        with m.If(self.instr_state == 0):
-            self.fetch(m)
-        with m.Else():
+        if self.usePipeline:
+            # end_instr already put the next ip on addr, so the opcode is on data_in
+            # when the instruction starts and state 1 decodes it directly.
+            with m.If(self.instr_state == 1):
+                m.d.comb += [
+                    self.opcode.eq(self.data_in[:OPCODE_BITS]),
+                    self.operand_fields.eq(self.data_in[OPCODE_BITS:])
+                ]
+                m.d.sync += self.ir.eq(self.data_in)
+            with m.Else():
+                m.d.comb += [
+                    self.opcode.eq(self.ir[:OPCODE_BITS]),
+                    self.operand_fields.eq(self.ir[OPCODE_BITS:])
+                ]
             self.execute(m)
+        else:
+            m.d.comb += [
+                self.opcode.eq(self.ir[:OPCODE_BITS]),
+                self.operand_fields.eq(self.ir[OPCODE_BITS:])
+            ]
+            with m.If(self.instr_state == 0):
+                self.fetch(m)
+            with m.Else():
+                self.execute(m)
 
     def fetch(self, m: Module):
         m.d.sync += [
@@ -208,10 +448,15 @@ class Core(Elaboratable):
         ]
     
     def execute(self, m: Module):
-        with m.Switch(self.ir):
-            for opcode, inst in instruction_opcodes.items():
-                with m.Case(Const(opcode, signed(32))):
-                    inst.execute(m, self)
+        # Instructions with the same execute function share one case and tell
+        # themselves apart by opcode. Unknown opcodes run as NOP.
+        cases: Dict[Callable, List[Instruction]] = {}
+        for inst in self.instructions.values():
+            cases.setdefault(inst.executeFunc, []).append(inst)
+        with m.Switch(self.opcode):
+            for insts in cases.values():
+                with m.Case(*(inst.opcode for inst in insts)):
+                    insts[0].execute(m, self)
             with m.Default():
                 instruction_names["NOP"].execute(m, self)
 
@@ -219,7 +464,8 @@ class Core(Elaboratable):
         with m.If(self.end_instr_flag):
             m.d.sync += self.addr.eq(self.end_instr_addr)
             m.d.sync += self.ip.eq(self.end_instr_addr)
-            m.d.sync += self.instr_state.eq(0)
+            m.d.sync += self.instr_state.eq(1 if self.usePipeline else 0)
+            m.d.comb += self.addr_incr.eq(self.RW & (self.end_instr_addr == self.addr + 1))
 
     def end_instr(self, m: Module, addr: Statement):
         m.d.comb += self.end_instr_addr.eq(addr)
@@ -233,6 +479,82 @@ class Core(Elaboratable):
         ]
         if overrideAddr:
             m.d.sync += self.addr.eq(self.ip + 1)
+            if RW:
+                m.d.comb += self.addr_incr.eq(self.RW & (self.addr == self.ip))
+
+    def mul_result(self, m: Module, register: Signal, next_ip):
+        """
+        Once mul.done, writes the product to register with the AluOps.MUL flags and
+        ends the instruction. Call it in the state that raises mul.start, where
+        MulMode.SINGLE is already done, and in the state waiting for the product.
+        The multiplier is only elaborated for instructions that call it.
+        """
+        self._mulUsed = True
+        with m.If(self.mul.done):
+            m.d.comb += [
+                self.alu_op.eq(AluOps.MUL),
+                self.alu_en.eq(1)
+            ]
+            m.d.sync += register.eq(self.alu_out)
+            self.end_instr(m, next_ip)
+
+    def reg_field(self, index: int) -> Value:
+        return self.operand_fields.word_select(index, REG_FIELD_BITS)
+
+    def field_reg(self, index: int) -> Value:
+        """
+        Value of the register selected by register field index, 0 for index 3.
+        """
+        field = self.reg_field(index)
+        return Mux(field == 0, self.ra, Mux(field == 1, self.rb, Mux(field == 2, self.rx, 0)))
+
+    def set_field_reg(self, m: Module, index: int, value: Value):
+        """
+        Writes value to the register selected by register field index.
+        """
+        with m.Switch(self.reg_field(index)):
+            for register, name in enumerate(REGISTERS):
+                with m.Case(register):
+                    m.d.sync += getattr(self, name).eq(value)
+
+    def shift(self, m: Module, op: AluOps):
+        """
+        Runs the shift or rotate op on alu_1 by alu_2 through alu_handler.
+        """
+        self._shiftUsed = True
+        m.d.comb += [
+            self.alu_op.eq(op),
+            self.alu_en.eq(1)
+        ]
+
+    def packed(self, m: Module, op: AluOps):
+        """
+        Runs the packed lane op on alu_1 and alu_2 through alu_handler.
+        """
+        self._packedUsed = True
+        m.d.comb += [
+            self.alu_op.eq(op),
+            self.alu_en.eq(1)
+        ]
+
+    @contextmanager
+    def operand_state(self, m: Module, state: int):
+        """
+        Case of an instr_state Switch that reads the next word of the instruction
+        and advances ip to it. The body gets (word, address of the word) and goes on
+        to state + 2 or ends the instruction.
+        With one read port state advances ip and the body runs in state + 1 on
+        data_in, with useDualPort the body runs in state on operand_in.
+        """
+        if self.useDualPort:
+            with m.Case(state):
+                m.d.sync += self.ip.eq(self.ip + 1)
+                yield self.operand_in, self.ip + 1
+        else:
+            with m.Case(state):
+                self.advance_ip_goto_state(m, state + 1)
+            with m.Case(state + 1):
+                yield self.data_in, self.ip
 
     def reset_handler(self, m: Module):
         if self.useResetVector:
@@ -260,6 +582,18 @@ class Core(Elaboratable):
 
 if __name__ == "__main__":
     parser = main_parser()
+    parser.add_argument("--image", help="Program image to simulate (.bin, Intel HEX or ELF) instead of the built-in test program")
+    parser.add_argument("--pipeline", action="store_true", help="Overlap the instruction fetch with the previous instruction")
+    parser.add_argument("--dual-port", action="store_true", help="Read the instruction operand on a second memory port")
+    parser.add_argument("--wait-states", type=int, default=None, help="Run the core behind its Wishbone wrapper and a memory with this many wait states")
+    parser.add_argument("--bus", choices=["classic", "burst", "pipelined"], default="classic", help="Wishbone mode used with --wait-states")
+    parser.add_argument("--icache", type=int, default=0, help="Words of instruction cache in the Wishbone wrapper used with --wait-states")
+    parser.add_argument("--dcache", type=int, default=0, help="Words of write-back data cache in the Wishbone wrapper used with --wait-states")
+    parser.add_argument("--write-buffer", type=int, default=0, help="Entries of the posted write buffer in the Wishbone wrapper used with --wait-states")
+    parser.add_argument("--harvard", action="store_true", help="Split the Wishbone wrapper used with --wait-states into ibus and dbus")
+    parser.add_argument("--registered", action="store_true", help="Register the memory reads of the core, or with --wait-states the Wishbone buses of the wrapper")
+    parser.add_argument("--isa", choices=list(PROFILES), default="full", help="ISA profile the core and the model decode")
+    parser.add_argument("--multiplier", choices=[mode.name.lower() for mode in MulMode], default="single", help="Multiplier implementation")
     args = parser.parse_args()
 
     m = Module()
@@ -326,7 +660,26 @@ if __name__ == "__main__":
         0x0000002C: 0x00000000  #HALT
     }
 
-    m.submodules.core = core = Core(useMemory=True, mem_init=subroutine_test_mem)
+    program = load_image(args.image) if args.image else MemoryImage(subroutine_test_mem)
+    multiplier = MulMode[args.multiplier.upper()]
+    model = ISASimulator(mem_init=program, usePipeline=args.pipeline, useDualPort=args.dual_port, multiplier=multiplier, isa=args.isa)
+    if args.wait_states == None:
+        m.submodules.core = core = Core(useMemory=True, mem_init=program, usePipeline=args.pipeline, useDualPort=args.dual_port, useRegisteredRead=args.registered, multiplier=multiplier, isa=args.isa)
+    else:
+        from amaranth.lib import wiring
+        from include.wishbone import SISCFWishboneWrapper, WishboneMemory
+        core = Core(usePipeline=args.pipeline, useDualPort=args.dual_port, multiplier=multiplier, isa=args.isa)
+        burst = args.bus == "burst"
+        pipelined = args.bus == "pipelined"
+        m.submodules.cpu = cpu = SISCFWishboneWrapper(core, burst=burst, pipelined=pipelined, icacheSize=args.icache, dcacheSize=args.dcache, writeBuffer=args.write_buffer, harvard=args.harvard, registered=args.registered)
+        m.submodules.ram = ram = WishboneMemory(program, latency=args.wait_states, burst=burst, pipelined=pipelined, harvard=args.harvard)
+        if args.harvard:
+            wiring.connect(m, cpu.ibus, ram.ibus)
+            wiring.connect(m, cpu.dbus, ram.dbus)
+        else:
+            wiring.connect(m, cpu.bus, ram.bus)
+        # Without useMemory Core does not reset sp
+        model.sp = 0
 
     # with m.Switch(core.addr):
     #     for addr, data in mem.items():
@@ -338,11 +691,8 @@ if __name__ == "__main__":
     sim = Simulator(m)
     sim.add_clock(1e-6)
 
-    def process():
-        for i in range(300):
-            if (yield core.ir == 0x00) and not 0 <= i <= 4:
-                return
-            yield Tick()
+    # Check every retired instruction against the ISA model, stops at HALT or at the first divergence
+    cosim = LockstepCoSim(core, model, max_cycles=300 * (1 + (args.wait_states or 0)))
 
     if not os.path.isdir("../sim"):
         if os.path.exists("../sim"):
@@ -350,6 +700,7 @@ if __name__ == "__main__":
         else:
             os.mkdir("../sim")
 
-    sim.add_process(process)
+    sim.add_testbench(cosim.testbench)
     with sim.write_vcd("../sim/core.vcd", "../sim/core.gtkw", traces=core.ports()):
-        sim.run()
\ No newline at end of file
+        sim.run()
+    print(f"Retired {cosim.retired} instructions in {cosim.cycles} cycles ({cosim.stalls} stalled), RTL and ISA model agree.")
\ No newline at end of file
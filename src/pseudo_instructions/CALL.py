@@ -0,0 +1,21 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from include.instruction import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from assembler import Assembler
+
+def _CALL(self, assembler: "Assembler", parameters: list[str] | None = None):
+    if parameters == None or len(parameters) != 1:
+        assembler.error("CALL takes the subroutine address")
+    assembler.instruction("VISIT", parameters)
+
+PseudoInstruction("CALL", _CALL)
@@ -0,0 +1,23 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import pytest
+from assembler import assemble
+from include.exceptions import AssemblerError
+from include.instruction import instruction_names
+
+@pytest.mark.parametrize("source", ["LDA_ABS", "STA", "JNZ", "AND_ABS ra", "MOV 0x100"])
+def test_missing_operands(source):
+    with pytest.raises(AssemblerError):
+        assemble(source)
+
+def test_only_unused_words_are_padded():
+    image = assemble("STA 0x100\nJMP 0")
+    nop = instruction_names["NOP"].opcode
+    assert [image[addr] for addr in range(6)] == [instruction_names["STA"].opcode, 0x100, nop, instruction_names["JMP"].opcode, 0, nop]
@@ -0,0 +1,33 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import pytest
+from amaranth.back import rtlil
+from main import Core
+
+# Conversion fails on combinational loops, for instance a core signal that
+# feeds back into stall
+
+def test_registered_read_core_converts():
+    core = Core(useMemory=True, mem_init={0x0009: 0x0020}, memDepth=1024, useRegisteredRead=True)
+    rtlil.convert(core, ports=core.ports())
+
+@pytest.mark.parametrize("wrapper", [
+    {},
+    {"burst": True},
+    {"pipelined": True},
+    {"burst": True, "harvard": True},
+    {"burst": True, "registered": True},
+    {"burst": True, "icacheSize": 64, "dcacheSize": 64, "writeBuffer": 4},
+    {"burst": True, "icacheSize": 64, "dcacheSize": 64, "writeBuffer": 4, "harvard": True, "registered": True},
+])
+def test_wishbone_wrapper_converts(wrapper):
+    pytest.importorskip("amaranth_soc")
+    from include.wishbone import SISCFWishboneWrapper
+    rtlil.convert(SISCFWishboneWrapper(Core(useResetVector=False, startAddr=0), **wrapper))
@@ -0,0 +1,87 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import pytest
+from amaranth.sim import Simulator
+from main import Core
+from assembler import assemble
+from benchmark import matmul_source
+from include.cosim import LockstepCoSim, random_program
+from include.enums import PACKED_OPS
+from include.isasim import ISASimulator
+from instructions.MAC import TILE
+
+CONFIGS = {
+    "base": {},
+    "pipeline": {"usePipeline": True},
+    "dual-port": {"useDualPort": True},
+}
+
+HASH_SOURCE = """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 0xFFFFFFFF
+        HSET ra
+        LDX_ABS buf
+        LDB_ABS 8
+        CRC32S rb
+        HGET ra
+        FNV1A ra
+        LDX_ABS buf
+        FNV1AS rb
+        MURMUR rx
+        LDX_ABS buf
+        MURMURS rb
+        CRC32 rb
+        HGET rb
+        STB res
+        HALT
+buf:    .word 0, 1, 0x80000000, 0xFFFFFFFF, 0x12345678, 0xDEADBEEF, 0x00FF00FF, 7
+res:    .word 0
+"""
+
+EDGE = [0, 0xFFFFFFFF, 0x80808080, 0x7F7F7F7F, 0x01010101, 0xFF00FF00, 0x00FF00FF, 0x8000FFFF, 0x7FFF0001, 0x12345678]
+
+def _packed_source() -> str:
+    """
+    Every packed op on pairs of edge values, ra, rb and rx in turn as operands.
+    """
+    code = []
+    registers = ["ra", "rb", "rx"]
+    for i, op in enumerate(PACKED_OPS):
+        dst, src = registers[i % 3], registers[(i + 1) % 3]
+        code += [f"LD{dst[1].upper()}_ABS {EDGE[i % len(EDGE)]}", f"LD{src[1].upper()}_ABS {EDGE[(3 * i + 1) % len(EDGE)]}",
+                 f"{op.name} {dst}, {src}", f"ST{dst[1].upper()} out+{i}"]
+    return "\n".join([".org 0x9", ".word start", ".org 0x20", "start:"] + code + ["HALT",
+        f"out: .word {', '.join(['0'] * len(PACKED_OPS))}"]) + "\n"
+
+# Seeds whose forward jumps skip the least of the program
+PROGRAMS = {
+    "random-38": lambda: random_program(38, 300),
+    "random-57": lambda: random_program(57, 300),
+    "hash": lambda: assemble(HASH_SOURCE),
+    "dot": lambda: assemble(matmul_source("dot", TILE)),
+    "tile": lambda: assemble(matmul_source("tile", 2 * TILE)),
+    "packed": lambda: assemble(_packed_source()),
+}
+
+@pytest.mark.parametrize("config", CONFIGS)
+@pytest.mark.parametrize("program", PROGRAMS)
+def test_core_matches_model(program, config):
+    image = PROGRAMS[program]()
+    core = Core(useMemory=True, mem_init=image, **CONFIGS[config])
+    model = ISASimulator(mem_init=image, **CONFIGS[config])
+    cosim = LockstepCoSim(core, model)
+
+    sim = Simulator(core)
+    sim.add_clock(1e-6)
+    sim.add_testbench(cosim.testbench)
+    sim.run()
+    assert model.halted
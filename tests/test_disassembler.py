@@ -0,0 +1,74 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import pytest
+from amaranth import Module
+from amaranth.sim import Simulator
+from main import Core
+from assembler import assemble
+from benchmark import brighten_source, matmul_source
+from disassembler import listing, trace_retire
+from include.isasim import ISASimulator
+
+# Register fields, operands equal to the NOP opcode, padded words and a gap
+SOURCE = """
+        .org 0x9
+        .word start
+        .org 0x20
+start:  LDA_ABS 1
+        LDB_ABS 7
+        ADD ra, rb
+        XOR rx, rx
+        AND_ABS rb, 1
+        STA res
+        MOV 1, 0xFFFFFF02
+        PUSHA
+        POPB
+        JMP end
+        .org 0x100
+end:    HALT
+res:    .word 0, 0xFFFFFFFF, 1
+"""
+
+@pytest.mark.parametrize("source", [SOURCE, matmul_source("tile"), brighten_source(False)])
+def test_listing_assembles_back(source):
+    image = assemble(source)
+    again = assemble("\n".join(listing(image)))
+    assert dict(again.items()) == dict(image.items())
+
+def test_trace_retire(tmp_path):
+    image = assemble(SOURCE)
+    m = Module()
+    m.submodules.core = core = Core(useMemory=True, mem_init=image)
+
+    async def testbench(ctx):
+        for _ in range(200):
+            await ctx.tick()
+
+    sim = Simulator(m)
+    sim.add_clock(1e-6)
+    sim.add_testbench(testbench)
+    path = tmp_path / "core.vcd"
+    with sim.write_vcd(str(path), traces=core.ports()):
+        sim.run()
+
+    model = ISASimulator(mem_init=image)
+    expected = []
+    while not model.halted:
+        addr, word = model.ip, model.read(model.ip)
+        model.step()
+        expected.append((addr, word, model.cycles))
+
+    # The core keeps retiring HALT until the simulation stops
+    retired = list(trace_retire(str(path)))[:len(expected)]
+    assert [(addr, word) for _, _, addr, word in retired] == [(addr, word) for addr, word, _ in expected]
+    assert all(fetch <= cycle for fetch, cycle, _, _ in retired)
+    # Retire cycles are counted from the first clock edge, the model from reset
+    offset = retired[0][1] - expected[0][2]
+    assert [cycle - offset for _, cycle, _, _ in retired] == [cycles for _, _, cycles in expected]
@@ -0,0 +1,101 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import pytest
+from amaranth.sim import Simulator
+from main import Core
+from include.instruction import instruction_names
+from instructions import load_modules
+
+load_modules()
+
+MEM_DEPTH = 1024
+DATA = 0x100
+
+# Cycle counts, fetch included, with one read port and with useDualPort
+INSTRUCTIONS = [
+    ("LDA", [DATA], 4, 3),
+    ("LDA_ABS", [0x1234], 3, 2),
+    ("ADDA", [DATA + 1], 4, 3),
+    ("STA", [DATA + 2], 4, 3),
+    ("MOV", [DATA, DATA + 3], 7, 5),
+    ("PUSH", [DATA + 1], 5, 4),
+    ("POP", [DATA + 4], 5, 4),
+]
+
+SUBROUTINE_TEST_MEM = {
+    0x00004000: 0x00000030, #ADDA_ABS
+    0x00004001: 0x00000010,
+    0x00004002: 0x0000003A, #DECB
+    0x00004004: 0x000000B5, #RET
+
+    0x00000009: 0x00000020, #Reset Vector
+    0x00000020: 0x00000020, #LDA_ABS
+    0x00000021: 0xFFFFFFFF,
+    0x00000022: 0x000000A1, #PUSHA
+    0x00000023: 0x00000021, #LDB_ABS
+    0x00000024: 0x00000011,
+    0x00000025: 0x000000A2, #PUSHB
+    0x00000026: 0x000000A5, #VISIT
+    0x00000027: 0x00004000,
+    0x00000028: 0x000000B2, #POPA
+    0x00000029: 0x000000B1, #POPB
+    0x0000002A: 0x00000039, #DECA
+    0x0000002B: 0x00000037, #INCB
+    0x0000002C: 0x00000000  #HALT
+}
+
+def _program(name: str, operands: list) -> dict:
+    """
+    NOP, the instruction under test and HALT from 0x20. HALT fills the words
+    after the operands, wherever the instruction leaves ip.
+    """
+    mem = {0x0009: 0x0020, 0x0020: instruction_names["NOP"].opcode, DATA: 5, DATA + 1: 7}
+    words = [instruction_names[name].opcode] + operands
+    words += [instruction_names["HALT"].opcode] * 4
+    for offset, word in enumerate(words):
+        mem[0x0021 + offset] = word
+    return mem
+
+def _retire_cycles(mem: dict, useDualPort: bool, memDepth: int = MEM_DEPTH) -> list:
+    """
+    Cycle at which each instruction retires, counted from reset, up to HALT.
+    """
+    core = Core(useMemory=True, mem_init=mem, memDepth=memDepth, useDualPort=useDualPort)
+    retired = []
+
+    async def testbench(ctx):
+        cycle = 0
+        while cycle < 1000:
+            retire = ctx.get(core.reset_state) == 2 and ctx.get(core.end_instr_flag)
+            halt = retire and ctx.get(core.opcode) == instruction_names["HALT"].opcode
+            await ctx.tick()
+            cycle += 1
+            if retire:
+                retired.append(cycle)
+                if halt:
+                    return
+
+    sim = Simulator(core)
+    sim.add_clock(1e-6)
+    sim.add_testbench(testbench)
+    sim.run()
+    return retired
+
+@pytest.mark.parametrize("name, operands, single, dual", INSTRUCTIONS)
+def test_instruction_cycles(name, operands, single, dual):
+    mem = _program(name, operands)
+    for useDualPort, expected in ((False, single), (True, dual)):
+        retired = _retire_cycles(mem, useDualPort)
+        assert len(retired) == 3
+        assert retired[1] - retired[0] == expected, f"{name} useDualPort={useDualPort}"
+
+def test_subroutine_program_cycles():
+    assert _retire_cycles(SUBROUTINE_TEST_MEM, False, 2**15)[-1] == 41
+    assert _retire_cycles(SUBROUTINE_TEST_MEM, True, 2**15)[-1] == 37
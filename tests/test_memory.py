@@ -0,0 +1,60 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+import struct
+from include.memory import MemoryImage, load_elf, load_ihex, _ihex_record
+
+def _elf(segments) -> bytes:
+    """
+    Minimal little-endian ELF32 with one PT_LOAD per (paddr, data, memsz).
+    """
+    phoff = 0x34
+    offset = phoff + 0x20 * len(segments)
+    header = b"\x7fELF" + bytes([1, 1, 1]) + bytes(9)
+    header += struct.pack("<HHIIIIIHHHHHH", 2, 0, 1, 0, phoff, 0, 0, 0x34, 0x20, len(segments), 0, 0, 0)
+    table = b""
+    body = b""
+    for paddr, data, memsz in segments:
+        table += struct.pack("<8I", 1, offset + len(body), paddr, paddr, len(data), memsz, 7, 4)
+        body += data
+    return header + table + body
+
+def test_elf_bss_keeps_file_bytes(tmp_path):
+    path = tmp_path / "image.elf"
+    path.write_bytes(_elf([(0x100, bytes([1, 2, 3, 4, 5, 6]), 12)]))
+    image = load_elf(str(path))
+    assert image[0x40] == 0x04030201
+    assert image[0x41] == 0x00000605
+    assert image[0x42] == 0x00000000
+    assert image[0x43] == image.fill
+
+def test_elf_segments_sharing_a_word(tmp_path):
+    path = tmp_path / "image.elf"
+    path.write_bytes(_elf([(0x101, bytes([0xAA]), 1), (0x103, bytes([0xBB]), 1)]))
+    image = load_elf(str(path), fill=0)
+    assert image[0x40] == 0xBB00AA00
+
+def test_ihex_records_sharing_a_word(tmp_path):
+    path = tmp_path / "image.hex"
+    records = [
+        _ihex_record(0x00, 0x100, bytes([0x11, 0x22])),
+        _ihex_record(0x00, 0x103, bytes([0x44, 0x55])),
+        _ihex_record(0x00, 0x102, bytes([0x33])),
+        _ihex_record(0x01, 0, b""),
+    ]
+    path.write_text("\n".join(records) + "\n")
+    image = load_ihex(str(path))
+    assert image[0x40] == 0x44332211
+    assert image[0x41] == 0xFFFFFF55
+
+def test_init_words_stop_at_last_used_word():
+    image = MemoryImage({0x0009: 0x20, 0x0800: 1, 0x0801: 0}, fill=0, depth=2**18)
+    assert list(image.init_words()) == [image[addr] for addr in range(0x0801)]
+    assert len(MemoryImage({0x10: 1}, depth=1024).init_words()) == 1024
+    assert len(MemoryImage(fill=0, depth=1024).init_words()) == 0
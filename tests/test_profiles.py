@@ -0,0 +1,25 @@
+# SISC-F 32-bit CPU
+# Copyright (c) 2026 Francesco Angeloni
+#
+# This source describes Open Hardware and is licensed under the CERN-OHL-W v2.
+# You may redistribute and modify this source and make products using it
+# under the terms of the CERN-OHL-W v2 (https://cern.ch/cern-ohl).
+#
+# SPDX-License-Identifier: CERN-OHL-W-2.0
+
+from instructions import MANIFEST, PROFILES, isa_subset, module_instructions
+
+def _names(isa) -> set:
+    return {inst.name for inst in isa_subset(isa).values()}
+
+def test_profiles_only_hold_their_modules():
+    minimal, stack, full = _names("minimal"), _names("stack"), _names("full")
+    assert minimal < stack < full
+    assert {"PUSHA", "POPB", "VISIT", "RET"} <= stack - minimal
+    for module in ("LOGIC", "HASH", "PACKED", "MOV", "MAC"):
+        assert not set(module_instructions[module]) & stack, module
+    assert set(PROFILES["full"]) == set(MANIFEST)
+
+def test_profile_order_follows_manifest():
+    order = [name for module in MANIFEST for name in module_instructions[module]]
+    assert [inst.name for inst in isa_subset("full").values()] == order